@@ -5,581 +5,970 @@ Proyecto Final - Análisis y Diseño de Algoritmos
 """
 
 from __future__ import annotations
+import heapq
 import math
+from bisect import bisect_left, bisect_right
 import random
-from typing import List, Tuple, Optional
-import tkinter as tk
-from tkinter import ttk, messagebox
+import sys
+from array import array
+from typing import Dict, Iterator, List, Tuple, Optional
 
 
 # CLASES BÁSICAS
 
 class Aeronave:
-    """Representa una aeronave con coordenadas (x, y) en el espacio aéreo"""
-    def __init__(self, x: float, y: float):
+    """Representa una aeronave con coordenadas (x, y), velocidad (vx, vy) y altitud z opcionales"""
+    def __init__(self, x: float, y: float, vx: float = 0.0, vy: float = 0.0, z: float = 0.0):
         self.x = x
         self.y = y
+        self.vx = vx
+        self.vy = vy
+        self.z = z
     
     def __repr__(self):
+        if self.z:
+            return f"({self.x:.1f}, {self.y:.1f}, {self.z:.0f})"
         return f"({self.x:.1f}, {self.y:.1f})"
 
 def distancia(a1: Aeronave, a2: Aeronave) -> float:
     """Calcula la distancia euclidiana entre dos aeronaves"""
     return math.hypot(a1.x - a2.x, a1.y - a2.y)
 
+def es_flota(objeto) -> bool:
+    """Indica si objeto es una Flota, sin importar NumPy si nadie lo ha hecho aún"""
+    flota = sys.modules.get("flota")
+    return flota is not None and isinstance(objeto, flota.Flota)
+
+# CONJUNTO DE CONFLICTOS
+
+
+class ConjuntoConflictos:
+    """Pares en conflicto guardados como índices y distancias en arreglos tipados
+
+    i[k], j[k] son posiciones en la lista aeronaves y d[k] su distancia,
+    calculada una sola vez durante la detección. Con motor="auto", plan
+    guarda el PlanDeteccion con el motor elegido.
+    """
+
+    def __init__(self, aeronaves):
+        self.aeronaves = aeronaves
+        self.i = array("q")
+        self.j = array("q")
+        self.d = array("d")
+        self._orden = None
+        self.plan = None
+
+    def agregar(self, i: int, j: int, d: float):
+        """Registra el par (i, j) con distancia d"""
+        self.i.append(i)
+        self.j.append(j)
+        self.d.append(d)
+        self._orden = None
+
+    def extender(self, i_s, j_s, d_s):
+        """Agrega un bloque de pares (tres secuencias paralelas)"""
+        self.i.extend(i_s)
+        self.j.extend(j_s)
+        self.d.extend(d_s)
+        self._orden = None
+
+    def __len__(self):
+        return len(self.d)
+
+    def __bool__(self):
+        return len(self.d) > 0
+
+    def __iter__(self):
+        """Recorre (a, b, distancia) en el orden de detección"""
+        aeronaves = self.aeronaves
+        for i, j, d in zip(self.i, self.j, self.d):
+            yield aeronaves[i], aeronaves[j], d
+
+    def __repr__(self):
+        return f"ConjuntoConflictos(k={len(self)})"
+
+    def _terna(self, k: int) -> Tuple[Aeronave, Aeronave, float]:
+        return self.aeronaves[self.i[k]], self.aeronaves[self.j[k]], self.d[k]
+
+    def pares(self) -> List[Tuple[Aeronave, Aeronave]]:
+        """Lista de tuplas (Aeronave, Aeronave) en el orden de detección"""
+        aeronaves = self.aeronaves
+        return [(aeronaves[i], aeronaves[j]) for i, j in zip(self.i, self.j)]
+
+    def minimo(self) -> Optional[Tuple[Aeronave, Aeronave, float]]:
+        """Par más cercano en O(k), sin ordenar"""
+        if not self.d:
+            return None
+        return self._terna(min(range(len(self.d)), key=self.d.__getitem__))
+
+    def mas_cercanos(self, t: int) -> List[Tuple[Aeronave, Aeronave, float]]:
+        """Los t pares más cercanos, de menor a mayor distancia"""
+        if self._orden is not None:
+            return [self._terna(k) for k in self._orden[:t]]
+        return [self._terna(k) for k in heapq.nsmallest(t, range(len(self.d)), key=self.d.__getitem__)]
+
+    def filtrar(self, umbral: float) -> ConjuntoConflictos:
+        """Nuevo conjunto con los pares de distancia <= umbral"""
+        filtrado = ConjuntoConflictos(self.aeronaves)
+        for i, j, d in zip(self.i, self.j, self.d):
+            if d <= umbral:
+                filtrado.i.append(i)
+                filtrado.j.append(j)
+                filtrado.d.append(d)
+        return filtrado
+
+    def ordenados(self):
+        """Recorre (a, b, distancia) de menor a mayor distancia"""
+        if self._orden is None:
+            self._orden = sorted(range(len(self.d)), key=self.d.__getitem__)
+        for k in self._orden:
+            yield self._terna(k)
+
+    def pagina(self, inicio: int, cantidad: int) -> List[Tuple[Aeronave, Aeronave, float]]:
+        """Los pares de las posiciones [inicio, inicio + cantidad) del orden por distancia"""
+        if self._orden is None:
+            self._orden = sorted(range(len(self.d)), key=self.d.__getitem__)
+        return [self._terna(k) for k in self._orden[inicio:inicio + cantidad]]
+
 # ALGORITMO DIVIDE Y VENCER
 
 
-def encontrar_pares_cercanos(aeronaves, umbral):
-    # PRE: Asignar ID único a cada aeronave
-    for i, a in enumerate(aeronaves):
-        a.id = i
-    
-    def dividir_y_vencer(puntos_x, puntos_y):
-        n = len(puntos_x)
-        
-        if n <= 3:
-            pares = []
-            for i in range(n):
-                for j in range(i + 1, n):
-                    if distancia(puntos_x[i], puntos_x[j]) <= umbral:
-                        pares.append((puntos_x[i], puntos_x[j]))
-            return pares
-        
-        mitad = n // 2
-        punto_medio = puntos_x[mitad]
-        
-        # CORRECCIÓN: Distribuir puntos correctamente
-        puntos_izq_x = puntos_x[:mitad]
-        puntos_der_x = puntos_x[mitad:]
-        
-        puntos_izq_y = []
-        puntos_der_y = []
-        for p in puntos_y:
-            if p.x < punto_medio.x:
-                puntos_izq_y.append(p)
-            elif p.x > punto_medio.x:
-                puntos_der_y.append(p)
-            else:
-                # Misma x: usar ID para distribuir
-                if p.id < punto_medio.id:
-                    puntos_izq_y.append(p)
-                else:
-                    puntos_der_y.append(p)
-        
-        # Recursión
-        pares_izq = dividir_y_vencer(puntos_izq_x, puntos_izq_y)
-        pares_der = dividir_y_vencer(puntos_der_x, puntos_der_y)
-        pares_totales = pares_izq + pares_der
-        
-        # MEJORA: Limitar comparaciones en banda
-        banda = [p for p in puntos_y if abs(p.x - punto_medio.x) < umbral]
-        
-        # Solo comparar puntos cercanos en Y
-        for i in range(len(banda)):
-            # Solo comparar con los siguientes 7 puntos (optimización)
-            for j in range(i + 1, min(i + 8, len(banda))):
-                if banda[j].y - banda[i].y > umbral:
-                    break
-                
-                if distancia(banda[i], banda[j]) <= umbral:
-                    pares_totales.append((banda[i], banda[j]))
-        
-        return pares_totales
-    
-    # Ordenar con desempate
-    puntos_x = sorted(aeronaves, key=lambda a: (a.x, a.y, a.id))
-    puntos_y = sorted(aeronaves, key=lambda a: (a.y, a.x, a.id))
-    
-    return dividir_y_vencer(puntos_x, puntos_y)
+def encontrar_pares_cercanos(aeronaves, umbral, motor: str = "auto",
+                             separacion_vertical: Optional[float] = None, estadisticas=None):
+    """Encuentra los pares de aeronaves con distancia <= umbral.
 
-def encontrar_par_mas_cercano(pares_cercanos: List[Tuple[Aeronave, Aeronave]]) -> Optional[Tuple[Aeronave, Aeronave]]:
-    """Encuentra el par con menor distancia entre todos los pares cercanos"""
-    if not pares_cercanos:
-        return None
-    
-    # Ordenar por distancia ascendente
-    pares_ordenados = sorted(pares_cercanos, key=lambda p: distancia(p[0], p[1]))
-    return pares_ordenados[0]  # El primero es el más cercano
+    motor selecciona el algoritmo:
+      - "auto": el planificador estima la densidad y los pares esperados con
+        una muestra y elige el motor exacto más rápido (ver planificar)
+      - "divide_y_vencer": recursión clásica sobre los puntos ordenados
+      - "rejilla": hash espacial uniforme, O(n + k) y exhaustivo
+      - "barrido": línea de barrido con conjunto activo ordenado, exhaustivo
+      - "fuerza_bruta": todos contra todos, para n muy pequeño
+      - "paralelo": Divide y Vencer repartido entre procesos (mismo resultado)
+      - "iterativo": Divide y Vencer sin recursión, búferes preasignados y exhaustivo
+      - "sectores": teselas con halo resueltas por nodos trabajadores (mismo resultado que la rejilla)
 
-# GENERACIÓN DE DATOS
+    Con separacion_vertical, un par solo está en conflicto si además
+    |z_a - z_b| <= separacion_vertical (umbral es el radio horizontal). El
+    único motor con altitud es la rejilla 3D por niveles de vuelo: se usa
+    con "rejilla" o con "auto" (que lo deja en plan, como "rejilla_3d"); los
+    demás motores lanzan ValueError.
 
+    Con estadisticas (un instrumentacion.EstadisticasDeteccion) el Divide y
+    Vencer se ejecuta instrumentado y deja allí contadores y tiempos; solo
+    con motor="divide_y_vencer" explícito, porque "auto" casi nunca lo elige.
 
-def generar_aeronaves(n: int) -> List[Aeronave]:
-    """Genera n aeronaves en posiciones aleatorias (0-100 en ambos ejes)"""
-    return [Aeronave(random.uniform(0, 100), random.uniform(0, 100)) 
-            for _ in range(n)]
+    Si aeronaves es una Flota se usa el Divide y Vencer vectorizado y se
+    devuelve un arreglo (k, 2) de posiciones en lugar de tuplas de Aeronave.
+    """
+    if es_flota(aeronaves):
+        if motor not in ("auto", "divide_y_vencer") or separacion_vertical is not None:
+            raise ValueError(f"Motor no disponible para Flota: {motor}")
+        from flota import pares_cercanos_flota
+        return pares_cercanos_flota(aeronaves, umbral)
+    return encontrar_conflictos(aeronaves, umbral, motor, separacion_vertical, estadisticas).pares()
 
-# INTERFAZ GRÁFICA
+def encontrar_conflictos(aeronaves: List[Aeronave], umbral: float,
+                         motor: str = "auto",
+                         separacion_vertical: Optional[float] = None,
+                         estadisticas=None) -> ConjuntoConflictos:
+    """Igual que encontrar_pares_cercanos, pero devuelve un ConjuntoConflictos"""
+    if estadisticas is not None:
+        # La instrumentación es del Divide y Vencer: se pide explícitamente, para
+        # no describir un motor distinto del que elegiría el planificador
+        if motor != "divide_y_vencer" or separacion_vertical is not None:
+            raise ValueError(f"Instrumentación no disponible para el motor: {motor}")
+        from instrumentacion import conflictos_instrumentados
+        return conflictos_instrumentados(aeronaves, umbral, estadisticas)
+    if separacion_vertical is not None:
+        if motor not in ("auto", "rejilla"):
+            raise ValueError(f"Motor sin soporte de altitud: {motor}")
+        conjunto = conflictos_por_rejilla_3d(aeronaves, umbral, separacion_vertical)
+        if motor == "auto":
+            conjunto.plan = PlanDeteccion("rejilla_3d", len(aeronaves), umbral, 0, len(conjunto), {})
+        return conjunto
+    if motor == "auto":
+        plan = planificar(aeronaves, umbral)
+        conjunto = encontrar_conflictos(aeronaves, umbral, plan.motor)
+        conjunto.plan = plan
+        return conjunto
+    if motor == "divide_y_vencer":
+        return conflictos_dividir_y_vencer(aeronaves, umbral)
+    if motor == "rejilla":
+        return conflictos_por_rejilla(aeronaves, umbral)
+    if motor == "barrido":
+        return conflictos_por_barrido(aeronaves, umbral)
+    if motor == "fuerza_bruta":
+        return conflictos_fuerza_bruta(aeronaves, umbral)
+    if motor == "iterativo":
+        return conflictos_iterativo(aeronaves, umbral)
+    if motor == "paralelo":
+        from paralelo import conflictos_paralelo
+        return conflictos_paralelo(aeronaves, umbral)
+    if motor == "sectores":
+        from sectores import conflictos_por_sectores
+        return conflictos_por_sectores(aeronaves, umbral)
+    raise ValueError(f"Motor desconocido: {motor}")
 
+def conflictos_dividir_y_vencer(aeronaves: List[Aeronave], umbral: float) -> ConjuntoConflictos:
+    """Divide y Vencer sobre índices: no modifica las aeronaves del llamador"""
+    xs = [a.x for a in aeronaves]
+    ys = [a.y for a in aeronaves]
+    conjunto = ConjuntoConflictos(aeronaves)
+    puntos_x, puntos_y = ordenar_indices(xs, ys)
+    dividir_y_vencer(xs, ys, umbral, puntos_x, puntos_y, conjunto.agregar)
+    return conjunto
 
-class SistemaControlAereo:
-    """Interfaz gráfica del sistema de control aéreo"""
-    
-    def __init__(self, ventana):
-        self.ventana = ventana
-        self.ventana.title("✈️ Sistema de Control Aéreo - Divide y Vencer")
-        self.ventana.geometry("950x700")
-        
-        # Datos
-        self.aeronaves = []
-        self.pares_cercanos = []
-        self.par_mas_cercano = None
-        
-        # Configuración visual
-        self.ancho_canvas = 750
-        self.alto_canvas = 550
-        self.margen = 60
-        
-        # Crear interfaz
-        self.crear_interfaz()
-    
-    def crear_interfaz(self):
-        """Crea todos los componentes de la interfaz"""
-        
-        # Frame principal
-        main_frame = ttk.Frame(self.ventana, padding="10")
-        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        
-        # Configurar expansión
-        self.ventana.columnconfigure(0, weight=1)
-        self.ventana.rowconfigure(0, weight=1)
-        main_frame.columnconfigure(1, weight=1)
-        main_frame.rowconfigure(0, weight=1)
-        
-        # Título
-        titulo = ttk.Label(
-            main_frame,
-            text="ALGORITMO DIVIDE Y VENCER - DETECCIÓN DE COLISIONES",
-            font=("Arial", 16, "bold"),
-            foreground="darkblue"
-        )
-        titulo.grid(row=0, column=0, columnspan=2, pady=(0, 20))
-        
-        # PANEL DE CONTROL 
-        control_frame = ttk.LabelFrame(main_frame, text="CONTROLES", padding="15")
-        control_frame.grid(row=1, column=0, sticky=(tk.N, tk.S, tk.W), padx=(0, 15))
-        
-        # Número de aeronaves
-        ttk.Label(control_frame, text="Número de aeronaves:", 
-                 font=("Arial", 10)).grid(row=0, column=0, sticky=tk.W, pady=8)
-        
-        self.var_n = tk.StringVar(value="30")
-        ttk.Entry(control_frame, textvariable=self.var_n, width=12).grid(row=0, column=1, pady=8)
-        
-        # Separador
-        ttk.Separator(control_frame, orient="horizontal").grid(row=1, column=0, columnspan=2, pady=15, sticky=(tk.W, tk.E))
-        
-        # Umbral
-        ttk.Label(control_frame, text="Umbral de distancia:", 
-                 font=("Arial", 10)).grid(row=2, column=0, sticky=tk.W, pady=8)
-        
-        self.var_umbral = tk.StringVar(value="20.0")
-        ttk.Entry(control_frame, textvariable=self.var_umbral, width=12).grid(row=2, column=1, pady=8)
-        
-        ttk.Label(control_frame, text="Distancias ≤ este valor\nse consideran riesgosas",
-                 font=("Arial", 8), foreground="gray").grid(row=3, column=0, columnspan=2, pady=5)
-        
-        # Separador
-        ttk.Separator(control_frame, orient="horizontal").grid(row=4, column=0, columnspan=2, pady=20, sticky=(tk.W, tk.E))
-        
-        # Botones
-        btn_frame = ttk.Frame(control_frame)
-        btn_frame.grid(row=5, column=0, columnspan=2, pady=10)
-        
-        ttk.Button(btn_frame, text="Generar", 
-                  command=self.generar_aeronaves, width=15).grid(row=0, column=0, pady=5)
-        
-        ttk.Button(btn_frame, text=" Analizar", 
-                  command=self.analizar, width=15).grid(row=1, column=0, pady=5)
-        
-        ttk.Button(btn_frame, text=" Limpiar", 
-                  command=self.limpiar, width=15).grid(row=2, column=0, pady=5)
-        
-        # PANEL DE RESULTADOS 
-        resultados_frame = ttk.LabelFrame(control_frame, text="RESULTADOS", padding="10")
-        resultados_frame.grid(row=6, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(20, 0))
-        
-        # Texto de resultados
-        self.texto_resultados = tk.Text(
-            resultados_frame,
-            height=18,
-            width=35,
-            font=("Consolas", 9),
-            wrap=tk.WORD,
-            bg="#f8f9fa"
-        )
-        
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(resultados_frame, orient="vertical", command=self.texto_resultados.yview)
-        self.texto_resultados.configure(yscrollcommand=scrollbar.set)
-        
-        self.texto_resultados.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
-        
-        # Configurar expansión
-        resultados_frame.columnconfigure(0, weight=1)
-        resultados_frame.rowconfigure(0, weight=1)
-        control_frame.rowconfigure(6, weight=1)
-        
-        # CANVAS DE VISUALIZACIÓN 
-        canvas_frame = ttk.LabelFrame(main_frame, text="VISUALIZACIÓN", padding="10")
-        canvas_frame.grid(row=1, column=1, sticky=(tk.N, tk.S, tk.E, tk.W))
-        
-        # Configurar expansión
-        canvas_frame.columnconfigure(0, weight=1)
-        canvas_frame.rowconfigure(0, weight=1)
-        main_frame.columnconfigure(1, weight=1)
-        main_frame.rowconfigure(1, weight=1)
-        
-        # Canvas
-        self.canvas = tk.Canvas(
-            canvas_frame,
-            width=self.ancho_canvas,
-            height=self.alto_canvas,
-            bg="white",
-            relief=tk.SUNKEN,
-            bd=2
-        )
-        self.canvas.grid(row=0, column=0, sticky=(tk.N, tk.S, tk.E, tk.W))
-        
-        # LEYENDA 
-        leyenda_frame = ttk.Frame(main_frame)
-        leyenda_frame.grid(row=2, column=0, columnspan=2, pady=(15, 0))
-        
-        # Elementos de leyenda
-        ttk.Label(leyenda_frame, text="●", font=("Arial", 14), 
-                 foreground="blue").grid(row=0, column=0, padx=5)
-        ttk.Label(leyenda_frame, text="Aeronave", 
-                 font=("Arial", 9)).grid(row=0, column=1, padx=10)
-        
-        ttk.Label(leyenda_frame, text="●", font=("Arial", 14), 
-                 foreground="red").grid(row=0, column=2, padx=5)
-        ttk.Label(leyenda_frame, text="Aeronave en riesgo", 
-                 font=("Arial", 9)).grid(row=0, column=3, padx=10)
-        
-        ttk.Label(leyenda_frame, text="――", font=("Arial", 14), 
-                 foreground="red").grid(row=0, column=4, padx=5)
-        ttk.Label(leyenda_frame, text="Riesgo de colisión", 
-                 font=("Arial", 9)).grid(row=0, column=5, padx=10)
-        
-        ttk.Label(leyenda_frame, text="━━━", font=("Arial", 14), 
-                 foreground="green").grid(row=0, column=6, padx=5)
-        ttk.Label(leyenda_frame, text="Par más cercano", 
-                 font=("Arial", 9)).grid(row=0, column=7, padx=10)
-        
-        # Información del algoritmo
-        ttk.Label(main_frame, 
-                 text="Algoritmo: Divide y Vencerás puro | Complejidad: O(n log n)",
-                 font=("Arial", 9, "italic"),
-                 foreground="gray").grid(row=3, column=0, columnspan=2, pady=(10, 0))
-        
-        # Dibujar mensaje inicial
-        self.dibujar_mensaje_inicial()
+def ordenar_indices(xs, ys) -> Tuple[List[int], List[int]]:
+    """Índices ordenados por x y por y, con desempate"""
+    indices = range(len(xs))
+    puntos_x = sorted(indices, key=lambda i: (xs[i], ys[i], i))
+    puntos_y = sorted(indices, key=lambda i: (ys[i], xs[i], i))
+    return puntos_x, puntos_y
+
+def dividir_y_vencer(xs, ys, umbral, puntos_x, puntos_y, agregar):
+    """Recursión Divide y Vencer sobre listas de índices; agregar(i, j, d) recibe cada par"""
+    n = len(puntos_x)
     
-    def dibujar_mensaje_inicial(self):
-        """Dibuja mensaje de bienvenida en el canvas"""
-        self.canvas.delete("all")
-        
-        # Fondo
-        self.canvas.create_rectangle(0, 0, self.ancho_canvas, self.alto_canvas, 
-                                    fill="#f0f8ff", outline="")
-        
-        # Título
-        self.canvas.create_text(self.ancho_canvas/2, self.alto_canvas/2 - 50,
-                               text="SISTEMA DE CONTROL AÉREO",
-                               font=("Arial", 20, "bold"),
-                               fill="navy")
-        
-        # Subtítulo
-        self.canvas.create_text(self.ancho_canvas/2, self.alto_canvas/2 - 15,
-                               text="Algoritmo Divide y Vencer",
-                               font=("Arial", 14),
-                               fill="darkblue")
-        
-        # Instrucciones
-        instrucciones = [
-            "1. Ingrese el número de aeronaves",
-            "2. Establezca el umbral de distancia",
-            "3. Haga clic en 'Generar'",
-            "4. Luego en 'Analizar'",
-            "",
-            "El par más cercano se mostrará",
-            "con línea verde gruesa",
-            "y las demás con líneas rojas."
-        ]
-        
-        y = self.alto_canvas/2 + 30
-        for linea in instrucciones:
-            self.canvas.create_text(self.ancho_canvas/2, y,
-                                   text=linea,
-                                   font=("Arial", 10),
-                                   fill="gray")
-            y += 25
+    if n <= 3:
+        caso_base(xs, ys, umbral, puntos_x, agregar)
+        return
     
-    def convertir_coordenadas(self, punto: Aeronave) -> tuple:
-        """Convierte coordenadas (0-100) a píxeles del canvas"""
-        x_pixel = self.margen + (punto.x / 100) * (self.ancho_canvas - 2 * self.margen)
-        y_pixel = self.alto_canvas - self.margen - (punto.y / 100) * (self.alto_canvas - 2 * self.margen)
-        return x_pixel, y_pixel
+    puntos_izq_x, puntos_der_x, puntos_izq_y, puntos_der_y, x_medio = dividir(xs, puntos_x, puntos_y)
     
-    def generar_aeronaves(self):
-        """Genera nuevas aeronaves aleatorias"""
-        try:
-            n = int(self.var_n.get())
-            
-            if n < 2:
-                messagebox.showerror("Error", "Mínimo 2 aeronaves")
-                return
-            
-            self.aeronaves = generar_aeronaves(n)
-            self.pares_cercanos = []
-            self.par_mas_cercano = None
-            
-            self.mostrar_resultado(f"Aeronaves generadas: {n}\nListo para analizar.")
-            self.dibujar_escena()
-            
-        except ValueError:
-            messagebox.showerror("Error", "Número inválido")
+    # Recursión
+    dividir_y_vencer(xs, ys, umbral, puntos_izq_x, puntos_izq_y, agregar)
+    dividir_y_vencer(xs, ys, umbral, puntos_der_x, puntos_der_y, agregar)
     
-    def analizar(self):
-        """Ejecuta el algoritmo Divide y Vencer"""
-        try:
-            if not self.aeronaves:
-                messagebox.showwarning("Atención", "Primero genere aeronaves")
-                return
-            
-            umbral = float(self.var_umbral.get())
-            
-            if umbral <= 0:
-                messagebox.showerror("Error", "Umbral debe ser > 0")
-                return
-            
-            # EJECUTAR ALGORITMO DIVIDE Y VENCER
-            self.pares_cercanos = encontrar_pares_cercanos(self.aeronaves, umbral)
-            
-            # Encontrar el par más cercano
-            self.par_mas_cercano = encontrar_par_mas_cercano(self.pares_cercanos)
-            
-            # Mostrar resultados
-            self.mostrar_resultados_completos(umbral)
-            
-            # Actualizar visualización
-            self.dibujar_escena()
-            
-        except ValueError:
-            messagebox.showerror("Error", "Umbral inválido")
+    combinar_banda(xs, ys, umbral, puntos_y, x_medio, agregar)
+
+def caso_base(xs, ys, umbral, puntos_x, agregar, contadores=None):
+    """Compara todos los pares de un grupo pequeño
+
+    contadores (un instrumentacion.EstadisticasDeteccion) acumula casos
+    base y evaluaciones de distancia.
+    """
+    n = len(puntos_x)
+    if contadores is not None:
+        contadores.casos_base += 1
+        contadores.evaluaciones_distancia += n * (n - 1) // 2
+    for a in range(n):
+        for b in range(a + 1, n):
+            i, j = puntos_x[a], puntos_x[b]
+            d = math.hypot(xs[i] - xs[j], ys[i] - ys[j])
+            if d <= umbral:
+                agregar(i, j, d)
+
+def dividir(xs, puntos_x, puntos_y):
+    """Parte los índices en mitad izquierda y derecha según la x del punto medio"""
+    mitad = len(puntos_x) // 2
+    medio = puntos_x[mitad]
+    x_medio = xs[medio]
     
-    def mostrar_resultado(self, mensaje: str):
-        """Muestra un mensaje simple"""
-        self.texto_resultados.delete(1.0, tk.END)
-        self.texto_resultados.insert(1.0, mensaje)
+    # CORRECCIÓN: Distribuir puntos correctamente
+    puntos_izq_x = puntos_x[:mitad]
+    puntos_der_x = puntos_x[mitad:]
     
-    def mostrar_resultados_completos(self, umbral: float):
-        """Muestra resultados detallados del análisis"""
-        texto = "=" * 40 + "\n"
-        texto += "   ANÁLISIS COMPLETADO   \n"
-        texto += "=" * 40 + "\n\n"
-        
-        texto += "RESULTADOS\n"
-        texto += "―" * 20 + "\n"
-        texto += f"Aeronaves: {len(self.aeronaves)}\n"
-        texto += f"Umbral: {umbral:.2f}\n"
-        texto += f"Pares cercanos encontrados: {len(self.pares_cercanos)}\n\n"
-        
-        if self.pares_cercanos:
-            if self.par_mas_cercano:
-                a, b = self.par_mas_cercano
-                dist_min = distancia(a, b)
-                texto += "PAR MÁS CERCANO \n"
-                texto += "―" * 20 + "\n"
-                texto += f"A: {a}\n"
-                texto += f"B: {b}\n"
-                texto += f"Distancia: {dist_min:.3f}\n\n"
-            
-            texto += "AERONAVES EN RIESGO \n"
-            texto += "―" * 30 + "\n\n"
-            
-            # Ordenar por distancia
-            pares_ordenados = sorted(self.pares_cercanos, 
-                                   key=lambda p: distancia(p[0], p[1]))
-            
-            for i, (a, b) in enumerate(pares_ordenados, 1):
-                dist = distancia(a, b)
-                
-                # Marcar el par más cercano con un indicador especial
-                if (a, b) == self.par_mas_cercano or (b, a) == self.par_mas_cercano:
-                    texto += f"Par {i} [MÁS CERCANO]:\n"
-                else:
-                    texto += f"Par {i}:\n"
-                
-                texto += f"  • A: {a}\n"
-                texto += f"  • B: {b}\n"
-                texto += f"  • Distancia: {dist:.3f}\n"
-                
-                if i < len(pares_ordenados):
-                    texto += "  ―――――――――――――――――\n"
-            
-            texto += f"\nTotal de conexiones de riesgo: {len(self.pares_cercanos)}\n"
+    puntos_izq_y = []
+    puntos_der_y = []
+    for p in puntos_y:
+        if xs[p] < x_medio:
+            puntos_izq_y.append(p)
+        elif xs[p] > x_medio:
+            puntos_der_y.append(p)
         else:
-            texto += "TODAS LAS AERONAVES ESTÁN SEGURAS\n"
-            texto += "No hay pares con distancia ≤ umbral\n"
-        
-        texto += "\n" + "=" * 40 + "\n"
-        texto += "INFORMACIÓN DEL ALGORITMO\n"
-        texto += "―" * 25 + "\n"
-        texto += "• Técnica: Divide y Vencer\n"
-        texto += "• Complejidad: O(n log n)\n"
-        texto += "• Caso base: n ≤ 3\n"
-        texto += "• Búsqueda en banda: O(n)\n"
-        
-        self.texto_resultados.delete(1.0, tk.END)
-        self.texto_resultados.insert(1.0, texto)
-    
-    def dibujar_escena(self):
-        """Dibuja todas las aeronaves y conexiones"""
-        self.canvas.delete("all")
-        
-        # Dibujar cuadrícula
-        self.dibujar_cuadricula()
-        
-        # Dibujar aeronaves
-        for aeronave in self.aeronaves:
-            x, y = self.convertir_coordenadas(aeronave)
-            
-            # Verificar si esta aeronave está en algún par cercano
-            en_riesgo = any(aeronave in par for par in self.pares_cercanos)
-            
-            if en_riesgo:
-                # Aeronave en riesgo
-                self.canvas.create_oval(x-7, y-7, x+7, y+7,
-                                       fill="#ffcccc", outline="red", width=2)
+            # Misma x: usar el índice para distribuir
+            if p < medio:
+                puntos_izq_y.append(p)
             else:
-                # Aeronave segura
-                self.canvas.create_oval(x-5, y-5, x+5, y+5,
-                                       fill="blue", outline="darkblue", width=1)
-            
-            # Etiqueta para pocas aeronaves
-            if len(self.aeronaves) <= 50:
-                self.canvas.create_text(x, y-12,
-                                       text=f"({aeronave.x:.0f},{aeronave.y:.0f})",
-                                       font=("Arial", 7))
-        
-        # Primero dibujar todas las conexiones rojas (excepto el par más cercano si existe)
-        for a, b in self.pares_cercanos:
-            if self.par_mas_cercano and ((a, b) == self.par_mas_cercano or (b, a) == self.par_mas_cercano):
-                continue  # Saltar el par más cercano para dibujarlo después
-                
-            x1, y1 = self.convertir_coordenadas(a)
-            x2, y2 = self.convertir_coordenadas(b)
-            
-            # Línea roja normal
-            self.canvas.create_line(x1, y1, x2, y2,
-                                   fill="red", width=2)
-            
-            # Distancia en el punto medio
-            mx, my = (x1 + x2) / 2, (y1 + y2) / 2
-            dist = distancia(a, b)
-            
-            self.canvas.create_text(mx, my-10,
-                                   text=f"{dist:.1f}",
-                                   font=("Arial", 8),
-                                   fill="darkred")
-        
-        # Dibujar el par más cercano en verde (si existe)
-        if self.par_mas_cercano:
-            a, b = self.par_mas_cercano
-            x1, y1 = self.convertir_coordenadas(a)
-            x2, y2 = self.convertir_coordenadas(b)
-            
-            # Línea verde gruesa para el par más cercano
-            self.canvas.create_line(x1, y1, x2, y2,
-                                   fill="green", width=4, dash=(5, 2))
-            
-            # Resaltar las aeronaves del par más cercano
-            self.canvas.create_oval(x1-8, y1-8, x1+8, y1+8,
-                                   outline="green", width=3)
-            self.canvas.create_oval(x2-8, y2-8, x2+8, y2+8,
-                                   outline="green", width=3)
-            
-            # Distancia en el punto medio con fondo
-            mx, my = (x1 + x2) / 2, (y1 + y2) / 2
-            dist = distancia(a, b)
-            
-            # Fondo para el texto
-            self.canvas.create_rectangle(mx-25, my-20, mx+25, my+5,
-                                        fill="white", outline="green", width=2)
-            
-            self.canvas.create_text(mx, my-7,
-                                   text=f"{dist:.1f}",
-                                   font=("Arial", 9, "bold"),
-                                   fill="darkgreen")
-            
-            # Etiqueta "MÁS CERCANO"
-            self.canvas.create_text(mx, my+15,
-                                   text="MÁS CERCANO",
-                                   font=("Arial", 8, "bold"),
-                                   fill="darkgreen")
-        
-        # Dibujar ejes
-        self.dibujar_ejes()
+                puntos_der_y.append(p)
     
-    def dibujar_cuadricula(self):
-        """Dibuja cuadrícula de referencia"""
-        # Vertical
-        for i in range(0, 101, 10):
-            x = self.margen + (i / 100) * (self.ancho_canvas - 2 * self.margen)
-            self.canvas.create_line(x, self.margen, x, self.alto_canvas - self.margen,
-                                   fill="#e8e8e8", width=1)
-            
-            if i % 20 == 0:
-                self.canvas.create_text(x, self.alto_canvas - self.margen + 15,
-                                       text=str(i), font=("Arial", 8))
-        
-        # Horizontal
-        for i in range(0, 101, 10):
-            y = self.alto_canvas - self.margen - (i / 100) * (self.alto_canvas - 2 * self.margen)
-            self.canvas.create_line(self.margen, y, self.ancho_canvas - self.margen, y,
-                                   fill="#e8e8e8", width=1)
+    return puntos_izq_x, puntos_der_x, puntos_izq_y, puntos_der_y, x_medio
+
+def combinar_banda(xs, ys, umbral, puntos_y, x_medio, agregar, contadores=None, nivel=0):
+    """Busca pares en la banda de ancho 2·umbral alrededor de x_medio
+
+    contadores (un instrumentacion.EstadisticasDeteccion) registra la banda
+    en el nivel dado, las evaluaciones y los cortes del límite de 7 vecinos.
+    """
+    # MEJORA: Limitar comparaciones en banda
+    banda = [p for p in puntos_y if abs(xs[p] - x_medio) < umbral]
+    
+    # Solo comparar puntos cercanos en Y
+    for a in range(len(banda)):
+        i = banda[a]
+        # Solo comparar con los siguientes 7 puntos (optimización)
+        for b in range(a + 1, min(a + 8, len(banda))):
+            j = banda[b]
+            if ys[j] - ys[i] > umbral:
+                break
             
-            if i % 20 == 0:
-                self.canvas.create_text(self.margen - 15, y,
-                                       text=str(i), font=("Arial", 8))
+            d = math.hypot(xs[i] - xs[j], ys[i] - ys[j])
+            if d <= umbral:
+                agregar(i, j, d)
     
-    def dibujar_ejes(self):
-        """Dibuja ejes X e Y"""
-        # Eje X
-        self.canvas.create_line(self.margen, self.alto_canvas - self.margen,
-                               self.ancho_canvas - self.margen, self.alto_canvas - self.margen,
-                               fill="black", width=2)
-        
-        # Eje Y
-        self.canvas.create_line(self.margen, self.margen,
-                               self.margen, self.alto_canvas - self.margen,
-                               fill="black", width=2)
-        
-        # Etiquetas
-        self.canvas.create_text(self.ancho_canvas - self.margen + 20,
-                               self.alto_canvas - self.margen,
-                               text="X", font=("Arial", 10, "bold"))
-        
-        self.canvas.create_text(self.margen, self.margen - 20,
-                               text="Y", font=("Arial", 10, "bold"))
+    if contadores is not None:
+        # Segunda pasada solo con las comparaciones en y: el bucle de arriba no paga nada
+        contadores.registrar_banda(nivel, len(banda))
+        for a in range(len(banda)):
+            yi = ys[banda[a]]
+            fin = a + 1
+            while fin < min(a + 8, len(banda)) and ys[banda[fin]] - yi <= umbral:
+                fin += 1
+            contadores.evaluaciones_distancia += fin - a - 1
+            # El límite de 7 vecinos cortó el recorrido con candidatos aún dentro del umbral en y
+            if fin == a + 8 < len(banda) and ys[banda[fin]] - yi <= umbral:
+                contadores.cortes_siete += 1
+
+# DIVIDE Y VENCER ITERATIVO (SIN RECURSIÓN)
+
+
+def conflictos_iterativo(aeronaves: List[Aeronave], umbral: float) -> ConjuntoConflictos:
+    """Divide y Vencer con pila explícita y búferes preasignados.
+
+    Revisa la banda solo entre puntos de lados distintos y sin tope de
+    vecinos: devuelve cada par con distancia <= umbral exactamente una vez.
+    Memoria O(n + k) y sin límite de recursión.
+    """
+    conjunto = ConjuntoConflictos(aeronaves)
+    xs = array("d", (a.x for a in aeronaves))
+    ys = array("d", (a.y for a in aeronaves))
+    agregar = conjunto.agregar
+    for i, j, d in recorrer_dividir_y_vencer(xs, ys, lambda: umbral):
+        agregar(i, j, d)
+    return conjunto
+
+def recorrer_dividir_y_vencer(xs, ys, radio, cancelar=None, progreso=None):
+    """Esqueleto iterativo del Divide y Vencer sobre arreglos de coordenadas.
+
+    Los subproblemas son rangos [inicio, fin) del orden por x. Al volver de
+    los dos hijos se mezclan sus órdenes por y en un único búfer auxiliar
+    (como en Merge Sort) y se revisa la banda de ancho radio() alrededor de
+    la recta divisoria. Es un generador de (i, j, d) para cada par con
+    d <= radio(); radio() se vuelve a consultar tras cada par, así que puede
+    ir achicándose. Si cancelar (p. ej. un threading.Event) se activa, el
+    recorrido termina en el siguiente nodo. progreso(m), si se indica, se
+    llama tras cada caso base con los m primeros puntos (por x) ya resueltos.
+    """
+    n = len(xs)
+    if n < 2:
+        return
+
+    puntos_x = array("q", sorted(range(n), key=xs.__getitem__))
+    puntos_y = array("q", puntos_x)
+    auxiliar = array("q", bytes(8 * n))
+    rango = array("q", bytes(8 * n))
+    for posicion, p in enumerate(puntos_x):
+        rango[p] = posicion
+
+    vista_y = memoryview(puntos_y)
+    vista_aux = memoryview(auxiliar)
+    hypot = math.hypot
+
+    # Pila de (inicio, fin, hijos_resueltos) aplanada en un arreglo de enteros
+    pila = array("q", (0, n, 0))
+    while pila:
+        if cancelar is not None and cancelar.is_set():
+            return
+        resueltos = pila.pop()
+        fin = pila.pop()
+        inicio = pila.pop()
+
+        if fin - inicio <= 3:
+            # Caso base: todos los pares, y ordenar el rango por y (inserción)
+            for a in range(inicio, fin):
+                i = puntos_y[a]
+                for b in range(a + 1, fin):
+                    j = puntos_y[b]
+                    d = hypot(xs[i] - xs[j], ys[i] - ys[j])
+                    if d <= radio():
+                        yield i, j, d
+            for a in range(inicio + 1, fin):
+                p = puntos_y[a]
+                b = a - 1
+                while b >= inicio and ys[puntos_y[b]] > ys[p]:
+                    puntos_y[b + 1] = puntos_y[b]
+                    b -= 1
+                puntos_y[b + 1] = p
+            if progreso is not None:
+                progreso(fin)
+            continue
+
+        mitad = (inicio + fin) // 2
+        if not resueltos:
+            pila.extend((inicio, fin, 1, mitad, fin, 0, inicio, mitad, 0))
+            continue
+
+        # Mezclar las dos mitades (ya ordenadas por y) en el búfer auxiliar
+        a, b, c = inicio, mitad, inicio
+        while a < mitad and b < fin:
+            if ys[puntos_y[b]] < ys[puntos_y[a]]:
+                auxiliar[c] = puntos_y[b]
+                b += 1
+            else:
+                auxiliar[c] = puntos_y[a]
+                a += 1
+            c += 1
+        if a < mitad:
+            vista_aux[c:fin] = vista_y[a:mitad]
+        else:
+            vista_aux[c:fin] = vista_y[b:fin]
+        vista_y[inicio:fin] = vista_aux[inicio:fin]
+
+        # Banda alrededor de la recta divisoria, reutilizando el búfer auxiliar
+        r = radio()
+        x_medio = xs[puntos_x[mitad]]
+        tam_banda = inicio
+        for a in range(inicio, fin):
+            p = puntos_y[a]
+            if abs(xs[p] - x_medio) <= r:
+                auxiliar[tam_banda] = p
+                tam_banda += 1
+
+        for a in range(inicio, tam_banda):
+            i = auxiliar[a]
+            izquierda = rango[i] < mitad
+            for b in range(a + 1, tam_banda):
+                j = auxiliar[b]
+                if ys[j] - ys[i] > r:
+                    break
+                if (rango[j] < mitad) != izquierda:
+                    d = hypot(xs[i] - xs[j], ys[i] - ys[j])
+                    if d <= r:
+                        yield i, j, d
+                        r = radio()
+
+# EMISIÓN EN FLUJO
+
+
+def iterar_conflictos(aeronaves: List[Aeronave], umbral: float, tam_bloque: Optional[int] = None,
+                      cancelar=None) -> Iterator:
+    """Genera los conflictos (a, b, distancia) a medida que se encuentran.
+
+    No acumula pares: la memoria no crece con k y el primer conflicto sale
+    antes de terminar el barrido. Con tam_bloque se emiten listas de hasta
+    ese tamaño. Para cancelar basta con dejar de iterar (o cerrar el
+    generador) o activar cancelar, p. ej. un threading.Event desde otro hilo.
+    """
+    if umbral <= 0:
+        raise ValueError("El umbral debe ser > 0")
+    xs = array("d", (a.x for a in aeronaves))
+    ys = array("d", (a.y for a in aeronaves))
+    pares = recorrer_dividir_y_vencer(xs, ys, lambda: umbral, cancelar)
+
+    if not tam_bloque:
+        for i, j, d in pares:
+            yield aeronaves[i], aeronaves[j], d
+        return
+
+    bloque = []
+    for i, j, d in pares:
+        bloque.append((aeronaves[i], aeronaves[j], d))
+        if len(bloque) >= tam_bloque:
+            if cancelar is not None and cancelar.is_set():
+                return
+            yield bloque
+            bloque = []
+    if bloque and not (cancelar is not None and cancelar.is_set()):
+        yield bloque
+
+# PAR MÁS CERCANO SIN UMBRAL
+
+
+def pares_mas_cercanos(aeronaves: List[Aeronave], k: int) -> List[Tuple[Aeronave, Aeronave, float]]:
+    """Los k pares más cercanos (a, b, distancia), de menor a mayor, sin umbral.
+
+    Usa el Divide y Vencer iterativo con un montículo acotado a k elementos:
+    el radio de la banda es la k-ésima mejor distancia encontrada hasta el
+    momento, por lo que nunca se construye la lista completa de pares.
+    """
+    if k <= 0:
+        return []
+    xs = array("d", (a.x for a in aeronaves))
+    ys = array("d", (a.y for a in aeronaves))
+    monticulo = []  # (-d, i, j): la raíz es el peor de los k mejores
+
+    def radio():
+        return -monticulo[0][0] if len(monticulo) == k else math.inf
+
+    def visitar(i, j, d):
+        if len(monticulo) < k:
+            heapq.heappush(monticulo, (-d, i, j))
+        elif d < -monticulo[0][0]:
+            heapq.heapreplace(monticulo, (-d, i, j))
+
+    for i, j, d in recorrer_dividir_y_vencer(xs, ys, radio):
+        visitar(i, j, d)
+    return [(aeronaves[i], aeronaves[j], -d) for d, i, j in sorted(monticulo, reverse=True)]
+
+def par_mas_cercano(aeronaves: List[Aeronave]) -> Optional[Tuple[Aeronave, Aeronave, float]]:
+    """Par más cercano de toda la flota (a, b, distancia) en O(n log n), sin umbral"""
+    pares = pares_mas_cercanos(aeronaves, 1)
+    return pares[0] if pares else None
+
+# REJILLA ESPACIAL UNIFORME
+
+# Celdas vecinas "hacia adelante": cada par de celdas se visita una sola vez
+VECINAS_ADELANTE = ((1, -1), (1, 0), (1, 1), (0, 1))
+
+
+def pares_por_rejilla(aeronaves: List[Aeronave], umbral: float) -> List[Tuple[Aeronave, Aeronave]]:
+    """Encuentra todos los pares con distancia <= umbral usando celdas de lado umbral"""
+    return conflictos_por_rejilla(aeronaves, umbral).pares()
+
+def conflictos_por_rejilla(aeronaves: List[Aeronave], umbral: float) -> ConjuntoConflictos:
+    """Rejilla uniforme con celdas de lado umbral.
+
+    Dos aeronaves a distancia <= umbral caen en la misma celda o en celdas
+    adyacentes, así que basta comparar cada celda consigo misma y con sus
+    vecinas. Cada par se devuelve una vez, en el orden de la lista de entrada.
+    """
+    if umbral <= 0:
+        raise ValueError("El umbral debe ser > 0")
+
+    # Agrupar índices por celda
+    celdas = {}
+    for i, a in enumerate(aeronaves):
+        clave = (math.floor(a.x / umbral), math.floor(a.y / umbral))
+        celda = celdas.get(clave)
+        if celda is None:
+            celdas[clave] = [i]
+        else:
+            celda.append(i)
+
+    xs = [a.x for a in aeronaves]
+    ys = [a.y for a in aeronaves]
+    hypot = math.hypot
+    pares = []
+
+    for (cx, cy), celda in celdas.items():
+        # Pares dentro de la misma celda
+        for pos, i in enumerate(celda):
+            xi, yi = xs[i], ys[i]
+            for j in celda[pos + 1:]:
+                d = hypot(xs[j] - xi, ys[j] - yi)
+                if d <= umbral:
+                    pares.append((i, j, d))
+
+        # Pares con las celdas vecinas
+        for ox, oy in VECINAS_ADELANTE:
+            vecina = celdas.get((cx + ox, cy + oy))
+            if vecina is None:
+                continue
+            for i in celda:
+                xi, yi = xs[i], ys[i]
+                for j in vecina:
+                    d = hypot(xs[j] - xi, ys[j] - yi)
+                    if d <= umbral:
+                        pares.append((i, j, d) if i < j else (j, i, d))
+
+    pares.sort()
+    conjunto = ConjuntoConflictos(aeronaves)
+    for i, j, d in pares:
+        conjunto.i.append(i)
+        conjunto.j.append(j)
+        conjunto.d.append(d)
+    return conjunto
+
+# Las 13 celdas vecinas "hacia adelante" en (x, y, nivel)
+VECINAS_ADELANTE_3D = tuple((ox, oy, oz) for ox in (-1, 0, 1) for oy in (-1, 0, 1)
+                            for oz in (-1, 0, 1) if (ox, oy, oz) > (0, 0, 0))
+
+
+def conflictos_por_rejilla_3d(aeronaves: List[Aeronave], umbral: float,
+                              separacion_vertical: float) -> ConjuntoConflictos:
+    """Rejilla 3D: celdas de lado umbral en planta y de alto separacion_vertical.
+
+    La altura de celda agrupa las aeronaves en niveles de vuelo, así que el
+    tráfico separado verticalmente nunca llega a compararse, y dentro de las
+    celdas vecinas la diferencia de altitud se revisa antes que la distancia
+    horizontal. d es la distancia horizontal del par.
+    """
+    if umbral <= 0:
+        raise ValueError("El umbral debe ser > 0")
+    if separacion_vertical <= 0:
+        raise ValueError("La separación vertical debe ser > 0")
+
+    # Agrupar índices por celda y nivel
+    celdas = {}
+    for i, a in enumerate(aeronaves):
+        clave = (math.floor(a.x / umbral), math.floor(a.y / umbral),
+                 math.floor(a.z / separacion_vertical))
+        celda = celdas.get(clave)
+        if celda is None:
+            celdas[clave] = [i]
+        else:
+            celda.append(i)
+
+    xs = [a.x for a in aeronaves]
+    ys = [a.y for a in aeronaves]
+    zs = [a.z for a in aeronaves]
+    hypot = math.hypot
+    pares = []
+
+    for (cx, cy, cz), celda in celdas.items():
+        # Pares dentro de la misma celda
+        for pos, i in enumerate(celda):
+            xi, yi, zi = xs[i], ys[i], zs[i]
+            for j in celda[pos + 1:]:
+                if abs(zs[j] - zi) > separacion_vertical:
+                    continue
+                d = hypot(xs[j] - xi, ys[j] - yi)
+                if d <= umbral:
+                    pares.append((i, j, d))
+
+        # Pares con las celdas vecinas
+        for ox, oy, oz in VECINAS_ADELANTE_3D:
+            vecina = celdas.get((cx + ox, cy + oy, cz + oz))
+            if vecina is None:
+                continue
+            for i in celda:
+                xi, yi, zi = xs[i], ys[i], zs[i]
+                for j in vecina:
+                    if abs(zs[j] - zi) > separacion_vertical:
+                        continue
+                    d = hypot(xs[j] - xi, ys[j] - yi)
+                    if d <= umbral:
+                        pares.append((i, j, d) if i < j else (j, i, d))
+
+    pares.sort()
+    conjunto = ConjuntoConflictos(aeronaves)
+    for i, j, d in pares:
+        conjunto.i.append(i)
+        conjunto.j.append(j)
+        conjunto.d.append(d)
+    return conjunto
+
+# BARRIDO Y FUERZA BRUTA
+
+
+def conflictos_fuerza_bruta(aeronaves: List[Aeronave], umbral: float) -> ConjuntoConflictos:
+    """Todos los pares contra todos, O(n²): el más rápido para n muy pequeño"""
+    conjunto = ConjuntoConflictos(aeronaves)
+    xs = [a.x for a in aeronaves]
+    ys = [a.y for a in aeronaves]
+    hypot = math.hypot
+    for i in range(len(xs)):
+        xi, yi = xs[i], ys[i]
+        for j in range(i + 1, len(xs)):
+            d = hypot(xs[j] - xi, ys[j] - yi)
+            if d <= umbral:
+                conjunto.agregar(i, j, d)
+    return conjunto
+
+def conflictos_por_barrido(aeronaves: List[Aeronave], umbral: float) -> ConjuntoConflictos:
+    """Línea de barrido en x con un conjunto activo ordenado por y
+
+    Los puntos se recorren por x; el conjunto activo guarda los que están a
+    menos de umbral detrás de la línea, ordenados por y, y cada punto solo
+    se compara con los activos de y en [y - umbral, y + umbral]. No depende
+    de una rejilla ni de bandas por nivel, así que los focos muy densos o
+    muy desparejos no lo degradan más que al propio número de candidatos.
+    Exhaustivo; mismo orden y distancias que conflictos_por_rejilla.
+    """
+    if umbral <= 0:
+        raise ValueError("El umbral debe ser > 0")
+    xs = [a.x for a in aeronaves]
+    ys = [a.y for a in aeronaves]
+    orden = sorted(range(len(xs)), key=xs.__getitem__)
+    activos_y = []   # y de los activos, ordenadas
+    activos = []     # índice de cada activo, en el mismo orden
+    hypot = math.hypot
+    pares = []
+
+    cola = 0
+    for p in orden:
+        xp, yp = xs[p], ys[p]
+        # Retirar los que quedaron a más de umbral detrás de la línea
+        while xs[orden[cola]] < xp - umbral:
+            q = orden[cola]
+            posicion = bisect_left(activos_y, ys[q])
+            while activos[posicion] != q:
+                posicion += 1
+            del activos_y[posicion]
+            del activos[posicion]
+            cola += 1
+
+        for k in range(bisect_left(activos_y, yp - umbral), bisect_right(activos_y, yp + umbral)):
+            q = activos[k]
+            d = hypot(xs[q] - xp, ys[q] - yp)
+            if d <= umbral:
+                pares.append((q, p, d) if q < p else (p, q, d))
+
+        posicion = bisect_right(activos_y, yp)
+        activos_y.insert(posicion, yp)
+        activos.insert(posicion, p)
+
+    pares.sort()
+    conjunto = ConjuntoConflictos(aeronaves)
+    for i, j, d in pares:
+        conjunto.i.append(i)
+        conjunto.j.append(j)
+        conjunto.d.append(d)
+    return conjunto
+
+# PLANIFICADOR DE MOTORES
+
+# Segundos por unidad de trabajo de cada motor exacto, ajustados midiendo
+# las seis distribuciones de trafico.py (n de 200 a 20000); lo que decide
+# es la proporción entre motores, no el valor absoluto
+COSTOS_PLAN = {
+    "fuerza_bruta": {"comparaciones": 1.5e-7, "pares": 4.0e-7},
+    "rejilla": {"aeronaves": 4.3e-7, "celdas": 1.3e-6, "candidatos": 3.7e-7, "pares": 4.8e-7},
+    "barrido": {"ordenar": 1.1e-7, "activos": 3.5e-9, "candidatos": 2.5e-7, "pares": 7.5e-7},
+}
+MUESTRA_PLAN = 1024          # tamaño máximo de la muestra
+EVALUACIONES_PLAN = 4096     # distancias calculadas como máximo para estimar los pares
+N_FUERZA_BRUTA = 32          # por debajo no vale la pena muestrear
+
+
+class PlanDeteccion:
+    """Motor elegido por planificar y las estimaciones en que se basó
+
+    pares_estimados y vecinos (pares por aeronave) salen de la muestra;
+    costos tiene los segundos estimados de cada motor candidato.
+    """
+
+    def __init__(self, motor: str, n: int, umbral: float, muestra: int,
+                 pares_estimados: float, costos: Dict[str, float]):
+        self.motor = motor
+        self.n = n
+        self.umbral = umbral
+        self.muestra = muestra
+        self.pares_estimados = pares_estimados
+        self.vecinos = 2 * pares_estimados / n if n else 0.0
+        self.costos = costos
+
+    def __repr__(self):
+        return (f"PlanDeteccion(motor={self.motor!r}, n={self.n}, muestra={self.muestra}, "
+                f"pares≈{self.pares_estimados:.0f})")
+
+
+def planificar(aeronaves: List[Aeronave], umbral: float) -> PlanDeteccion:
+    """Elige entre fuerza bruta, barrido y rejilla según una muestra de la entrada
+
+    Sobre una muestra de hasta MUESTRA_PLAN aeronaves (fija para una misma
+    entrada) se cuentan los candidatos de la rejilla por celdas, los pares
+    a distancia <= umbral (con a lo sumo EVALUACIONES_PLAN distancias), los
+    activos del barrido y las celdas ocupadas; los conteos de pares se
+    escalan por (n/m)². Con eso se estima el costo de cada motor con
+    COSTOS_PLAN y se elige el menor. Nunca elige el Divide y Vencer
+    clásico, que no es exhaustivo.
+    """
+    if umbral <= 0:
+        raise ValueError("El umbral debe ser > 0")
+    n = len(aeronaves)
+    if n <= N_FUERZA_BRUTA:
+        return PlanDeteccion("fuerza_bruta", n, umbral, n, n * (n - 1) / 2, {})
+
+    m = min(n, MUESTRA_PLAN, max(64, n // 8))
+    muestra = aeronaves if m == n else random.Random(n).sample(aeronaves, m)
+    escala = n * (n - 1) / (m * (m - 1))
+
+    # Rejilla de la muestra: candidatos sin calcular distancias
+    celdas = {}
+    for a in muestra:
+        clave = (math.floor(a.x / umbral), math.floor(a.y / umbral))
+        celda = celdas.get(clave)
+        if celda is None:
+            celdas[clave] = [a]
+        else:
+            celda.append(a)
+    candidatos = 0
+    for (cx, cy), celda in celdas.items():
+        candidatos += len(celda) * (len(celda) - 1) // 2
+        for ox, oy in VECINAS_ADELANTE:
+            vecina = celdas.get((cx + ox, cy + oy))
+            if vecina is not None:
+                candidatos += len(celda) * len(vecina)
+
+    # Fracción de candidatos que son pares, con un presupuesto de distancias
+    evaluados = cercanos = 0
+    for (cx, cy), celda in celdas.items():
+        grupo = celda + [b for ox, oy in VECINAS_ADELANTE for b in celdas.get((cx + ox, cy + oy), ())]
+        for pos, a in enumerate(celda):
+            if evaluados >= EVALUACIONES_PLAN:
+                break
+            for b in grupo[pos + 1:]:
+                evaluados += 1
+                if math.hypot(b.x - a.x, b.y - a.y) <= umbral:
+                    cercanos += 1
+        if evaluados >= EVALUACIONES_PLAN:
+            break
+    pares = candidatos * cercanos / evaluados if evaluados else 0.0
+
+    # Activos del barrido: pares con 0 <= dx <= umbral
+    xs = sorted(a.x for a in muestra)
+    activos = sum(posicion - bisect_left(xs, x - umbral) for posicion, x in enumerate(xs))
+
+    candidatos *= escala
+    pares *= escala
+    activos *= escala
+    ocupadas = min(n, len(celdas) * n / m)
+
+    costo = COSTOS_PLAN["fuerza_bruta"]
+    costos = {"fuerza_bruta": costo["comparaciones"] * n * (n - 1) / 2 + costo["pares"] * pares}
+    costo = COSTOS_PLAN["rejilla"]
+    costos["rejilla"] = (costo["aeronaves"] * n + costo["celdas"] * ocupadas
+                         + costo["candidatos"] * candidatos + costo["pares"] * pares)
+    costo = COSTOS_PLAN["barrido"]
+    costos["barrido"] = (costo["ordenar"] * n * math.log2(n) + costo["activos"] * activos
+                         + costo["candidatos"] * candidatos + costo["pares"] * pares)
+    return PlanDeteccion(min(costos, key=costos.get), n, umbral, m, pares, costos)
+
+def encontrar_par_mas_cercano(pares_cercanos: List[Tuple[Aeronave, Aeronave]], flota=None) -> Optional[Tuple[Aeronave, Aeronave]]:
+    """Encuentra el par con menor distancia entre todos los pares cercanos
+
+    Acepta también un ConjuntoConflictos (sin recalcular distancias). Con
+    flota, pares_cercanos es el arreglo (k, 2) de posiciones devuelto para
+    esa Flota y el resultado es una tupla de posiciones.
+    """
+    if flota is not None:
+        from flota import par_mas_cercano_flota
+        return par_mas_cercano_flota(flota, pares_cercanos)
+    if isinstance(pares_cercanos, ConjuntoConflictos):
+        minimo = pares_cercanos.minimo()
+        return None if minimo is None else minimo[:2]
+    if not pares_cercanos:
+        return None
     
-    def limpiar(self):
-        """Limpia toda la simulación"""
-        self.canvas.delete("all")
-        self.aeronaves = []
-        self.pares_cercanos = []
-        self.par_mas_cercano = None
-        self.texto_resultados.delete(1.0, tk.END)
-        self.dibujar_mensaje_inicial()
+    # Ordenar por distancia ascendente
+    pares_ordenados = sorted(pares_cercanos, key=lambda p: distancia(p[0], p[1]))
+    return pares_ordenados[0]  # El primero es el más cercano
+
+# NIVELES DE ALERTA
+
+
+class DistanciasOrdenadas:
+    """Todos los pares hasta radio_maximo, ordenados por distancia
+
+    Se calcula una sola vez con el radio mayor; después cualquier umbral
+    <= radio_maximo se responde con una búsqueda binaria sobre d, sin
+    volver a recorrer las aeronaves.
+    """
+
+    def __init__(self, aeronaves: List[Aeronave], radio_maximo: float, motor: str = "rejilla",
+                 conjunto: Optional[ConjuntoConflictos] = None):
+        # conjunto: resultado exacto ya calculado para radio_maximo, si lo hay
+        if conjunto is None:
+            conjunto = encontrar_conflictos(aeronaves, radio_maximo, motor)
+        orden = sorted(range(len(conjunto)), key=conjunto.d.__getitem__)
+        self.aeronaves = aeronaves
+        self.radio_maximo = radio_maximo
+        self.i = array("q", (conjunto.i[k] for k in orden))
+        self.j = array("q", (conjunto.j[k] for k in orden))
+        self.d = array("d", (conjunto.d[k] for k in orden))
+
+    def __len__(self):
+        return len(self.d)
+
+    def contar(self, umbral: float) -> int:
+        """Cantidad de pares con distancia <= umbral, en O(log k)"""
+        if umbral > self.radio_maximo:
+            raise ValueError(f"El umbral supera el radio calculado ({self.radio_maximo})")
+        return bisect_right(self.d, umbral)
+
+    def entre(self, minimo: float, maximo: float) -> ConjuntoConflictos:
+        """Pares con minimo < distancia <= maximo, ya ordenados por distancia"""
+        inicio = bisect_right(self.d, minimo)
+        fin = self.contar(maximo)
+        conjunto = ConjuntoConflictos(self.aeronaves)
+        conjunto.extender(self.i[inicio:fin], self.j[inicio:fin], self.d[inicio:fin])
+        conjunto._orden = range(len(conjunto))
+        return conjunto
+
+    def hasta(self, umbral: float) -> ConjuntoConflictos:
+        """Pares con distancia <= umbral"""
+        return self.entre(-math.inf, umbral)
+
+    def niveles(self, umbrales) -> Dict:
+        """Clasifica cada par en su nivel más estrecho
+
+        umbrales es una lista de radios o un dict {nombre: radio}, p. ej.
+        {"aviso": 20, "precaucion": 10, "alerta": 5}. Devuelve un dict con
+        las mismas claves: cada par aparece solo en el menor radio que lo
+        contiene.
+        """
+        resultado = {}
+        anterior = -math.inf
+        for nombre, umbral in niveles_por_radio(umbrales):
+            resultado[nombre] = self.entre(anterior, umbral)
+            anterior = umbral
+        return resultado
+
+
+def niveles_por_radio(umbrales) -> List[Tuple[object, float]]:
+    """(nombre, radio) de menor a mayor radio; una lista de radios se nombra por su valor"""
+    nombres = dict(umbrales) if isinstance(umbrales, dict) else {u: u for u in umbrales}
+    if not nombres or min(nombres.values()) <= 0:
+        raise ValueError("Los umbrales deben ser > 0")
+    return sorted(nombres.items(), key=lambda item: item[1])
+
+def alertas_por_niveles(aeronaves: List[Aeronave], umbrales, motor: str = "rejilla") -> Dict:
+    """Niveles de alerta con un solo barrido al radio mayor
+
+    Mismo resultado que DistanciasOrdenadas.niveles, pero sin ordenar los
+    pares: cada uno se asigna a su nivel con una búsqueda binaria sobre los
+    radios, en el orden de detección.
+    """
+    niveles = niveles_por_radio(umbrales)
+    radios = [radio for _, radio in niveles]
+    conjunto = encontrar_conflictos(aeronaves, radios[-1], motor)
+
+    resultado = {nombre: ConjuntoConflictos(aeronaves) for nombre, _ in niveles}
+    destinos = [(c.i.append, c.j.append, c.d.append) for c in resultado.values()]
+    for i, j, d in zip(conjunto.i, conjunto.j, conjunto.d):
+        agregar_i, agregar_j, agregar_d = destinos[bisect_left(radios, d)]
+        agregar_i(i)
+        agregar_j(j)
+        agregar_d(d)
+    return resultado
+
+# GENERACIÓN DE DATOS
+
+
+def generar_aeronaves(n: int, columnar: bool = False, velocidad_maxima: float = 0.0,
+                      altitud_maxima: float = 0.0, semilla: Optional[int] = None) -> List[Aeronave]:
+    """Genera n aeronaves en posiciones aleatorias (0-100 en ambos ejes)
+
+    Con velocidad_maxima > 0 cada componente de la velocidad se elige en
+    [-velocidad_maxima, velocidad_maxima]; con altitud_maxima > 0 la
+    altitud z se elige en [0, altitud_maxima]. Con columnar=True devuelve
+    una Flota (requiere NumPy). Con semilla el resultado es reproducible;
+    para millones de aeronaves u otras distribuciones ver trafico.py.
+    """
+    if columnar:
+        try:
+            from flota import generar_flota
+            import numpy as np
+        except ImportError:
+            raise RuntimeError("El modo columnar requiere NumPy")
+        return generar_flota(n, np.random.default_rng(semilla))
+    rng = random.Random(semilla) if semilla is not None else random
+    if velocidad_maxima > 0 or altitud_maxima > 0:
+        v = velocidad_maxima
+        return [Aeronave(rng.uniform(0, 100), rng.uniform(0, 100),
+                         rng.uniform(-v, v) if v > 0 else 0.0,
+                         rng.uniform(-v, v) if v > 0 else 0.0,
+                         rng.uniform(0, altitud_maxima) if altitud_maxima > 0 else 0.0)
+                for _ in range(n)]
+    return [Aeronave(rng.uniform(0, 100), rng.uniform(0, 100)) 
+            for _ in range(n)]
 
 # EJECUCIÓN PRINCIPAL
 
 
+def __getattr__(nombre):
+    # La interfaz gráfica se importa solo cuando se pide, para no cargar tkinter
+    if nombre == "SistemaControlAereo":
+        from interfaz import SistemaControlAereo
+        return SistemaControlAereo
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+
 def main():
     """Función principal"""
+    import tkinter as tk
+    from interfaz import SistemaControlAereo
     ventana = tk.Tk()
     app = SistemaControlAereo(ventana)
     ventana.mainloop()
@@ -0,0 +1,110 @@
+"""
+Análisis en segundo plano para la interfaz gráfica
+La detección corre en un hilo; los pares llegan por bloques a una cola que
+el hilo de la interfaz vacía periódicamente (p. ej. con ventana.after)
+"""
+
+from __future__ import annotations
+import queue
+import threading
+from array import array
+from typing import List, Optional
+
+from Project import Aeronave, ConjuntoConflictos, par_mas_cercano, recorrer_dividir_y_vencer
+
+
+class AnalisisEnSegundoPlano:
+    """Detección de conflictos en un hilo trabajador, cancelable y con progreso
+
+    El trabajador no toca el ConjuntoConflictos: publica bloques
+    (i_s, j_s, d_s) en una cola y el hilo que llama a recoger() los agrega.
+    Así el conjunto solo se modifica desde un hilo (el de la interfaz).
+    """
+
+    TAM_BLOQUE = 2000
+
+    def __init__(self, aeronaves: List[Aeronave], umbral: float):
+        if umbral <= 0:
+            raise ValueError("El umbral debe ser > 0")
+        self.aeronaves = aeronaves
+        self.umbral = umbral
+        self.conjunto = ConjuntoConflictos(aeronaves)
+        self.resueltos = 0          # puntos (en orden por x) ya procesados
+        self.separacion_minima: Optional[float] = None  # solo si no hubo pares
+        self.terminado = False
+        self.error: Optional[BaseException] = None
+        self._cancelar = threading.Event()
+        self._cola: queue.Queue = queue.Queue()
+        self._hilo = threading.Thread(target=self._ejecutar, daemon=True)
+
+    @property
+    def progreso(self) -> float:
+        """Fracción (0-1) de la flota procesada"""
+        n = len(self.aeronaves)
+        return 1.0 if n == 0 else self.resueltos / n
+
+    @property
+    def cancelado(self) -> bool:
+        return self._cancelar.is_set()
+
+    def iniciar(self) -> AnalisisEnSegundoPlano:
+        self._hilo.start()
+        return self
+
+    def cancelar(self):
+        """Pide al trabajador que se detenga en el siguiente nodo"""
+        self._cancelar.set()
+
+    def esperar(self, tiempo: Optional[float] = None):
+        self._hilo.join(tiempo)
+
+    def _avanzar(self, resueltos: int):
+        self.resueltos = resueltos
+
+    def _ejecutar(self):
+        xs = array("d", (a.x for a in self.aeronaves))
+        ys = array("d", (a.y for a in self.aeronaves))
+        umbral = self.umbral
+        i_s, j_s, d_s = array("q"), array("q"), array("d")
+        encontrados = 0
+        try:
+            for i, j, d in recorrer_dividir_y_vencer(xs, ys, lambda: umbral,
+                                                     self._cancelar, self._avanzar):
+                i_s.append(i)
+                j_s.append(j)
+                d_s.append(d)
+                encontrados += 1
+                if len(d_s) >= self.TAM_BLOQUE:
+                    self._cola.put((i_s, j_s, d_s))
+                    i_s, j_s, d_s = array("q"), array("q"), array("d")
+            if d_s:
+                self._cola.put((i_s, j_s, d_s))
+            if not self._cancelar.is_set():
+                if not encontrados:
+                    # Separación mínima real, aunque supere el umbral
+                    minimo = par_mas_cercano(self.aeronaves)
+                    self.separacion_minima = None if minimo is None else minimo[2]
+                self.resueltos = len(self.aeronaves)
+        except Exception as error:  # se informa a la interfaz en recoger()
+            self.error = error
+        finally:
+            self.terminado = True
+
+    def recoger(self) -> int:
+        """Agrega al conjunto los bloques recibidos; devuelve cuántos pares nuevos hay
+
+        No bloquea. Debe llamarse siempre desde el mismo hilo.
+        """
+        nuevos = 0
+        while True:
+            try:
+                i_s, j_s, d_s = self._cola.get_nowait()
+            except queue.Empty:
+                return nuevos
+            self.conjunto.extender(i_s, j_s, d_s)
+            nuevos += len(d_s)
+
+    @property
+    def finalizado(self) -> bool:
+        """El trabajador terminó y ya no quedan bloques por recoger"""
+        return self.terminado and self._cola.empty()
@@ -0,0 +1,130 @@
+"""
+Caché de resultados por instantánea
+Guarda los pares de cada instantánea (identificada por una huella de sus
+coordenadas) y responde los umbrales menores filtrando un resultado mayor
+"""
+
+from __future__ import annotations
+import hashlib
+from array import array
+from collections import OrderedDict
+from typing import List, Optional
+
+from Project import Aeronave, ConjuntoConflictos, DistanciasOrdenadas
+
+
+# Motores exactos: filtrar su resultado a un umbral menor equivale a recalcularlo
+MOTORES_CACHEABLES = ("rejilla", "iterativo")
+
+BYTES_POR_PAR = 24  # i, j (int64) y d (float64)
+
+
+def huella(aeronaves: List[Aeronave]) -> bytes:
+    """Resumen (BLAKE2b) de las coordenadas: misma huella, misma instantánea"""
+    resumen = hashlib.blake2b(digest_size=16)
+    resumen.update(len(aeronaves).to_bytes(8, "little"))
+    resumen.update(array("d", (a.x for a in aeronaves)).tobytes())
+    resumen.update(array("d", (a.y for a in aeronaves)).tobytes())
+    resumen.update(array("d", (getattr(a, "z", 0.0) for a in aeronaves)).tobytes())
+    return resumen.digest()
+
+
+class CacheConflictos:
+    """Caché LRU de pares por huella de la instantánea, con límite de memoria
+
+    Cada entrada guarda todos los pares hasta el mayor umbral pedido,
+    ordenados por distancia (DistanciasOrdenadas). Un umbral menor o igual
+    se responde con una búsqueda binaria; uno mayor recalcula y reemplaza
+    la entrada. Cuando la memoria estimada supera limite_bytes se expulsan
+    las entradas usadas hace más tiempo.
+    """
+
+    def __init__(self, limite_bytes: int = 256 * 2 ** 20):
+        self.limite_bytes = limite_bytes
+        self.bytes_usados = 0
+        self._entradas: OrderedDict = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+        self.expulsiones = 0
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def _clave(self, aeronaves, motor: str, firma: Optional[bytes]) -> bytes:
+        # Los motores cacheables dan el mismo resultado: la clave es solo la huella
+        if motor not in MOTORES_CACHEABLES:
+            raise ValueError(f"Motor no cacheable (no exacto): {motor}")
+        return firma or huella(aeronaves)
+
+    def buscar(self, aeronaves: List[Aeronave], umbral: float, motor: str = "rejilla",
+               firma: Optional[bytes] = None) -> Optional[ConjuntoConflictos]:
+        """Pares con distancia <= umbral si una entrada los cubre; None si no (fallo)
+
+        firma permite reutilizar una huella ya calculada para la instantánea.
+        """
+        clave = self._clave(aeronaves, motor, firma)
+        ordenadas = self._entradas.get(clave)
+        if ordenadas is None or umbral > ordenadas.radio_maximo:
+            self.fallos += 1
+            return None
+        self._entradas.move_to_end(clave)
+        self.aciertos += 1
+        conjunto = ordenadas.hasta(umbral)
+        conjunto.aeronaves = aeronaves
+        return conjunto
+
+    def guardar(self, aeronaves: List[Aeronave], umbral: float, conjunto: ConjuntoConflictos,
+                motor: str = "rejilla", firma: Optional[bytes] = None):
+        """Registra un resultado exacto calculado para umbral"""
+        clave = self._clave(aeronaves, motor, firma)
+        anterior = self._entradas.get(clave)
+        if anterior is not None and anterior.radio_maximo >= umbral:
+            self._entradas.move_to_end(clave)
+            return
+        self._insertar(clave, DistanciasOrdenadas(aeronaves, umbral, motor, conjunto))
+
+    def _insertar(self, clave, ordenadas: DistanciasOrdenadas):
+        tamano = BYTES_POR_PAR * len(ordenadas)
+        if tamano > self.limite_bytes:
+            return  # no cabe ni sola
+        if clave in self._entradas:
+            self._quitar(clave)
+        self._entradas[clave] = ordenadas
+        self.bytes_usados += tamano
+        while self.bytes_usados > self.limite_bytes:
+            self._quitar(next(iter(self._entradas)))
+            self.expulsiones += 1
+
+    def _quitar(self, clave):
+        ordenadas = self._entradas.pop(clave)
+        self.bytes_usados -= BYTES_POR_PAR * len(ordenadas)
+
+    def conflictos(self, aeronaves: List[Aeronave], umbral: float,
+                   motor: str = "rejilla") -> ConjuntoConflictos:
+        """Pares con distancia <= umbral, desde la caché o calculándolos
+
+        El resultado viene ordenado por distancia (no por índice).
+        """
+        firma = huella(aeronaves)
+        conjunto = self.buscar(aeronaves, umbral, motor, firma)
+        if conjunto is not None:
+            return conjunto
+        ordenadas = DistanciasOrdenadas(aeronaves, umbral, motor)
+        self._insertar(self._clave(aeronaves, motor, firma), ordenadas)
+        return ordenadas.hasta(umbral)
+
+    def limpiar(self):
+        self._entradas.clear()
+        self.bytes_usados = 0
+
+    def estadisticas(self) -> dict:
+        consultas = self.aciertos + self.fallos
+        return {
+            "entradas": len(self._entradas),
+            "bytes": self.bytes_usados,
+            "limite_bytes": self.limite_bytes,
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "expulsiones": self.expulsiones,
+            "tasa_aciertos": self.aciertos / consultas if consultas else 0.0,
+        }
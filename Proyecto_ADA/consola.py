@@ -0,0 +1,265 @@
+"""
+Modo por lotes sin interfaz gráfica (no importa tkinter)
+Lee posiciones desde CSV o desde un binario de formato fijo mapeado en memoria,
+detecta los pares cercanos y escribe pares y par más cercano en CSV, JSON o binario
+
+Uso:
+    python consola.py instantanea.csv --umbral 5 --formato json
+    python consola.py capturas/ --umbral 5 --formato binario --salida resultados/
+
+Formato binario de entrada (little endian):
+    b"ADAFLT01" | n: int64 | x: n float64 | y: n float64 | id: n int64
+
+Formato binario de salida (little endian):
+    b"ADAPAR01" | k: int64 | índice del par más cercano: int64 (-1 si k = 0)
+    | id_a: k int64 | id_b: k int64 | distancia: k float64
+"""
+
+from __future__ import annotations
+import argparse
+import csv
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import List, Optional
+
+from Project import Aeronave, encontrar_conflictos
+
+
+MAGIA_INSTANTANEA = b"ADAFLT01"
+MAGIA_PARES = b"ADAPAR01"
+CABECERA_INSTANTANEA = struct.Struct("<8sq")
+CABECERA_PARES = struct.Struct("<8sqq")
+
+EXTENSIONES = {"csv": ".csv", "json": ".json", "binario": ".bin"}
+
+
+# LECTURA DE INSTANTÁNEAS
+
+class Instantanea:
+    """Posiciones de una instantánea: ids, xs, ys (arreglos o vistas de memoria)"""
+
+    def __init__(self, ids, xs, ys, mapa: Optional[mmap.mmap] = None):
+        self.ids = ids
+        self.xs = xs
+        self.ys = ys
+        self._mapa = mapa
+
+    def __len__(self):
+        return len(self.xs)
+
+    def cerrar(self):
+        """Libera el mapeo del archivo binario, si lo hay"""
+        if self._mapa is not None:
+            for vista in (self.ids, self.xs, self.ys):
+                vista.release()
+            self._mapa.close()
+            self._mapa = None
+
+
+def leer_csv(ruta: str) -> Instantanea:
+    """Lee un CSV con cabecera x,y (e id opcional; si falta, id = número de fila)"""
+    ids, xs, ys = array("q"), array("d"), array("d")
+    with open(ruta, newline="", encoding="utf-8") as archivo:
+        lector = csv.DictReader(archivo)
+        con_id = "id" in (lector.fieldnames or ())
+        for fila, registro in enumerate(lector):
+            ids.append(int(registro["id"]) if con_id else fila)
+            xs.append(float(registro["x"]))
+            ys.append(float(registro["y"]))
+    return Instantanea(ids, xs, ys)
+
+
+def leer_binario(ruta: str) -> Instantanea:
+    """Mapea en memoria un binario ADAFLT01; las columnas son vistas sin copia"""
+    with open(ruta, "rb") as archivo:
+        mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+    magia, n = CABECERA_INSTANTANEA.unpack_from(mapa)
+    if magia != MAGIA_INSTANTANEA:
+        mapa.close()
+        raise ValueError(f"{ruta}: no es una instantánea ADAFLT01")
+    if len(mapa) != CABECERA_INSTANTANEA.size + 24 * n:
+        mapa.close()
+        raise ValueError(f"{ruta}: tamaño inconsistente con n = {n}")
+
+    datos = memoryview(mapa)[CABECERA_INSTANTANEA.size:]
+    xs = datos[:8 * n].cast("d")
+    ys = datos[8 * n:16 * n].cast("d")
+    ids = datos[16 * n:].cast("q")
+    datos.release()
+    return Instantanea(ids, xs, ys, mapa)
+
+
+def escribir_instantanea_binaria(ruta: str, xs, ys, ids=None):
+    """Escribe posiciones en el formato binario ADAFLT01"""
+    n = len(xs)
+    if ids is None:
+        ids = range(n)
+    with open(ruta, "wb") as archivo:
+        archivo.write(CABECERA_INSTANTANEA.pack(MAGIA_INSTANTANEA, n))
+        archivo.write(bytes(array("d", xs)))
+        archivo.write(bytes(array("d", ys)))
+        archivo.write(bytes(array("q", ids)))
+
+
+def leer_instantanea(ruta: str) -> Instantanea:
+    if ruta.endswith(".bin"):
+        return leer_binario(ruta)
+    return leer_csv(ruta)
+
+
+# DETECCIÓN
+
+class Resultado:
+    """Pares detectados como columnas ids_a, ids_b, distancias (arreglos tipados)"""
+
+    def __init__(self, ids_a, ids_b, distancias):
+        self.ids_a = ids_a
+        self.ids_b = ids_b
+        self.distancias = distancias
+
+    def __len__(self):
+        return len(self.distancias)
+
+    def indice_minimo(self) -> int:
+        """Posición del par más cercano, o -1 si no hay pares"""
+        if not len(self.distancias):
+            return -1
+        if hasattr(self.distancias, "argmin"):
+            return int(self.distancias.argmin())
+        return min(range(len(self.distancias)), key=self.distancias.__getitem__)
+
+    def orden_por_distancia(self) -> List[int]:
+        if hasattr(self.distancias, "argsort"):
+            return self.distancias.argsort(kind="stable").tolist()
+        return sorted(range(len(self.distancias)), key=self.distancias.__getitem__)
+
+
+def motor_por_defecto() -> str:
+    """El motor columnar si NumPy está disponible; si no, la rejilla"""
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return "rejilla"
+    return "flota"
+
+
+def detectar(instantanea: Instantanea, umbral: float, motor: str) -> Resultado:
+    """Ejecuta la detección sobre una instantánea y traduce posiciones a ids"""
+    if motor == "flota":
+        import numpy as np
+        from flota import Flota, pares_cercanos_flota, distancias
+        ids = np.frombuffer(instantanea.ids, dtype=np.int64)
+        flota = Flota(np.frombuffer(instantanea.xs, dtype=np.float64),
+                      np.frombuffer(instantanea.ys, dtype=np.float64), ids)
+        pares = pares_cercanos_flota(flota, umbral)
+        return Resultado(ids[pares[:, 0]], ids[pares[:, 1]], distancias(flota, pares))
+
+    aeronaves = [Aeronave(x, y) for x, y in zip(instantanea.xs, instantanea.ys)]
+    conjunto = encontrar_conflictos(aeronaves, umbral, motor)
+    ids = instantanea.ids
+    return Resultado(array("q", (ids[i] for i in conjunto.i)),
+                     array("q", (ids[j] for j in conjunto.j)),
+                     conjunto.d)
+
+
+# ESCRITURA DE RESULTADOS
+
+def escribir_csv(resultado: Resultado, archivo):
+    """Pares ordenados por distancia: la primera fila es el par más cercano"""
+    escritor = csv.writer(archivo)
+    escritor.writerow(["id_a", "id_b", "distancia"])
+    ids_a, ids_b, distancias = resultado.ids_a, resultado.ids_b, resultado.distancias
+    for k in resultado.orden_por_distancia():
+        escritor.writerow([int(ids_a[k]), int(ids_b[k]), repr(float(distancias[k]))])
+
+
+def a_documento(resultado: Resultado, n: int, umbral: float) -> dict:
+    """Resultado como diccionario serializable a JSON"""
+    k = resultado.indice_minimo()
+    return {
+        "n": n,
+        "umbral": umbral,
+        "total_pares": len(resultado),
+        "pares": [list(t) for t in zip(resultado.ids_a.tolist(), resultado.ids_b.tolist(),
+                                      resultado.distancias.tolist())],
+        "par_mas_cercano": None if k < 0 else [int(resultado.ids_a[k]), int(resultado.ids_b[k]),
+                                                float(resultado.distancias[k])],
+    }
+
+
+def escribir_json(resultado: Resultado, archivo, n: int, umbral: float):
+    json.dump(a_documento(resultado, n, umbral), archivo)
+    archivo.write("\n")
+
+
+def escribir_binario(resultado: Resultado, archivo):
+    archivo.write(CABECERA_PARES.pack(MAGIA_PARES, len(resultado), resultado.indice_minimo()))
+    archivo.write(resultado.ids_a.tobytes())
+    archivo.write(resultado.ids_b.tobytes())
+    archivo.write(resultado.distancias.tobytes())
+
+
+def procesar_archivo(entrada: str, salida: str, umbral: float, formato: str, motor: str) -> int:
+    """Procesa una instantánea y escribe su resultado; salida "-" es la salida estándar"""
+    instantanea = leer_instantanea(entrada)
+    try:
+        resultado = detectar(instantanea, umbral, motor)
+        n = len(instantanea)
+    finally:
+        instantanea.cerrar()
+
+    if formato == "binario":
+        if salida == "-":
+            escribir_binario(resultado, sys.stdout.buffer)
+        else:
+            with open(salida, "wb") as archivo:
+                escribir_binario(resultado, archivo)
+    else:
+        archivo = sys.stdout if salida == "-" else open(salida, "w", newline="", encoding="utf-8")
+        try:
+            if formato == "csv":
+                escribir_csv(resultado, archivo)
+            else:
+                escribir_json(resultado, archivo, n, umbral)
+        finally:
+            if archivo is not sys.stdout:
+                archivo.close()
+    return len(resultado)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Detección de colisiones por lotes, sin interfaz gráfica")
+    parser.add_argument("entrada", help="Archivo .csv/.bin o directorio con instantáneas")
+    parser.add_argument("--umbral", type=float, required=True)
+    parser.add_argument("--formato", choices=tuple(EXTENSIONES), default="json")
+    parser.add_argument("--motor", default=None,
+                        help="flota, rejilla, iterativo, divide_y_vencer... (por defecto flota si hay NumPy)")
+    parser.add_argument("--salida", default=None,
+                        help="Archivo o directorio de salida (por defecto, la salida estándar o el mismo directorio)")
+    args = parser.parse_args(argv)
+
+    if args.umbral <= 0:
+        parser.error("el umbral debe ser > 0")
+    motor = args.motor or motor_por_defecto()
+
+    if not os.path.isdir(args.entrada):
+        procesar_archivo(args.entrada, args.salida or "-", args.umbral, args.formato, motor)
+        return 0
+
+    destino = args.salida or args.entrada
+    os.makedirs(destino, exist_ok=True)
+    nombres = sorted(nombre for nombre in os.listdir(args.entrada)
+                     if nombre.endswith((".csv", ".bin")) and ".pares." not in nombre)
+    for nombre in nombres:
+        base = os.path.splitext(nombre)[0]
+        salida = os.path.join(destino, base + ".pares" + EXTENSIONES[args.formato])
+        procesar_archivo(os.path.join(args.entrada, nombre), salida, args.umbral, args.formato, motor)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
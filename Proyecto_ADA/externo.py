@@ -0,0 +1,348 @@
+"""
+Detección en memoria externa para instantáneas que no caben en RAM
+Ordena las posiciones por x en corridas que caben en el presupuesto, las mezcla
+en un solo recorrido con una ventana deslizante de ancho umbral y escribe los
+pares a disco a medida que aparecen
+
+Uso:
+    python externo.py archivo.bin --umbral 5 --salida pares.bin --memoria 256M
+    python externo.py archivo.csv --umbral 5 --salida pares.csv --formato csv
+"""
+
+from __future__ import annotations
+import argparse
+import csv
+import heapq
+import math
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from itertools import islice, starmap
+from typing import Iterator, Optional, Tuple
+
+from consola import CABECERA_INSTANTANEA, CABECERA_PARES, MAGIA_INSTANTANEA, MAGIA_PARES
+
+
+REGISTRO = struct.Struct("<ddq")       # (x, y, id) en las corridas ordenadas
+BYTES_POR_PUNTO_ORDEN = 128            # arreglos, índice y clave de orden de una corrida
+BYTES_POR_ACTIVO = 160                 # x, y, id en la ventana y sus listas ordenadas por y
+BLOQUE_ESCRITURA = 1 << 14             # registros o pares acumulados antes de volcarlos a disco
+MEMORIA_POR_DEFECTO = 256 << 20
+MEZCLA_MAXIMA = 64                     # corridas abiertas a la vez en una pasada de mezcla
+BUFER_MINIMO = 64                      # registros leídos por vez de cada corrida, como mínimo
+
+
+def leer_memoria(texto: str) -> int:
+    """Presupuesto de memoria en bytes desde "512M", "2G", "64K" o un número"""
+    unidades = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+    texto = texto.strip().upper().rstrip("B")
+    if texto and texto[-1] in unidades:
+        return int(float(texto[:-1]) * unidades[texto[-1]])
+    return int(texto)
+
+
+# LECTURA POR BLOQUES
+
+def leer_bloques(ruta: str, tam: int) -> Iterator[Tuple[array, array, array]]:
+    """Recorre la instantánea en bloques (xs, ys, ids) de a lo sumo tam puntos
+
+    Los binarios ADAFLT01 se leen por columnas con lecturas comunes (sin
+    mapeo, para que las páginas del archivo no cuenten en la memoria del
+    proceso); los CSV (x,y e id opcional) se leen fila a fila.
+    """
+    if ruta.endswith(".bin"):
+        with open(ruta, "rb") as archivo:
+            magia, n = CABECERA_INSTANTANEA.unpack(archivo.read(CABECERA_INSTANTANEA.size))
+            if magia != MAGIA_INSTANTANEA:
+                raise ValueError(f"{ruta}: no es una instantánea ADAFLT01")
+            if os.fstat(archivo.fileno()).st_size != CABECERA_INSTANTANEA.size + 24 * n:
+                raise ValueError(f"{ruta}: tamaño inconsistente con n = {n}")
+            for inicio in range(0, n, tam):
+                cantidad = min(tam, n - inicio)
+                columnas = []
+                for desplazamiento, tipo in ((0, "d"), (8 * n, "d"), (16 * n, "q")):
+                    archivo.seek(CABECERA_INSTANTANEA.size + desplazamiento + 8 * inicio)
+                    columna = array(tipo)
+                    columna.fromfile(archivo, cantidad)
+                    columnas.append(columna)
+                yield tuple(columnas)
+        return
+
+    with open(ruta, newline="", encoding="utf-8") as archivo:
+        lector = csv.DictReader(archivo)
+        con_id = "id" in (lector.fieldnames or ())
+        xs, ys, ids = array("d"), array("d"), array("q")
+        for fila, registro in enumerate(lector):
+            xs.append(float(registro["x"]))
+            ys.append(float(registro["y"]))
+            ids.append(int(registro["id"]) if con_id else fila)
+            if len(xs) == tam:
+                yield xs, ys, ids
+                xs, ys, ids = array("d"), array("d"), array("q")
+        if xs:
+            yield xs, ys, ids
+
+
+# CORRIDAS ORDENADAS POR X
+
+def escribir_corrida(ruta: str, xs, ys, ids):
+    """Escribe un bloque ordenado por x como registros REGISTRO
+
+    Basta el orden por x: la mezcla compara (x, y, id) y, como cada
+    corrida está ordenada por x, su salida también lo está.
+    """
+    orden = sorted(range(len(xs)), key=xs.__getitem__)
+    empaquetar = REGISTRO.pack
+    with open(ruta, "wb") as archivo:
+        for inicio in range(0, len(orden), BLOQUE_ESCRITURA):
+            archivo.write(b"".join(empaquetar(xs[k], ys[k], ids[k]) for k in orden[inicio:inicio + BLOQUE_ESCRITURA]))
+
+
+def leer_corrida(ruta: str, tam_bufer: int) -> Iterator[Tuple[float, float, int]]:
+    """Recorre una corrida leyendo tam_bufer registros por vez"""
+    with open(ruta, "rb") as archivo:
+        while True:
+            datos = archivo.read(REGISTRO.size * tam_bufer)
+            if not datos:
+                return
+            yield from REGISTRO.iter_unpack(datos)
+
+
+def mezclar_corridas(corridas: list, directorio: str, aridad: int, tam_bufer: int) -> Tuple[list, int]:
+    """Mezcla las corridas de a aridad hasta que queden a lo sumo aridad
+
+    Así nunca hay más de aridad archivos abiertos ni búferes en memoria.
+    Las corridas mezcladas se borran; devuelve las restantes y el número
+    de pasadas intermedias.
+    """
+    pasadas = 0
+    empaquetar = REGISTRO.pack
+    while len(corridas) > aridad:
+        siguientes = []
+        for inicio in range(0, len(corridas), aridad):
+            grupo = corridas[inicio:inicio + aridad]
+            if len(grupo) == 1:
+                siguientes.append(grupo[0])
+                continue
+            ruta = os.path.join(directorio, f"mezcla_{pasadas}_{len(siguientes):05d}.bin")
+            flujo = heapq.merge(*(leer_corrida(corrida, tam_bufer) for corrida in grupo))
+            with open(ruta, "wb") as archivo:
+                while True:
+                    lote = list(islice(flujo, tam_bufer))
+                    if not lote:
+                        break
+                    archivo.write(b"".join(starmap(empaquetar, lote)))
+            for corrida in grupo:
+                os.remove(corrida)
+            siguientes.append(ruta)
+        corridas = siguientes
+        pasadas += 1
+    return corridas, pasadas
+
+
+# ESCRITURA DE PARES EN FLUJO
+
+class EscritorPares:
+    """Escribe pares (id_a, id_b, distancia) a medida que llegan
+
+    Formato "binario": ADAPAR01 de consola.py; las tres columnas se vuelcan
+    a archivos auxiliares y se concatenan tras la cabecera al cerrar, cuando
+    ya se conocen k y el par más cercano. Formato "csv": una fila por par,
+    en el orden de detección (no por distancia, para no retenerlos).
+    """
+
+    def __init__(self, ruta: str, formato: str, temporal: str):
+        if formato not in ("binario", "csv"):
+            raise ValueError(f"Formato desconocido: {formato}")
+        self.ruta = ruta
+        self.formato = formato
+        self.total = 0
+        self.minimo = None  # (d, id_a, id_b, posición)
+        if formato == "csv":
+            self._archivo = open(ruta, "w", newline="", encoding="utf-8")
+            self._csv = csv.writer(self._archivo)
+            self._csv.writerow(["id_a", "id_b", "distancia"])
+            self._filas = []
+        else:
+            self._columnas = [open(os.path.join(temporal, nombre), "w+b") for nombre in ("a", "b", "d")]
+            self._ids_a, self._ids_b, self._ds = array("q"), array("q"), array("d")
+
+    def agregar(self, id_a: int, id_b: int, d: float):
+        if self.minimo is None or d < self.minimo[0]:
+            self.minimo = (d, id_a, id_b, self.total)
+        self.total += 1
+        if self.formato == "csv":
+            self._filas.append((id_a, id_b, repr(d)))
+            if len(self._filas) >= BLOQUE_ESCRITURA:
+                self._volcar()
+        else:
+            self._ids_a.append(id_a)
+            self._ids_b.append(id_b)
+            self._ds.append(d)
+            if len(self._ds) >= BLOQUE_ESCRITURA:
+                self._volcar()
+
+    def _volcar(self):
+        if self.formato == "csv":
+            self._csv.writerows(self._filas)
+            self._filas.clear()
+            return
+        for columna, datos in zip(self._columnas, (self._ids_a, self._ids_b, self._ds)):
+            columna.write(datos.tobytes())
+            del datos[:]
+
+    def abortar(self):
+        """Descarta lo escrito: cierra los archivos y borra la salida parcial"""
+        if self.formato == "csv":
+            self._archivo.close()
+        else:
+            for columna in self._columnas:
+                columna.close()
+        if os.path.exists(self.ruta):
+            os.remove(self.ruta)
+
+    def cerrar(self):
+        self._volcar()
+        if self.formato == "csv":
+            self._archivo.close()
+            return
+        with open(self.ruta, "wb") as salida:
+            posicion = -1 if self.minimo is None else self.minimo[3]
+            salida.write(CABECERA_PARES.pack(MAGIA_PARES, self.total, posicion))
+            for columna in self._columnas:
+                columna.seek(0)
+                shutil.copyfileobj(columna, salida)
+                columna.close()
+
+
+# DETECCIÓN EXTERNA
+
+def conflictos_externos(entrada: str, umbral: float, salida: str, formato: str = "binario",
+                        memoria: int = MEMORIA_POR_DEFECTO, temporal: Optional[str] = None) -> dict:
+    """Escribe en salida los pares a distancia <= umbral de la instantánea entrada
+
+    1. Se lee la entrada en bloques de memoria // BYTES_POR_PUNTO_ORDEN
+       puntos, cada uno se ordena por x y se guarda como corrida en temporal.
+    2. Las corridas se mezclan (heapq.merge, con búferes que reparten la
+       mitad del presupuesto) de a lo sumo MEZCLA_MAXIMA por vez, en varias
+       pasadas si hace falta; la última mezcla alimenta directamente un barrido
+       en x: la ventana guarda los puntos a menos de umbral detrás de la
+       línea, ordenados por y, como en Project.conflictos_por_barrido.
+    3. Cada par se escribe como (id menor, id mayor, distancia) sin
+       retenerlo en memoria.
+
+    Los pares y distancias son los mismos que da encontrar_pares_cercanos
+    sobre la instantánea cargada (con ids = posición). Si la ventana supera
+    la otra mitad del presupuesto se lanza MemoryError (el umbral es
+    demasiado grande para esa densidad) y no queda archivo de salida.
+    Devuelve un resumen con n, pares, corridas, pasadas, ventana_maxima y
+    par_mas_cercano (id_a, id_b, d).
+    """
+    if umbral <= 0:
+        raise ValueError("El umbral debe ser > 0")
+    tam_corrida = max(1024, memoria // BYTES_POR_PUNTO_ORDEN)
+    limite_ventana = max(1024, memoria // 2 // BYTES_POR_ACTIVO)
+
+    with tempfile.TemporaryDirectory(prefix="ada_externo_", dir=temporal) as directorio:
+        corridas = []
+        n = 0
+        for xs, ys, ids in leer_bloques(entrada, tam_corrida):
+            ruta = os.path.join(directorio, f"corrida_{len(corridas):05d}.bin")
+            escribir_corrida(ruta, xs, ys, ids)
+            corridas.append(ruta)
+            n += len(xs)
+
+        # Cada corrida abierta cuesta un búfer de bytes más sus tuplas (~4 veces)
+        bytes_bufer = REGISTRO.size * 4
+        aridad = min(MEZCLA_MAXIMA, max(2, memoria // 2 // (bytes_bufer * BUFER_MINIMO)))
+        tam_bufer = max(BUFER_MINIMO, memoria // 2 // aridad // bytes_bufer)
+        restantes, pasadas = mezclar_corridas(corridas, directorio, aridad, tam_bufer)
+
+        flujo = heapq.merge(*(leer_corrida(ruta, tam_bufer) for ruta in restantes))
+        escritor = EscritorPares(salida, formato, directorio)
+        try:
+            ventana_maxima = barrer(flujo, umbral, escritor.agregar, limite_ventana)
+        except BaseException:
+            escritor.abortar()
+            raise
+        escritor.cerrar()
+
+    minimo = escritor.minimo
+    return {
+        "n": n,
+        "pares": escritor.total,
+        "corridas": len(corridas),
+        "pasadas": pasadas + 1,
+        "ventana_maxima": ventana_maxima,
+        "par_mas_cercano": None if minimo is None else (minimo[1], minimo[2], minimo[0]),
+    }
+
+
+def barrer(flujo, umbral: float, agregar, limite_ventana: int) -> int:
+    """Barrido sobre (x, y, id) ordenados por x; devuelve la ventana más grande"""
+    ventana = deque()            # (x, y, id) en orden de x, para retirarlos
+    activos_y = []               # y de la ventana, ordenadas
+    activos_x = []               # x de cada activo, en el mismo orden
+    activos = []                 # id de cada activo, en el mismo orden
+    hypot = math.hypot
+    maxima = 0
+
+    for x, y, ident in flujo:
+        limite = x - umbral
+        while ventana and ventana[0][0] < limite:
+            _, yq, iq = ventana.popleft()
+            posicion = bisect_left(activos_y, yq)
+            while activos[posicion] != iq:
+                posicion += 1
+            del activos_y[posicion]
+            del activos_x[posicion]
+            del activos[posicion]
+
+        for k in range(bisect_left(activos_y, y - umbral), bisect_right(activos_y, y + umbral)):
+            d = hypot(activos_x[k] - x, activos_y[k] - y)
+            if d <= umbral:
+                iq = activos[k]
+                if iq < ident:
+                    agregar(iq, ident, d)
+                else:
+                    agregar(ident, iq, d)
+
+        posicion = bisect_right(activos_y, y)
+        activos_y.insert(posicion, y)
+        activos_x.insert(posicion, x)
+        activos.insert(posicion, ident)
+        ventana.append((x, y, ident))
+        if len(ventana) > maxima:
+            maxima = len(ventana)
+            if maxima > limite_ventana:
+                raise MemoryError(f"La ventana de ancho {umbral} supera {limite_ventana} aeronaves: "
+                                  "aumente la memoria o reduzca el umbral")
+    return maxima
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Detección en memoria externa para instantáneas grandes")
+    parser.add_argument("entrada", help="Instantánea .bin (ADAFLT01) o .csv")
+    parser.add_argument("--umbral", type=float, required=True)
+    parser.add_argument("--salida", required=True)
+    parser.add_argument("--formato", choices=("binario", "csv"), default="binario")
+    parser.add_argument("--memoria", default="256M", help="Presupuesto de memoria (p. ej. 512M, 2G)")
+    parser.add_argument("--temporal", default=None, help="Directorio para las corridas (por defecto el del sistema)")
+    args = parser.parse_args(argv)
+
+    if args.umbral <= 0:
+        parser.error("el umbral debe ser > 0")
+    resumen = conflictos_externos(args.entrada, args.umbral, args.salida, args.formato,
+                                  leer_memoria(args.memoria), args.temporal)
+    print(f"{resumen['n']} aeronaves, {resumen['pares']} pares, {resumen['corridas']} corridas, "
+          f"{resumen['pasadas']} pasadas de mezcla, ventana máxima {resumen['ventana_maxima']}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+"""
+Representación columnar de la flota (estructura de arreglos) con NumPy
+Los núcleos de distancia trabajan por lotes en lugar de par por par
+"""
+
+from __future__ import annotations
+from typing import List, Optional, Tuple
+import numpy as np
+
+
+# Tamaño del caso base: bloques pequeños se resuelven con una matriz de distancias
+TAM_CASO_BASE = 64
+
+
+class Flota:
+    """Flota de aeronaves en arreglos contiguos: xs, ys (float64) e ids (int64)"""
+
+    __slots__ = ("xs", "ys", "ids")
+
+    def __init__(self, xs, ys, ids=None):
+        self.xs = np.ascontiguousarray(xs, dtype=np.float64)
+        self.ys = np.ascontiguousarray(ys, dtype=np.float64)
+        if self.xs.shape != self.ys.shape or self.xs.ndim != 1:
+            raise ValueError("xs e ys deben ser vectores de la misma longitud")
+        if ids is None:
+            ids = np.arange(len(self.xs), dtype=np.int64)
+        self.ids = np.ascontiguousarray(ids, dtype=np.int64)
+        if self.ids.shape != self.xs.shape:
+            raise ValueError("ids debe tener la misma longitud que xs")
+
+    def __len__(self):
+        return len(self.xs)
+
+    def __repr__(self):
+        return f"Flota(n={len(self)})"
+
+    @classmethod
+    def desde_aeronaves(cls, aeronaves) -> "Flota":
+        """Construye la flota a partir de una lista de objetos con atributos x, y"""
+        n = len(aeronaves)
+        xs = np.fromiter((a.x for a in aeronaves), dtype=np.float64, count=n)
+        ys = np.fromiter((a.y for a in aeronaves), dtype=np.float64, count=n)
+        return cls(xs, ys)
+
+    def a_aeronaves(self) -> List:
+        """Convierte la flota en una lista de Aeronave (en el mismo orden)"""
+        from Project import Aeronave
+        return [Aeronave(x, y) for x, y in zip(self.xs.tolist(), self.ys.tolist())]
+
+
+def generar_flota(n: int, rng: Optional[np.random.Generator] = None) -> Flota:
+    """Genera n aeronaves en posiciones aleatorias (0-100) directamente en columnas"""
+    if rng is None:
+        rng = np.random.default_rng()
+    return Flota(rng.uniform(0, 100, n), rng.uniform(0, 100, n))
+
+
+# NÚCLEOS VECTORIZADOS
+
+def distancias(flota: Flota, pares: np.ndarray) -> np.ndarray:
+    """Distancia euclidiana de cada par (k, 2) de posiciones de la flota"""
+    pares = np.asarray(pares, dtype=np.int64).reshape(-1, 2)
+    return np.hypot(flota.xs[pares[:, 0]] - flota.xs[pares[:, 1]],
+                    flota.ys[pares[:, 0]] - flota.ys[pares[:, 1]])
+
+
+def _pares_bloque(xs, ys, inicio, fin, umbral2):
+    """Caso base: todos los pares del bloque [inicio, fin) con una matriz de distancias"""
+    bx = xs[inicio:fin]
+    by = ys[inicio:fin]
+    dx = bx[:, None] - bx[None, :]
+    dy = by[:, None] - by[None, :]
+    i, j = np.nonzero(np.triu(dx * dx + dy * dy <= umbral2, k=1))
+    return i + inicio, j + inicio
+
+
+def _pares_banda(xs, ys, izq, der, umbral, umbral2):
+    """Pares cruzados entre las bandas izquierda y derecha en lote.
+
+    Para cada punto de la izquierda se busca por bisección el rango de la
+    derecha (ordenada por y) con |dy| <= umbral; no hay tope de vecinos.
+    """
+    orden = np.argsort(ys[der], kind="stable")
+    der = der[orden]
+    der_y = ys[der]
+    izq_y = ys[izq]
+
+    desde = np.searchsorted(der_y, izq_y - umbral, side="left")
+    hasta = np.searchsorted(der_y, izq_y + umbral, side="right")
+    cuentas = hasta - desde
+    total = int(cuentas.sum())
+    if total == 0:
+        return None
+
+    # Expandir cada rango [desde, hasta) en candidatos explícitos
+    i = np.repeat(izq, cuentas)
+    base = np.repeat(desde - (np.cumsum(cuentas) - cuentas), cuentas)
+    j = der[base + np.arange(total)]
+
+    dx = xs[i] - xs[j]
+    dy = ys[i] - ys[j]
+    dentro = dx * dx + dy * dy <= umbral2
+    return i[dentro], j[dentro]
+
+
+def pares_cercanos_flota(flota: Flota, umbral: float) -> np.ndarray:
+    """Divide y Vencer vectorizado sobre una Flota.
+
+    Devuelve un arreglo (k, 2) con las posiciones (i < j) de cada par con
+    distancia <= umbral, ordenado lexicográficamente. Los casos base y la
+    combinación en la banda se calculan en lote con NumPy.
+    """
+    if umbral <= 0:
+        raise ValueError("El umbral debe ser > 0")
+
+    # Ordenar por (x, y) con desempate estable
+    orden = np.lexsort((flota.ys, flota.xs))
+    xs = flota.xs[orden]
+    ys = flota.ys[orden]
+    umbral2 = umbral * umbral
+
+    partes_i = []
+    partes_j = []
+    pendientes = [(0, len(xs))]
+    while pendientes:
+        inicio, fin = pendientes.pop()
+        if fin - inicio <= TAM_CASO_BASE:
+            i, j = _pares_bloque(xs, ys, inicio, fin, umbral2)
+            partes_i.append(i)
+            partes_j.append(j)
+            continue
+
+        mitad = (inicio + fin) // 2
+        pendientes.append((inicio, mitad))
+        pendientes.append((mitad, fin))
+
+        # Banda: solo puntos de cada lado a menos de umbral en x del otro lado
+        desde = inicio + np.searchsorted(xs[inicio:mitad], xs[mitad] - umbral, side="left")
+        hasta = mitad + np.searchsorted(xs[mitad:fin], xs[mitad - 1] + umbral, side="right")
+        if desde == mitad or hasta == mitad:
+            continue
+        cruzados = _pares_banda(xs, ys, np.arange(desde, mitad), np.arange(mitad, hasta),
+                                umbral, umbral2)
+        if cruzados is not None:
+            partes_i.append(cruzados[0])
+            partes_j.append(cruzados[1])
+
+    if not partes_i:
+        return np.empty((0, 2), dtype=np.int64)
+
+    # Volver a las posiciones originales con i < j
+    i = orden[np.concatenate(partes_i)]
+    j = orden[np.concatenate(partes_j)]
+    pares = np.column_stack((np.minimum(i, j), np.maximum(i, j))).astype(np.int64, copy=False)
+    return pares[np.lexsort((pares[:, 1], pares[:, 0]))]
+
+
+def par_mas_cercano_flota(flota: Flota, pares: np.ndarray) -> Optional[Tuple[int, int]]:
+    """Par (posiciones) con menor distancia entre los pares dados, sin ordenar"""
+    pares = np.asarray(pares, dtype=np.int64).reshape(-1, 2)
+    if len(pares) == 0:
+        return None
+    k = int(np.argmin(distancias(flota, pares)))
+    return int(pares[k, 0]), int(pares[k, 1])
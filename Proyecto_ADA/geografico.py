@@ -0,0 +1,194 @@
+"""
+Modo geográfico: posiciones en latitud/longitud y umbral en kilómetros
+Cada instantánea se proyecta a un plano local para el filtro rápido (rejilla o
+Divide y Vencer vectorizado) y los candidatos se confirman con la distancia
+de círculo máximo (haversine); cerca de los polos se usa una proyección
+ortográfica sobre el plano ecuatorial
+
+Convención: Aeronave.x es la longitud y Aeronave.y la latitud, en grados.
+"""
+
+from __future__ import annotations
+import math
+import random
+from array import array
+from typing import List, Optional, Tuple
+
+from Project import Aeronave, ConjuntoConflictos, conflictos_por_rejilla
+
+try:
+    import numpy as np
+except ImportError:  # sin NumPy: proyección y haversine en Python puro
+    np = None
+
+
+RADIO_TIERRA_KM = 6371.0088  # radio medio (IUGG)
+LATITUD_MAXIMA = 89.0        # la proyección local degenera en los polos; más allá, proyectar_polar
+
+
+def distancia_geodesica(a1: Aeronave, a2: Aeronave) -> float:
+    """Distancia de círculo máximo en km entre dos aeronaves (x = lon, y = lat)"""
+    return haversine(a1.y, a1.x, a2.y, a2.x)
+
+
+def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Distancia de círculo máximo en km entre dos puntos en grados"""
+    f1, f2 = math.radians(lat1), math.radians(lat2)
+    df = f2 - f1
+    dl = math.radians(lon2 - lon1)
+    h = math.sin(df / 2) ** 2 + math.cos(f1) * math.cos(f2) * math.sin(dl / 2) ** 2
+    return 2 * RADIO_TIERRA_KM * math.asin(min(1.0, math.sqrt(h)))
+
+
+def distancias_haversine(lats, lons, i_s, j_s):
+    """Haversine de los pares (i_s[k], j_s[k]); vectorizada si NumPy está disponible"""
+    if np is not None:
+        lat = np.radians(np.asarray(lats, dtype=np.float64))
+        lon = np.radians(np.asarray(lons, dtype=np.float64))
+        i_s = np.asarray(i_s, dtype=np.int64)
+        j_s = np.asarray(j_s, dtype=np.int64)
+        f1, f2 = lat[i_s], lat[j_s]
+        h = (np.sin((f2 - f1) / 2) ** 2
+             + np.cos(f1) * np.cos(f2) * np.sin((lon[j_s] - lon[i_s]) / 2) ** 2)
+        return 2 * RADIO_TIERRA_KM * np.arcsin(np.minimum(1.0, np.sqrt(h)))
+    return array("d", (haversine(lats[i], lons[i], lats[j], lons[j]) for i, j in zip(i_s, j_s)))
+
+
+def arco_longitudes(longitudes) -> Tuple[float, float]:
+    """(centro, amplitud) en grados del menor arco que contiene todas las longitudes"""
+    ordenadas = sorted(l % 360 for l in longitudes)
+    hueco, inicio = ordenadas[0] + 360 - ordenadas[-1], ordenadas[0]
+    for anterior, siguiente in zip(ordenadas, ordenadas[1:]):
+        if siguiente - anterior > hueco:
+            hueco, inicio = siguiente - anterior, siguiente
+    amplitud = 360 - hueco
+    return (inicio + amplitud / 2 + 180) % 360 - 180, amplitud
+
+
+def proyectar(latitudes, longitudes, umbral_km: float) -> Tuple[list, list]:
+    """Proyección equirectangular local (km) que nunca alarga distancias
+
+    La latitud de referencia es la mayor |latitud| de la instantánea más
+    umbral_km: a esa latitud (y en todas las menores) la escala este-oeste
+    cos(ref)/cos(lat) es <= 1 y la norte-sur es exacta. Por eso la distancia
+    plana entre dos puntos nunca supera la geodésica, y el mismo umbral
+    sirve como filtro conservador: no se pierde ningún par. Las longitudes
+    se centran en el menor arco que las contiene (que debe abarcar menos
+    de 180°, véase arco_longitudes).
+    Solo es conservadora si la referencia no llega a LATITUD_MAXIMA; los
+    puntos más cercanos al polo van por proyectar_polar.
+    """
+    margen = math.degrees(umbral_km / RADIO_TIERRA_KM)
+    referencia = math.radians(min(LATITUD_MAXIMA, max(abs(f) for f in latitudes) + margen))
+    escala_x = RADIO_TIERRA_KM * math.cos(referencia) * math.pi / 180
+    escala_y = RADIO_TIERRA_KM * math.pi / 180
+
+    # Centro del arco de las longitudes, para no partir la región en ±180°
+    centro, _ = arco_longitudes(longitudes)
+    xs = [((l - centro + 180) % 360 - 180) * escala_x for l in longitudes]
+    ys = [f * escala_y for f in latitudes]
+    return xs, ys
+
+
+def proyectar_polar(latitudes, longitudes) -> Tuple[list, list]:
+    """Proyección ortográfica sobre el plano ecuatorial (km), para los casquetes polares
+
+    Es la proyección lineal de la cuerda 3D, así que la distancia plana
+    nunca supera la cuerda ni, por lo tanto, la geodésica; cerca del polo
+    casi no deforma. Los dos hemisferios se superponen, lo que solo agrega
+    candidatos que haversine descarta.
+    """
+    xs, ys = [], []
+    for f, l in zip(latitudes, longitudes):
+        r = RADIO_TIERRA_KM * math.cos(math.radians(f))
+        xs.append(r * math.cos(math.radians(l)))
+        ys.append(r * math.sin(math.radians(l)))
+    return xs, ys
+
+
+def pares_candidatos(xs, ys, umbral_km: float, motor: str, indices: list) -> Tuple[list, list]:
+    """Pares (i, j) a distancia plana <= umbral_km, como índices de indices"""
+    if len(indices) < 2:
+        return [], []
+    if motor == "flota":
+        from flota import Flota, pares_cercanos_flota
+        candidatos = pares_cercanos_flota(Flota(np.array(xs), np.array(ys)), umbral_km)
+        globales = np.asarray(indices, dtype=np.int64)
+        return globales[candidatos[:, 0]].tolist(), globales[candidatos[:, 1]].tolist()
+    planos = conflictos_por_rejilla([Aeronave(x, y) for x, y in zip(xs, ys)], umbral_km)
+    return [indices[i] for i in planos.i], [indices[j] for j in planos.j]
+
+
+def conflictos_geograficos(aeronaves: List[Aeronave], umbral_km: float,
+                           motor: Optional[str] = None) -> ConjuntoConflictos:
+    """Pares a distancia de círculo máximo <= umbral_km (x = lon, y = lat)
+
+    Filtro en el plano proyectado con motor ("flota", vectorizado, por
+    defecto si hay NumPy, o "rejilla") y confirmación con haversine solo
+    para los candidatos. d es la distancia geodésica en km.
+
+    Las aeronaves cuya |latitud| más el umbral pasa LATITUD_MAXIMA forman
+    la banda polar: sus pares (con otra de la banda o con una vecina a
+    menos de un umbral de ella) se filtran en proyectar_polar; el resto,
+    en la proyección local. Así cada par se busca en una sola proyección,
+    siempre conservadora. Si las longitudes del resto abarcan 180° o más
+    (un casquete polar completo, por ejemplo), la proyección local partiría
+    la región y todas van por proyectar_polar, con un filtro más holgado.
+    """
+    if umbral_km <= 0:
+        raise ValueError("El umbral debe ser > 0")
+    conjunto = ConjuntoConflictos(aeronaves)
+    if len(aeronaves) < 2:
+        return conjunto
+    motor = motor or ("flota" if np is not None else "rejilla")
+
+    if motor not in ("flota", "rejilla"):
+        raise ValueError(f"Motor no disponible en modo geográfico: {motor}")
+    if motor == "flota" and np is None:
+        raise RuntimeError("El motor flota requiere NumPy")
+
+    lats = [a.y for a in aeronaves]
+    lons = [a.x for a in aeronaves]
+    margen = math.degrees(umbral_km / RADIO_TIERRA_KM)
+    limite = LATITUD_MAXIMA - margen
+
+    locales = [k for k, f in enumerate(lats) if abs(f) <= limite]
+    if locales and arco_longitudes([lons[k] for k in locales])[1] >= 180:
+        locales = []
+    xs, ys = proyectar([lats[k] for k in locales], [lons[k] for k in locales], umbral_km) if locales else ([], [])
+    i_s, j_s = pares_candidatos(xs, ys, umbral_km, motor, locales)
+
+    if len(locales) < len(aeronaves):
+        # Aeronaves fuera de la proyección local y sus posibles vecinas (a menos de un umbral)
+        local = bytearray(len(aeronaves))
+        for k in locales:
+            local[k] = 1
+        polares = [k for k, f in enumerate(lats) if not local[k] or abs(f) > limite - margen]
+        xs, ys = proyectar_polar([lats[k] for k in polares], [lons[k] for k in polares])
+        for i, j in zip(*pares_candidatos(xs, ys, umbral_km, motor, polares)):
+            # Los pares entre dos aeronaves locales ya salieron de la proyección local
+            if not (local[i] and local[j]):
+                i_s.append(i)
+                j_s.append(j)
+
+    distancias = distancias_haversine(lats, lons, i_s, j_s)
+    if np is not None:
+        confirmados = np.flatnonzero(np.asarray(distancias) <= umbral_km)
+        conjunto.extender(array("q", np.asarray(i_s, dtype=np.int64)[confirmados].tolist()),
+                          array("q", np.asarray(j_s, dtype=np.int64)[confirmados].tolist()),
+                          array("d", distancias[confirmados].tolist()))
+    else:
+        for i, j, d in zip(i_s, j_s, distancias):
+            if d <= umbral_km:
+                conjunto.agregar(i, j, d)
+    return conjunto
+
+
+def generar_aeronaves_geograficas(n: int, lat_min: float = 35.0, lat_max: float = 60.0,
+                                  lon_min: float = -10.0, lon_max: float = 30.0) -> List[Aeronave]:
+    """n aeronaves uniformes sobre la esfera dentro de una caja de lat/lon (por defecto, Europa)"""
+    # Uniforme en área: el seno de la latitud es uniforme
+    s_min, s_max = math.sin(math.radians(lat_min)), math.sin(math.radians(lat_max))
+    return [Aeronave(random.uniform(lon_min, lon_max),
+                     math.degrees(math.asin(random.uniform(s_min, s_max))))
+            for _ in range(n)]
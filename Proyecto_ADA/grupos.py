@@ -0,0 +1,182 @@
+"""
+Grupos de conflicto: componentes conexas del grafo "a distancia <= umbral"
+Se construyen con union-find a medida que se detectan los pares, sin guardar
+la lista de pares: la memoria es O(n) aunque un foco tenga k cuadrático.
+"""
+
+from __future__ import annotations
+import math
+from array import array
+from typing import List, Optional, Tuple
+
+from Project import Aeronave, par_mas_cercano, recorrer_dividir_y_vencer
+
+
+MODOS = ("rejilla", "pares")
+
+
+class UnionBusqueda:
+    """Union-find sobre 0..n-1 con unión por tamaño y compresión por mitades"""
+
+    def __init__(self, n: int):
+        self.padre = array("q", range(n))
+        self.tam = array("q", [1]) * n
+
+    def buscar(self, p: int) -> int:
+        padre = self.padre
+        while padre[p] != p:
+            padre[p] = padre[padre[p]]
+            p = padre[p]
+        return p
+
+    def unir(self, p: int, q: int) -> int:
+        """Une los conjuntos de p y q y devuelve la raíz resultante"""
+        rp, rq = self.buscar(p), self.buscar(q)
+        if rp == rq:
+            return rp
+        if self.tam[rp] < self.tam[rq]:
+            rp, rq = rq, rp
+        self.padre[rq] = rp
+        self.tam[rp] += self.tam[rq]
+        return rp
+
+
+class GrupoConflicto:
+    """Aeronaves conectadas por cadenas de conflictos
+
+    miembros son posiciones en la lista de aeronaves; caja es
+    (x_min, y_min, x_max, y_max); par_mas_cercano es (a, b, distancia).
+    pares es la cantidad de conflictos dentro del grupo, o None si el
+    modo no los enumeró.
+    """
+
+    def __init__(self, miembros, caja: Tuple[float, float, float, float],
+                 par_mas_cercano: Tuple[Aeronave, Aeronave, float], pares: Optional[int] = None):
+        self.miembros = miembros
+        self.caja = caja
+        self.par_mas_cercano = par_mas_cercano
+        self.pares = pares
+
+    def __len__(self):
+        return len(self.miembros)
+
+    def __repr__(self):
+        return (f"GrupoConflicto(n={len(self)}, caja=({self.caja[0]:.2f}, {self.caja[1]:.2f}, "
+                f"{self.caja[2]:.2f}, {self.caja[3]:.2f}), d_min={self.par_mas_cercano[2]:.2f})")
+
+
+def encontrar_grupos(aeronaves: List[Aeronave], umbral: float, modo: str = "rejilla") -> List[GrupoConflicto]:
+    """Grupos de conflicto (2 o más aeronaves), del más grande al más chico
+
+    modo:
+      - "rejilla": celdas de diagonal umbral; todos los puntos de una celda
+        ya están en conflicto y se unen sin calcular distancias, y entre
+        celdas vecinas basta un par para unirlas (se salta si ya están en
+        el mismo grupo). No enumera los pares; el par más cercano de cada
+        grupo se busca después en O(m log m).
+      - "pares": une cada par a medida que sale del Divide y Vencer
+        iterativo, llevando el par más cercano y la cantidad de pares por
+        grupo. Tiempo O(n log n + k), memoria O(n).
+    """
+    if umbral <= 0:
+        raise ValueError("El umbral debe ser > 0")
+    if modo not in MODOS:
+        raise ValueError(f"Modo desconocido: {modo}")
+    n = len(aeronaves)
+    if n < 2:
+        return []
+    xs = array("d", (a.x for a in aeronaves))
+    ys = array("d", (a.y for a in aeronaves))
+    grupos = UnionBusqueda(n)
+
+    if modo == "pares":
+        mejores, cuentas = unir_por_pares(xs, ys, umbral, grupos)
+    else:
+        unir_por_rejilla(xs, ys, umbral, grupos)
+
+    # Miembros por raíz, en orden de entrada
+    por_raiz = {}
+    for p in range(n):
+        raiz = grupos.buscar(p)
+        if grupos.tam[raiz] > 1:
+            miembros = por_raiz.get(raiz)
+            if miembros is None:
+                por_raiz[raiz] = miembros = array("q")
+            miembros.append(p)
+
+    resultado = []
+    for raiz, miembros in por_raiz.items():
+        caja = (min(xs[p] for p in miembros), min(ys[p] for p in miembros),
+                max(xs[p] for p in miembros), max(ys[p] for p in miembros))
+        if modo == "pares":
+            d, i, j = mejores[raiz]
+            resultado.append(GrupoConflicto(miembros, caja, (aeronaves[i], aeronaves[j], d), cuentas[raiz]))
+        else:
+            cercano = par_mas_cercano([aeronaves[p] for p in miembros])
+            resultado.append(GrupoConflicto(miembros, caja, cercano))
+    resultado.sort(key=lambda g: (-len(g), g.miembros[0]))
+    return resultado
+
+
+def unir_por_pares(xs, ys, umbral: float, grupos: UnionBusqueda):
+    """Une cada par del recorrido; devuelve {raíz: (d, i, j)} y {raíz: pares}"""
+    mejores = {}
+    cuentas = {}
+    for i, j, d in recorrer_dividir_y_vencer(xs, ys, lambda: umbral):
+        ri, rj = grupos.buscar(i), grupos.buscar(j)
+        mejor = (d, i, j)
+        cuenta = 1
+        if ri != rj:
+            for raiz in (ri, rj):
+                previo = mejores.pop(raiz, None)
+                if previo is not None and previo < mejor:
+                    mejor = previo
+                cuenta += cuentas.pop(raiz, 0)
+            raiz = grupos.unir(ri, rj)
+        else:
+            raiz = ri
+            previo = mejores[raiz]
+            if previo < mejor:
+                mejor = previo
+            cuenta += cuentas[raiz]
+        mejores[raiz] = mejor
+        cuentas[raiz] = cuenta
+    return mejores, cuentas
+
+
+# Celdas vecinas "hacia adelante" hasta dos celdas de distancia: con lado
+# umbral/√2 un conflicto puede saltar una celda completa
+VECINAS_ADELANTE_GRUPOS = tuple((ox, oy) for ox in range(0, 3) for oy in range(-2, 3)
+                                if (ox, oy) > (0, 0))
+
+
+def unir_por_rejilla(xs, ys, umbral: float, grupos: UnionBusqueda):
+    """Une los grupos con celdas de diagonal apenas menor que umbral"""
+    lado = umbral / math.sqrt(2) * (1 - 1e-9)  # margen para el redondeo en los bordes
+    celdas = {}
+    for p in range(len(xs)):
+        clave = (math.floor(xs[p] / lado), math.floor(ys[p] / lado))
+        celda = celdas.get(clave)
+        if celda is None:
+            celdas[clave] = [p]
+        else:
+            celda.append(p)
+
+    # Dentro de una celda todos están en conflicto
+    for celda in celdas.values():
+        primero = celda[0]
+        for p in celda[1:]:
+            grupos.unir(primero, p)
+
+    hypot = math.hypot
+    for (cx, cy), celda in celdas.items():
+        for ox, oy in VECINAS_ADELANTE_GRUPOS:
+            vecina = celdas.get((cx + ox, cy + oy))
+            if vecina is None or grupos.buscar(celda[0]) == grupos.buscar(vecina[0]):
+                continue
+            # Basta un conflicto para unir las dos celdas
+            for i in celda:
+                xi, yi = xs[i], ys[i]
+                if any(hypot(xs[j] - xi, ys[j] - yi) <= umbral for j in vecina):
+                    grupos.unir(i, vecina[0])
+                    break
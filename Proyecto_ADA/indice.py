@@ -0,0 +1,145 @@
+"""
+Índice espacial persistente (árbol KD) sobre una instantánea de aeronaves
+Responde consultas por radio y de vecinos más cercanos sin recalcular todos los pares
+"""
+
+from __future__ import annotations
+import heapq
+import math
+from array import array
+from typing import List, Sequence, Tuple
+
+
+class IndiceKD:
+    """Árbol KD implícito sobre una lista de aeronaves (objetos con x, y)
+
+    El árbol vive en una permutación de índices: el nodo del rango
+    [inicio, fin) guarda su punto en la mitad y divide por x o por y según
+    la profundidad. Se construye una vez por instantánea en O(n log² n) y
+    cada consulta cuesta O(log n) más el tamaño de la respuesta.
+    """
+
+    TAM_HOJA = 16
+
+    def __init__(self, aeronaves: Sequence = ()):
+        self.reconstruir(aeronaves)
+
+    def __len__(self):
+        return len(self.aeronaves)
+
+    def reconstruir(self, aeronaves: Sequence):
+        """Reconstruye el índice completo para una nueva instantánea"""
+        self.aeronaves = list(aeronaves)
+        n = len(self.aeronaves)
+        self._xs = array("d", (a.x for a in self.aeronaves))
+        self._ys = array("d", (a.y for a in self.aeronaves))
+        self._orden = array("q", range(n))
+
+        orden = self._orden
+        coordenadas = (self._xs, self._ys)
+        pila = [(0, n, 0)]
+        while pila:
+            inicio, fin, profundidad = pila.pop()
+            if fin - inicio <= self.TAM_HOJA:
+                continue
+            eje = coordenadas[profundidad & 1]
+            orden[inicio:fin] = array("q", sorted(orden[inicio:fin], key=eje.__getitem__))
+            mitad = (inicio + fin) // 2
+            pila.append((inicio, mitad, profundidad + 1))
+            pila.append((mitad + 1, fin, profundidad + 1))
+
+    def _coordenadas(self, punto) -> Tuple[float, float]:
+        if hasattr(punto, "x"):
+            return punto.x, punto.y
+        return punto[0], punto[1]
+
+    def consultar_radio(self, punto, radio: float) -> List[Tuple[object, float]]:
+        """Aeronaves a distancia <= radio de punto, como (aeronave, distancia) ordenadas
+
+        punto puede ser una Aeronave (que se excluye del resultado) o una
+        tupla (x, y).
+        """
+        x, y = self._coordenadas(punto)
+        xs, ys, orden, aeronaves = self._xs, self._ys, self._orden, self.aeronaves
+        hypot = math.hypot
+        encontrados = []
+
+        pila = [(0, len(orden), 0)]
+        while pila:
+            inicio, fin, profundidad = pila.pop()
+            if fin - inicio <= self.TAM_HOJA:
+                for k in range(inicio, fin):
+                    p = orden[k]
+                    d = hypot(xs[p] - x, ys[p] - y)
+                    if d <= radio:
+                        encontrados.append((d, p))
+                continue
+
+            mitad = (inicio + fin) // 2
+            p = orden[mitad]
+            d = hypot(xs[p] - x, ys[p] - y)
+            if d <= radio:
+                encontrados.append((d, p))
+
+            diferencia = (x - xs[p]) if profundidad & 1 == 0 else (y - ys[p])
+            if diferencia <= radio:
+                pila.append((inicio, mitad, profundidad + 1))
+            if diferencia >= -radio:
+                pila.append((mitad + 1, fin, profundidad + 1))
+
+        encontrados.sort()
+        return [(aeronaves[p], d) for d, p in encontrados if aeronaves[p] is not punto]
+
+    def vecinos_mas_cercanos(self, punto, k: int = 1) -> List[Tuple[object, float]]:
+        """Las k aeronaves más cercanas a punto, como (aeronave, distancia) ordenadas
+
+        punto puede ser una Aeronave (que se excluye del resultado) o una
+        tupla (x, y).
+        """
+        if k <= 0:
+            return []
+        x, y = self._coordenadas(punto)
+        xs, ys, orden, aeronaves = self._xs, self._ys, self._orden, self.aeronaves
+        hypot = math.hypot
+        mejores = []  # (-d, p): la raíz es el peor de los k mejores
+
+        def considerar(p):
+            if aeronaves[p] is punto:
+                return
+            d = hypot(xs[p] - x, ys[p] - y)
+            if len(mejores) < k:
+                heapq.heappush(mejores, (-d, p))
+            elif d < -mejores[0][0]:
+                heapq.heapreplace(mejores, (-d, p))
+
+        # Cada entrada lleva la distancia mínima posible a su región
+        pila = [(0, len(orden), 0, 0.0)]
+        while pila:
+            inicio, fin, profundidad, cota = pila.pop()
+            if len(mejores) == k and cota > -mejores[0][0]:
+                continue
+            if fin - inicio <= self.TAM_HOJA:
+                for indice in range(inicio, fin):
+                    considerar(orden[indice])
+                continue
+
+            mitad = (inicio + fin) // 2
+            p = orden[mitad]
+            considerar(p)
+
+            diferencia = (x - xs[p]) if profundidad & 1 == 0 else (y - ys[p])
+            cerca = (inicio, mitad) if diferencia <= 0 else (mitad + 1, fin)
+            lejos = (mitad + 1, fin) if diferencia <= 0 else (inicio, mitad)
+            # El lado lejano se apila primero para visitar antes el cercano
+            pila.append((lejos[0], lejos[1], profundidad + 1, max(cota, abs(diferencia))))
+            pila.append((cerca[0], cerca[1], profundidad + 1, cota))
+
+        return [(aeronaves[p], -d) for d, p in sorted(mejores, reverse=True)]
+
+    def consultar_radio_lote(self, puntos: Sequence, radio: float) -> List[List[Tuple[object, float]]]:
+        """consultar_radio para cada punto de la lista"""
+        return [self.consultar_radio(punto, radio) for punto in puntos]
+
+    def vecinos_lote(self, puntos: Sequence, k: int = 1) -> List[List[Tuple[object, float]]]:
+        """vecinos_mas_cercanos para cada punto de la lista"""
+        return [self.vecinos_mas_cercanos(punto, k) for punto in puntos]
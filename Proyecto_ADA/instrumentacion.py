@@ -0,0 +1,135 @@
+"""
+Instrumentación opcional del Divide y Vencer
+Recorre la recursión de Project con los mismos caso_base, dividir y
+combinar_banda, que cuentan evaluaciones de distancia, casos base, tamaños de
+banda por nivel y cortes de los 7 vecinos; aquí se miden la profundidad y los
+tiempos por fase. Sin estadísticas el motor normal solo paga una comparación
+con None por punto de la banda.
+"""
+
+from __future__ import annotations
+import json
+import time
+from typing import Dict, List
+
+from Project import Aeronave, ConjuntoConflictos, caso_base, combinar_banda, dividir, ordenar_indices
+
+
+RAIZ_TRAZA = "conflictos_dividir_y_vencer"
+
+
+class EstadisticasDeteccion:
+    """Contadores y tiempos de una ejecución instrumentada
+
+    bandas_por_nivel[nivel] = [bandas, puntos en banda, banda más grande].
+    tiempos guarda segundos por fase: ordenar, dividir, casos_base,
+    combinar y total. pilas acumula microsegundos por pila de llamadas
+    (formato plegado de los flamegraphs).
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.umbral = None
+        self.pares = 0
+        self.evaluaciones_distancia = 0
+        self.casos_base = 0
+        self.cortes_siete = 0
+        self.profundidad_maxima = 0
+        self.bandas_por_nivel: Dict[int, List[int]] = {}
+        self.tiempos = {"ordenar": 0.0, "dividir": 0.0, "casos_base": 0.0, "combinar": 0.0, "total": 0.0}
+        self.pilas: Dict[str, float] = {}
+
+    def __repr__(self):
+        return (f"EstadisticasDeteccion(n={self.n}, pares={self.pares}, "
+                f"evaluaciones={self.evaluaciones_distancia}, total={self.tiempos['total']:.4f}s)")
+
+    def registrar_banda(self, nivel: int, tam: int):
+        registro = self.bandas_por_nivel.setdefault(nivel, [0, 0, 0])
+        registro[0] += 1
+        registro[1] += tam
+        registro[2] = max(registro[2], tam)
+
+    def _registrar(self, pila: str, fase: str, segundos: float):
+        self.tiempos[fase] += segundos
+        self.pilas[pila] = self.pilas.get(pila, 0.0) + segundos * 1e6
+
+    def a_dict(self) -> dict:
+        """Estadísticas como diccionario serializable a JSON"""
+        return {
+            "n": self.n,
+            "umbral": self.umbral,
+            "pares": self.pares,
+            "evaluaciones_distancia": self.evaluaciones_distancia,
+            "casos_base": self.casos_base,
+            "cortes_siete": self.cortes_siete,
+            "profundidad_maxima": self.profundidad_maxima,
+            "bandas_por_nivel": {
+                nivel: {"bandas": bandas, "puntos": puntos, "maxima": maxima,
+                        "media": puntos / bandas if bandas else 0.0}
+                for nivel, (bandas, puntos, maxima) in sorted(self.bandas_por_nivel.items())
+            },
+            "tiempos": {fase: round(segundos, 6) for fase, segundos in self.tiempos.items()},
+        }
+
+    def volcar_json(self, archivo):
+        json.dump(self.a_dict(), archivo, indent=2)
+        archivo.write("\n")
+
+    def volcar_pilas(self, archivo):
+        """Escribe las pilas en formato plegado ("a;b;c microsegundos" por línea)
+
+        Compatible con flamegraph.pl, speedscope e inferno.
+        """
+        for pila, microsegundos in sorted(self.pilas.items()):
+            archivo.write(f"{pila} {max(1, round(microsegundos))}\n")
+
+
+def conflictos_instrumentados(aeronaves: List[Aeronave], umbral: float,
+                              estadisticas: EstadisticasDeteccion) -> ConjuntoConflictos:
+    """Igual que conflictos_dividir_y_vencer (mismos pares y orden), midiendo cada fase"""
+    reloj = time.perf_counter
+    inicio = reloj()
+    estadisticas.n = len(aeronaves)
+    estadisticas.umbral = umbral
+
+    xs = [a.x for a in aeronaves]
+    ys = [a.y for a in aeronaves]
+    conjunto = ConjuntoConflictos(aeronaves)
+
+    t = reloj()
+    puntos_x, puntos_y = ordenar_indices(xs, ys)
+    estadisticas._registrar(RAIZ_TRAZA + ";ordenar_indices", "ordenar", reloj() - t)
+
+    pilas = [RAIZ_TRAZA + ";dividir_y_vencer"]
+    _dividir_y_vencer(xs, ys, umbral, puntos_x, puntos_y, conjunto.agregar, estadisticas, 0, pilas)
+
+    estadisticas.pares = len(conjunto)
+    estadisticas.tiempos["total"] += reloj() - inicio
+    return conjunto
+
+
+def _dividir_y_vencer(xs, ys, umbral, puntos_x, puntos_y, agregar, estadisticas, nivel, pilas):
+    reloj = time.perf_counter
+    if nivel + 1 > estadisticas.profundidad_maxima:
+        estadisticas.profundidad_maxima = nivel + 1
+    if nivel == len(pilas):
+        pilas.append(pilas[-1] + ";dividir_y_vencer")
+    pila = pilas[nivel]
+
+    if len(puntos_x) <= 3:
+        t = reloj()
+        caso_base(xs, ys, umbral, puntos_x, agregar, estadisticas)
+        estadisticas._registrar(pila + ";caso_base", "casos_base", reloj() - t)
+        return
+
+    t = reloj()
+    puntos_izq_x, puntos_der_x, puntos_izq_y, puntos_der_y, x_medio = dividir(xs, puntos_x, puntos_y)
+    estadisticas._registrar(pila + ";dividir", "dividir", reloj() - t)
+
+    _dividir_y_vencer(xs, ys, umbral, puntos_izq_x, puntos_izq_y, agregar, estadisticas, nivel + 1, pilas)
+    _dividir_y_vencer(xs, ys, umbral, puntos_der_x, puntos_der_y, agregar, estadisticas, nivel + 1, pilas)
+
+    t = reloj()
+    combinar_banda(xs, ys, umbral, puntos_y, x_medio, agregar, estadisticas, nivel)
+    estadisticas._registrar(pila + ";combinar_banda", "combinar", reloj() - t)
+
@@ -0,0 +1,749 @@
+"""
+Interfaz gráfica (Tkinter) del Sistema de Detección de Colisiones Aéreas
+Separada de Project para que el núcleo pueda usarse sin cargar tkinter
+"""
+
+from __future__ import annotations
+import math
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+from Project import Aeronave, generar_aeronaves
+from analisis import AnalisisEnSegundoPlano
+from cache import CacheConflictos, huella
+from indice import IndiceKD
+
+
+# INTERFAZ GRÁFICA
+
+
+def mezclar_color(color: tuple, intensidad: float) -> str:
+    """Mezcla un color RGB con blanco según la intensidad (0-1)"""
+    r, g, b = (round(255 - (255 - c) * intensidad) for c in color)
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+class SistemaControlAereo:
+    """Interfaz gráfica del sistema de control aéreo"""
+    
+    # Niveles de detalle de la visualización
+    LIMITE_DETALLE = 5000      # más aeronaves: mapa de calor
+    LIMITE_LINEAS = 2000       # más conexiones: sin líneas individuales
+    LIMITE_ETIQUETAS = 100     # más conexiones: sin etiquetas de distancia
+    LADO_CELDA_CALOR = 8       # píxeles por celda del mapa de calor
+    
+    # Análisis en segundo plano y panel de resultados
+    INTERVALO_SONDEO = 100     # ms entre revisiones del trabajador
+    PARES_POR_PAGINA = 100
+    
+    def __init__(self, ventana):
+        self.ventana = ventana
+        self.ventana.title("✈️ Sistema de Control Aéreo - Divide y Vencer")
+        self.ventana.geometry("950x700")
+        
+        # Datos
+        self.aeronaves = []
+        self.pares_cercanos = []
+        self.par_mas_cercano = None
+        self.distancia_minima = None
+        self.indice = IndiceKD()
+        self.analisis = None
+        self.cache = CacheConflictos()
+        self.huella_aeronaves = None
+        self.umbral_analizado = None
+        self.analisis_cancelado = False
+        self.separacion_minima = None
+        self.pagina = 0
+        
+        # Configuración visual
+        self.ancho_canvas = 750
+        self.alto_canvas = 550
+        self.margen = 60
+        
+        # Crear interfaz
+        self.crear_interfaz()
+    
+    def crear_interfaz(self):
+        """Crea todos los componentes de la interfaz"""
+        
+        # Frame principal
+        main_frame = ttk.Frame(self.ventana, padding="10")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        # Configurar expansión
+        self.ventana.columnconfigure(0, weight=1)
+        self.ventana.rowconfigure(0, weight=1)
+        main_frame.columnconfigure(1, weight=1)
+        main_frame.rowconfigure(0, weight=1)
+        
+        # Título
+        titulo = ttk.Label(
+            main_frame,
+            text="ALGORITMO DIVIDE Y VENCER - DETECCIÓN DE COLISIONES",
+            font=("Arial", 16, "bold"),
+            foreground="darkblue"
+        )
+        titulo.grid(row=0, column=0, columnspan=2, pady=(0, 20))
+        
+        # PANEL DE CONTROL 
+        control_frame = ttk.LabelFrame(main_frame, text="CONTROLES", padding="15")
+        control_frame.grid(row=1, column=0, sticky=(tk.N, tk.S, tk.W), padx=(0, 15))
+        
+        # Número de aeronaves
+        ttk.Label(control_frame, text="Número de aeronaves:", 
+                 font=("Arial", 10)).grid(row=0, column=0, sticky=tk.W, pady=8)
+        
+        self.var_n = tk.StringVar(value="30")
+        ttk.Entry(control_frame, textvariable=self.var_n, width=12).grid(row=0, column=1, pady=8)
+        
+        # Separador
+        ttk.Separator(control_frame, orient="horizontal").grid(row=1, column=0, columnspan=2, pady=15, sticky=(tk.W, tk.E))
+        
+        # Umbral
+        ttk.Label(control_frame, text="Umbral de distancia:", 
+                 font=("Arial", 10)).grid(row=2, column=0, sticky=tk.W, pady=8)
+        
+        self.var_umbral = tk.StringVar(value="20.0")
+        ttk.Entry(control_frame, textvariable=self.var_umbral, width=12).grid(row=2, column=1, pady=8)
+        
+        ttk.Label(control_frame, text="Distancias ≤ este valor\nse consideran riesgosas",
+                 font=("Arial", 8), foreground="gray").grid(row=3, column=0, columnspan=2, pady=5)
+        
+        # Separador
+        ttk.Separator(control_frame, orient="horizontal").grid(row=4, column=0, columnspan=2, pady=20, sticky=(tk.W, tk.E))
+        
+        # Botones
+        btn_frame = ttk.Frame(control_frame)
+        btn_frame.grid(row=5, column=0, columnspan=2, pady=10)
+        
+        ttk.Button(btn_frame, text="Generar", 
+                  command=self.generar_aeronaves, width=15).grid(row=0, column=0, pady=5)
+        
+        ttk.Button(btn_frame, text=" Analizar", 
+                  command=self.analizar, width=15).grid(row=1, column=0, pady=5)
+        
+        ttk.Button(btn_frame, text=" Limpiar", 
+                  command=self.limpiar, width=15).grid(row=2, column=0, pady=5)
+        
+        self.btn_cancelar = ttk.Button(btn_frame, text=" Cancelar", state="disabled",
+                                       command=self.cancelar_analisis, width=15)
+        self.btn_cancelar.grid(row=3, column=0, pady=5)
+        
+        # Progreso del análisis
+        self.var_progreso = tk.DoubleVar(value=0.0)
+        ttk.Progressbar(btn_frame, variable=self.var_progreso, maximum=100,
+                        length=120).grid(row=4, column=0, pady=(10, 2))
+        self.var_estado = tk.StringVar(value="")
+        ttk.Label(btn_frame, textvariable=self.var_estado,
+                 font=("Arial", 8), foreground="gray").grid(row=5, column=0)
+        
+        # PANEL DE RESULTADOS 
+        resultados_frame = ttk.LabelFrame(control_frame, text="RESULTADOS", padding="10")
+        resultados_frame.grid(row=6, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(20, 0))
+        
+        # Texto de resultados
+        self.texto_resultados = tk.Text(
+            resultados_frame,
+            height=18,
+            width=35,
+            font=("Consolas", 9),
+            wrap=tk.WORD,
+            bg="#f8f9fa"
+        )
+        
+        # Scrollbar
+        scrollbar = ttk.Scrollbar(resultados_frame, orient="vertical", command=self.texto_resultados.yview)
+        self.texto_resultados.configure(yscrollcommand=scrollbar.set)
+        
+        self.texto_resultados.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        
+        # Paginación de los pares
+        paginas_frame = ttk.Frame(resultados_frame)
+        paginas_frame.grid(row=1, column=0, columnspan=2, pady=(5, 0))
+        ttk.Button(paginas_frame, text="◀", width=3,
+                  command=lambda: self.cambiar_pagina(-1)).grid(row=0, column=0)
+        self.var_pagina = tk.StringVar(value="")
+        ttk.Label(paginas_frame, textvariable=self.var_pagina,
+                 font=("Arial", 8)).grid(row=0, column=1, padx=8)
+        ttk.Button(paginas_frame, text="▶", width=3,
+                  command=lambda: self.cambiar_pagina(1)).grid(row=0, column=2)
+        
+        # Configurar expansión
+        resultados_frame.columnconfigure(0, weight=1)
+        resultados_frame.rowconfigure(0, weight=1)
+        control_frame.rowconfigure(6, weight=1)
+        
+        # CANVAS DE VISUALIZACIÓN 
+        canvas_frame = ttk.LabelFrame(main_frame, text="VISUALIZACIÓN", padding="10")
+        canvas_frame.grid(row=1, column=1, sticky=(tk.N, tk.S, tk.E, tk.W))
+        
+        # Configurar expansión
+        canvas_frame.columnconfigure(0, weight=1)
+        canvas_frame.rowconfigure(0, weight=1)
+        main_frame.columnconfigure(1, weight=1)
+        main_frame.rowconfigure(1, weight=1)
+        
+        # Canvas
+        self.canvas = tk.Canvas(
+            canvas_frame,
+            width=self.ancho_canvas,
+            height=self.alto_canvas,
+            bg="white",
+            relief=tk.SUNKEN,
+            bd=2
+        )
+        self.canvas.grid(row=0, column=0, sticky=(tk.N, tk.S, tk.E, tk.W))
+        self.canvas.bind("<Button-1>", self.inspeccionar)
+        
+        # LEYENDA 
+        leyenda_frame = ttk.Frame(main_frame)
+        leyenda_frame.grid(row=2, column=0, columnspan=2, pady=(15, 0))
+        
+        # Elementos de leyenda
+        ttk.Label(leyenda_frame, text="●", font=("Arial", 14), 
+                 foreground="blue").grid(row=0, column=0, padx=5)
+        ttk.Label(leyenda_frame, text="Aeronave", 
+                 font=("Arial", 9)).grid(row=0, column=1, padx=10)
+        
+        ttk.Label(leyenda_frame, text="●", font=("Arial", 14), 
+                 foreground="red").grid(row=0, column=2, padx=5)
+        ttk.Label(leyenda_frame, text="Aeronave en riesgo", 
+                 font=("Arial", 9)).grid(row=0, column=3, padx=10)
+        
+        ttk.Label(leyenda_frame, text="――", font=("Arial", 14), 
+                 foreground="red").grid(row=0, column=4, padx=5)
+        ttk.Label(leyenda_frame, text="Riesgo de colisión", 
+                 font=("Arial", 9)).grid(row=0, column=5, padx=10)
+        
+        ttk.Label(leyenda_frame, text="━━━", font=("Arial", 14), 
+                 foreground="green").grid(row=0, column=6, padx=5)
+        ttk.Label(leyenda_frame, text="Par más cercano", 
+                 font=("Arial", 9)).grid(row=0, column=7, padx=10)
+        
+        # Información del algoritmo
+        ttk.Label(main_frame, 
+                 text="Algoritmo: Divide y Vencerás puro | Complejidad: O(n log n)",
+                 font=("Arial", 9, "italic"),
+                 foreground="gray").grid(row=3, column=0, columnspan=2, pady=(10, 0))
+        
+        # Dibujar mensaje inicial
+        self.dibujar_mensaje_inicial()
+    
+    def dibujar_mensaje_inicial(self):
+        """Dibuja mensaje de bienvenida en el canvas"""
+        self.canvas.delete("all")
+        
+        # Elementos reutilizables de la escena (se recrean tras borrar todo)
+        self.fondo_dibujado = False
+        self.items_aeronaves = []
+        self.estados_aeronaves = []
+        self.aeronaves_dibujadas = None
+        
+        # Fondo
+        self.canvas.create_rectangle(0, 0, self.ancho_canvas, self.alto_canvas, 
+                                    fill="#f0f8ff", outline="")
+        
+        # Título
+        self.canvas.create_text(self.ancho_canvas/2, self.alto_canvas/2 - 50,
+                               text="SISTEMA DE CONTROL AÉREO",
+                               font=("Arial", 20, "bold"),
+                               fill="navy")
+        
+        # Subtítulo
+        self.canvas.create_text(self.ancho_canvas/2, self.alto_canvas/2 - 15,
+                               text="Algoritmo Divide y Vencer",
+                               font=("Arial", 14),
+                               fill="darkblue")
+        
+        # Instrucciones
+        instrucciones = [
+            "1. Ingrese el número de aeronaves",
+            "2. Establezca el umbral de distancia",
+            "3. Haga clic en 'Generar'",
+            "4. Luego en 'Analizar'",
+            "",
+            "El par más cercano se mostrará",
+            "con línea verde gruesa",
+            "y las demás con líneas rojas."
+        ]
+        
+        y = self.alto_canvas/2 + 30
+        for linea in instrucciones:
+            self.canvas.create_text(self.ancho_canvas/2, y,
+                                   text=linea,
+                                   font=("Arial", 10),
+                                   fill="gray")
+            y += 25
+    
+    def convertir_coordenadas(self, punto: Aeronave) -> tuple:
+        """Convierte coordenadas (0-100) a píxeles del canvas"""
+        x_pixel = self.margen + (punto.x / 100) * (self.ancho_canvas - 2 * self.margen)
+        y_pixel = self.alto_canvas - self.margen - (punto.y / 100) * (self.alto_canvas - 2 * self.margen)
+        return x_pixel, y_pixel
+    
+    def convertir_pixeles(self, x_pixel: float, y_pixel: float) -> tuple:
+        """Convierte píxeles del canvas a coordenadas (0-100)"""
+        x = (x_pixel - self.margen) / (self.ancho_canvas - 2 * self.margen) * 100
+        y = (self.alto_canvas - self.margen - y_pixel) / (self.alto_canvas - 2 * self.margen) * 100
+        return x, y
+    
+    def inspeccionar(self, evento):
+        """Muestra la aeronave más cercana al clic y sus vecinas dentro del umbral"""
+        if not self.aeronaves:
+            return
+        cercana = self.indice.vecinos_mas_cercanos(self.convertir_pixeles(evento.x, evento.y), 1)
+        if not cercana:
+            return
+        aeronave = cercana[0][0]
+        
+        try:
+            umbral = float(self.var_umbral.get())
+        except ValueError:
+            umbral = 0.0
+        
+        texto = f"AERONAVE {aeronave}\n"
+        texto += "―" * 20 + "\n"
+        if umbral > 0:
+            vecinas = self.indice.consultar_radio(aeronave, umbral)
+            texto += f"Aeronaves a ≤ {umbral:.2f}: {len(vecinas)}\n\n"
+            for otra, d in vecinas:
+                texto += f"  • {otra}  d = {d:.3f}\n"
+        self.mostrar_resultado(texto)
+    
+    def generar_aeronaves(self):
+        """Genera nuevas aeronaves aleatorias"""
+        try:
+            n = int(self.var_n.get())
+            
+            if n < 2:
+                messagebox.showerror("Error", "Mínimo 2 aeronaves")
+                return
+            
+            self.detener_analisis()
+            self.aeronaves = generar_aeronaves(n)
+            self.indice.reconstruir(self.aeronaves)
+            self.huella_aeronaves = huella(self.aeronaves)
+            self.pares_cercanos = []
+            self.par_mas_cercano = None
+            
+            self.mostrar_resultado(f"Aeronaves generadas: {n}\nListo para analizar.")
+            self.dibujar_escena()
+            
+        except ValueError:
+            messagebox.showerror("Error", "Número inválido")
+    
+    def analizar(self):
+        """Lanza el Divide y Vencer en un hilo trabajador sin bloquear la ventana"""
+        try:
+            if not self.aeronaves:
+                messagebox.showwarning("Atención", "Primero genere aeronaves")
+                return
+            
+            umbral = float(self.var_umbral.get())
+            
+            if umbral <= 0:
+                messagebox.showerror("Error", "Umbral debe ser > 0")
+                return
+            
+            self.detener_analisis()
+            self.umbral_analizado = umbral
+            self.pagina = 0
+            
+            # Misma instantánea con un umbral menor o igual: se filtra el resultado guardado
+            conjunto = self.cache.buscar(self.aeronaves, umbral, "iterativo", self.huella_aeronaves)
+            if conjunto is not None:
+                self.pares_cercanos = conjunto
+                self.analisis_cancelado = False
+                self.var_estado.set("Completado (caché)")
+                self.var_progreso.set(100.0)
+                self.mostrar_analisis()
+                return
+            
+            # EJECUTAR ALGORITMO DIVIDE Y VENCER (en segundo plano)
+            self.analisis = AnalisisEnSegundoPlano(self.aeronaves, umbral).iniciar()
+            
+            # Los pares parciales se dibujan a medida que llegan
+            self.pares_cercanos = self.analisis.conjunto
+            self.par_mas_cercano = None
+            self.distancia_minima = None
+            
+            self.btn_cancelar.configure(state="normal")
+            self.var_progreso.set(0.0)
+            self.var_pagina.set("")
+            self.mostrar_resultado(f"Analizando {len(self.aeronaves)} aeronaves...\n"
+                                   f"Umbral: {umbral:.2f}")
+            self.sondear_analisis(self.analisis)
+            
+        except ValueError:
+            messagebox.showerror("Error", "Umbral inválido")
+    
+    def sondear_analisis(self, analisis: AnalisisEnSegundoPlano):
+        """Recoge los pares del trabajador y actualiza progreso y dibujo"""
+        if analisis is not self.analisis:
+            return  # análisis reemplazado o detenido
+        
+        nuevos = analisis.recoger()
+        self.var_progreso.set(100 * analisis.progreso)
+        self.var_estado.set(f"{100 * analisis.progreso:.0f}% · {len(analisis.conjunto)} pares")
+        
+        if analisis.finalizado:
+            self.finalizar_analisis(analisis)
+            return
+        if nuevos:
+            self.dibujar_escena()
+        self.ventana.after(self.INTERVALO_SONDEO, self.sondear_analisis, analisis)
+    
+    def finalizar_analisis(self, analisis: AnalisisEnSegundoPlano):
+        """Muestra los resultados finales (o parciales, si se canceló)"""
+        self.analisis = None
+        self.btn_cancelar.configure(state="disabled")
+        
+        if analisis.error is not None:
+            self.var_estado.set("Error")
+            messagebox.showerror("Error", f"El análisis falló: {analisis.error}")
+            return
+        self.var_estado.set("Cancelado" if analisis.cancelado else "Completado")
+        self.analisis_cancelado = analisis.cancelado
+        self.separacion_minima = analisis.separacion_minima
+        if not analisis.cancelado and analisis.aeronaves is self.aeronaves:
+            self.cache.guardar(self.aeronaves, analisis.umbral, self.pares_cercanos,
+                               "iterativo", self.huella_aeronaves)
+        self.mostrar_analisis()
+    
+    def mostrar_analisis(self):
+        """Par más cercano, resultados y dibujo del análisis terminado"""
+        # Encontrar el par más cercano (distancia ya calculada)
+        minimo = self.pares_cercanos.minimo()
+        self.par_mas_cercano = None if minimo is None else minimo[:2]
+        self.distancia_minima = None if minimo is None else minimo[2]
+        
+        # Mostrar resultados
+        self.mostrar_resultados_completos(self.umbral_analizado)
+        
+        # Actualizar visualización
+        self.dibujar_escena()
+    
+    def cancelar_analisis(self):
+        """Botón Cancelar: el trabajador se detiene y se muestran los pares parciales"""
+        if self.analisis is not None:
+            self.analisis.cancelar()
+    
+    def detener_analisis(self):
+        """Cancela el análisis en curso y descarta sus resultados"""
+        if self.analisis is not None:
+            self.analisis.cancelar()
+            self.analisis = None
+            self.btn_cancelar.configure(state="disabled")
+            self.var_estado.set("")
+            self.var_progreso.set(0.0)
+    
+    def cambiar_pagina(self, paso: int):
+        """Avanza o retrocede una página en la lista de pares"""
+        if self.analisis is not None or not self.pares_cercanos:
+            return
+        paginas = math.ceil(len(self.pares_cercanos) / self.PARES_POR_PAGINA)
+        pagina = min(max(self.pagina + paso, 0), paginas - 1)
+        if pagina != self.pagina:
+            self.pagina = pagina
+            self.mostrar_resultados_completos(self.umbral_analizado)
+    
+    def mostrar_resultado(self, mensaje: str):
+        """Muestra un mensaje simple"""
+        self.texto_resultados.delete(1.0, tk.END)
+        self.texto_resultados.insert(1.0, mensaje)
+    
+    def mostrar_resultados_completos(self, umbral: float):
+        """Muestra el resumen del análisis y una página de pares por distancia"""
+        texto = "=" * 40 + "\n"
+        texto += "   ANÁLISIS CANCELADO (PARCIAL)   \n" if self.analisis_cancelado else "   ANÁLISIS COMPLETADO   \n"
+        texto += "=" * 40 + "\n\n"
+        
+        texto += "RESULTADOS\n"
+        texto += "―" * 20 + "\n"
+        texto += f"Aeronaves: {len(self.aeronaves)}\n"
+        texto += f"Umbral: {umbral:.2f}\n"
+        texto += f"Pares cercanos encontrados: {len(self.pares_cercanos)}\n\n"
+        
+        if self.pares_cercanos:
+            if self.par_mas_cercano:
+                a, b = self.par_mas_cercano
+                dist_min = self.distancia_minima
+                texto += "PAR MÁS CERCANO \n"
+                texto += "―" * 20 + "\n"
+                texto += f"A: {a}\n"
+                texto += f"B: {b}\n"
+                texto += f"Distancia: {dist_min:.3f}\n\n"
+            
+            texto += "AERONAVES EN RIESGO \n"
+            texto += "―" * 30 + "\n\n"
+            
+            # Solo la página actual, por distancia (sin recalcularlas)
+            total = len(self.pares_cercanos)
+            paginas = math.ceil(total / self.PARES_POR_PAGINA)
+            inicio = self.pagina * self.PARES_POR_PAGINA
+            pagina = self.pares_cercanos.pagina(inicio, self.PARES_POR_PAGINA)
+            self.var_pagina.set(f"Página {self.pagina + 1} de {paginas}")
+            
+            for i, (a, b, dist) in enumerate(pagina, inicio + 1):
+                # Marcar el par más cercano con un indicador especial
+                if (a, b) == self.par_mas_cercano or (b, a) == self.par_mas_cercano:
+                    texto += f"Par {i} [MÁS CERCANO]:\n"
+                else:
+                    texto += f"Par {i}:\n"
+                
+                texto += f"  • A: {a}\n"
+                texto += f"  • B: {b}\n"
+                texto += f"  • Distancia: {dist:.3f}\n"
+                
+                if i < total:
+                    texto += "  ―――――――――――――――――\n"
+            
+            texto += f"\nTotal de conexiones de riesgo: {len(self.pares_cercanos)}\n"
+        else:
+            texto += "TODAS LAS AERONAVES ESTÁN SEGURAS\n"
+            texto += "No hay pares con distancia ≤ umbral\n"
+            
+            # Separación mínima real (calculada por el trabajador), aunque supere el umbral
+            self.var_pagina.set("")
+            if self.separacion_minima is not None:
+                texto += f"Separación mínima: {self.separacion_minima:.3f}\n"
+        
+        texto += "\n" + "=" * 40 + "\n"
+        texto += "INFORMACIÓN DEL ALGORITMO\n"
+        texto += "―" * 25 + "\n"
+        texto += "• Técnica: Divide y Vencer\n"
+        texto += "• Complejidad: O(n log n)\n"
+        texto += "• Caso base: n ≤ 3\n"
+        texto += "• Búsqueda en banda: O(n)\n"
+        
+        estadisticas = self.cache.estadisticas()
+        texto += f"• Caché: {estadisticas['aciertos']} aciertos / {estadisticas['fallos']} fallos\n"
+        
+        self.texto_resultados.delete(1.0, tk.END)
+        self.texto_resultados.insert(1.0, texto)
+    
+    def dibujar_escena(self):
+        """Dibuja aeronaves y conexiones reutilizando los elementos del canvas"""
+        if not self.fondo_dibujado:
+            # Primera escena tras el mensaje inicial: cuadrícula y ejes una sola vez
+            self.canvas.delete("all")
+            self.dibujar_cuadricula()
+            self.dibujar_ejes()
+            self.fondo_dibujado = True
+        self.canvas.delete("conexion", "etiqueta", "destacado", "calor")
+        
+        # Aeronaves en riesgo (índices), calculadas una sola vez en O(k)
+        en_riesgo = set()
+        if self.pares_cercanos:
+            en_riesgo.update(self.pares_cercanos.i)
+            en_riesgo.update(self.pares_cercanos.j)
+        
+        # Muchas aeronaves: mapa de calor en lugar de un óvalo por aeronave
+        if len(self.aeronaves) > self.LIMITE_DETALLE:
+            self.canvas.itemconfigure("aeronave", state="hidden")
+            self.dibujar_mapa_calor(en_riesgo)
+        else:
+            self.dibujar_aeronaves(en_riesgo)
+        
+        self.dibujar_conexiones()
+        
+        # Ejes siempre por encima
+        self.canvas.tag_raise("ejes")
+    
+    def dibujar_aeronaves(self, en_riesgo: set):
+        """Mueve o reconfigura los óvalos existentes; solo crea los que faltan"""
+        n = len(self.aeronaves)
+        items = self.items_aeronaves
+        estados = self.estados_aeronaves
+        misma_escena = self.aeronaves_dibujadas is self.aeronaves and len(items) == n
+        
+        # Ajustar la cantidad de óvalos a la cantidad de aeronaves
+        while len(items) < n:
+            items.append(self.canvas.create_oval(0, 0, 0, 0, tags="aeronave"))
+            estados.append(None)
+        while len(items) > n:
+            self.canvas.delete(items.pop())
+            estados.pop()
+        
+        for indice, aeronave in enumerate(self.aeronaves):
+            riesgo = indice in en_riesgo
+            # Misma instantánea: solo tocar las aeronaves que cambiaron de estado
+            if misma_escena and estados[indice] == riesgo:
+                continue
+            
+            x, y = self.convertir_coordenadas(aeronave)
+            item = items[indice]
+            if riesgo:
+                # Aeronave en riesgo
+                self.canvas.coords(item, x-7, y-7, x+7, y+7)
+                self.canvas.itemconfigure(item, fill="#ffcccc", outline="red", width=2)
+            else:
+                # Aeronave segura
+                self.canvas.coords(item, x-5, y-5, x+5, y+5)
+                self.canvas.itemconfigure(item, fill="blue", outline="darkblue", width=1)
+            estados[indice] = riesgo
+        
+        self.canvas.itemconfigure("aeronave", state="normal")
+        self.aeronaves_dibujadas = self.aeronaves
+        
+        # Etiqueta para pocas aeronaves
+        if n <= 50:
+            for aeronave in self.aeronaves:
+                x, y = self.convertir_coordenadas(aeronave)
+                self.canvas.create_text(x, y-12,
+                                       text=f"({aeronave.x:.0f},{aeronave.y:.0f})",
+                                       font=("Arial", 7), tags="etiqueta")
+    
+    def dibujar_mapa_calor(self, en_riesgo: set):
+        """Nivel de detalle para muchas aeronaves: celdas coloreadas por densidad"""
+        lado = self.LADO_CELDA_CALOR
+        ancho = self.ancho_canvas - 2 * self.margen
+        alto = self.alto_canvas - 2 * self.margen
+        columnas = max(1, math.ceil(ancho / lado))
+        filas = max(1, math.ceil(alto / lado))
+        
+        # Contar aeronaves (y aeronaves en riesgo) por celda
+        cuentas = {}
+        riesgos = {}
+        for indice, aeronave in enumerate(self.aeronaves):
+            cx = min(columnas - 1, max(0, int(aeronave.x / 100 * columnas)))
+            cy = min(filas - 1, max(0, int(aeronave.y / 100 * filas)))
+            cuentas[(cx, cy)] = cuentas.get((cx, cy), 0) + 1
+            if indice in en_riesgo:
+                riesgos[(cx, cy)] = riesgos.get((cx, cy), 0) + 1
+        
+        maximo = max(cuentas.values(), default=1)
+        for (cx, cy), cuenta in cuentas.items():
+            intensidad = 0.15 + 0.85 * cuenta / maximo
+            # Celdas con alguna aeronave en riesgo en rojo; el resto en azul
+            color = (220, 20, 20) if (cx, cy) in riesgos else (20, 60, 200)
+            x0 = self.margen + cx * ancho / columnas
+            y1 = self.alto_canvas - self.margen - cy * alto / filas
+            self.canvas.create_rectangle(x0, y1 - alto / filas, x0 + ancho / columnas, y1,
+                                        fill=mezclar_color(color, intensidad),
+                                        outline="", tags="calor")
+        
+        self.canvas.tag_raise("calor", "fondo")
+    
+    def dibujar_conexiones(self):
+        """Líneas de riesgo y par más cercano, con etiquetas solo si son pocas"""
+        total = len(self.pares_cercanos)
+        
+        if total > self.LIMITE_LINEAS:
+            # Demasiadas conexiones: el riesgo se ve en las aeronaves o en el mapa de calor
+            self.canvas.create_text(self.margen + 5, self.margen - 20, anchor=tk.W,
+                                   text=f"{total} conexiones de riesgo (líneas ocultas)",
+                                   font=("Arial", 8), fill="darkred", tags="etiqueta")
+        else:
+            con_etiquetas = total <= self.LIMITE_ETIQUETAS
+            
+            # Primero dibujar todas las conexiones rojas (excepto el par más cercano si existe)
+            for a, b, dist in self.pares_cercanos:
+                if self.par_mas_cercano and ((a, b) == self.par_mas_cercano or (b, a) == self.par_mas_cercano):
+                    continue  # Saltar el par más cercano para dibujarlo después
+                    
+                x1, y1 = self.convertir_coordenadas(a)
+                x2, y2 = self.convertir_coordenadas(b)
+                
+                # Línea roja normal
+                self.canvas.create_line(x1, y1, x2, y2,
+                                       fill="red", width=2, tags="conexion")
+                
+                # Distancia en el punto medio
+                if con_etiquetas:
+                    mx, my = (x1 + x2) / 2, (y1 + y2) / 2
+                    self.canvas.create_text(mx, my-10,
+                                           text=f"{dist:.1f}",
+                                           font=("Arial", 8),
+                                           fill="darkred", tags="etiqueta")
+        
+        # Dibujar el par más cercano en verde (si existe)
+        if self.par_mas_cercano:
+            a, b = self.par_mas_cercano
+            x1, y1 = self.convertir_coordenadas(a)
+            x2, y2 = self.convertir_coordenadas(b)
+            
+            # Línea verde gruesa para el par más cercano
+            self.canvas.create_line(x1, y1, x2, y2,
+                                   fill="green", width=4, dash=(5, 2), tags="destacado")
+            
+            # Resaltar las aeronaves del par más cercano
+            self.canvas.create_oval(x1-8, y1-8, x1+8, y1+8,
+                                   outline="green", width=3, tags="destacado")
+            self.canvas.create_oval(x2-8, y2-8, x2+8, y2+8,
+                                   outline="green", width=3, tags="destacado")
+            
+            # Distancia en el punto medio con fondo
+            mx, my = (x1 + x2) / 2, (y1 + y2) / 2
+            dist = self.distancia_minima
+            
+            # Fondo para el texto
+            self.canvas.create_rectangle(mx-25, my-20, mx+25, my+5,
+                                        fill="white", outline="green", width=2, tags="destacado")
+            
+            self.canvas.create_text(mx, my-7,
+                                   text=f"{dist:.1f}",
+                                   font=("Arial", 9, "bold"),
+                                   fill="darkgreen", tags="destacado")
+            
+            # Etiqueta "MÁS CERCANO"
+            self.canvas.create_text(mx, my+15,
+                                   text="MÁS CERCANO",
+                                   font=("Arial", 8, "bold"),
+                                   fill="darkgreen", tags="destacado")
+    
+    def dibujar_cuadricula(self):
+        """Dibuja cuadrícula de referencia"""
+        # Vertical
+        for i in range(0, 101, 10):
+            x = self.margen + (i / 100) * (self.ancho_canvas - 2 * self.margen)
+            self.canvas.create_line(x, self.margen, x, self.alto_canvas - self.margen,
+                                   fill="#e8e8e8", width=1, tags="fondo")
+            
+            if i % 20 == 0:
+                self.canvas.create_text(x, self.alto_canvas - self.margen + 15,
+                                       text=str(i), font=("Arial", 8), tags="fondo")
+        
+        # Horizontal
+        for i in range(0, 101, 10):
+            y = self.alto_canvas - self.margen - (i / 100) * (self.alto_canvas - 2 * self.margen)
+            self.canvas.create_line(self.margen, y, self.ancho_canvas - self.margen, y,
+                                   fill="#e8e8e8", width=1, tags="fondo")
+            
+            if i % 20 == 0:
+                self.canvas.create_text(self.margen - 15, y,
+                                       text=str(i), font=("Arial", 8), tags="fondo")
+    
+    def dibujar_ejes(self):
+        """Dibuja ejes X e Y"""
+        # Eje X
+        self.canvas.create_line(self.margen, self.alto_canvas - self.margen,
+                               self.ancho_canvas - self.margen, self.alto_canvas - self.margen,
+                               fill="black", width=2, tags="ejes")
+        
+        # Eje Y
+        self.canvas.create_line(self.margen, self.margen,
+                               self.margen, self.alto_canvas - self.margen,
+                               fill="black", width=2, tags="ejes")
+        
+        # Etiquetas
+        self.canvas.create_text(self.ancho_canvas - self.margen + 20,
+                               self.alto_canvas - self.margen,
+                               text="X", font=("Arial", 10, "bold"), tags="ejes")
+        
+        self.canvas.create_text(self.margen, self.margen - 20,
+                               text="Y", font=("Arial", 10, "bold"), tags="ejes")
+    
+    def limpiar(self):
+        """Limpia toda la simulación"""
+        self.detener_analisis()
+        self.canvas.delete("all")
+        self.aeronaves = []
+        self.indice.reconstruir([])
+        self.huella_aeronaves = None
+        self.pares_cercanos = []
+        self.par_mas_cercano = None
+        self.texto_resultados.delete(1.0, tk.END)
+        self.var_pagina.set("")
+        self.dibujar_mensaje_inicial()
@@ -0,0 +1,135 @@
+"""
+Divide y Vencer en paralelo con varios procesos
+Las coordenadas se comparten por memoria compartida; las bandas se combinan en el proceso padre
+"""
+
+from __future__ import annotations
+import math
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.util import Finalize
+from typing import List, Optional
+
+from Project import (Aeronave, ConjuntoConflictos, dividir_y_vencer, caso_base,
+                     dividir, combinar_banda, ordenar_indices)
+
+
+# Estado de cada proceso trabajador (se fija en _iniciar_trabajador)
+_memoria = None
+_coordenadas = None
+_xs = None
+_ys = None
+
+
+def _iniciar_trabajador(nombre: str, n: int):
+    """Conecta el trabajador al bloque de memoria compartida con las coordenadas
+
+    El bloque se cierra al terminar el trabajador. Finalize de
+    multiprocessing corre también en los procesos creados con fork, que
+    salen con os._exit sin pasar por atexit.
+    """
+    global _memoria, _coordenadas, _xs, _ys
+    _memoria = SharedMemory(name=nombre)
+    _coordenadas = _memoria.buf.cast("d")
+    _xs = _coordenadas[:n]
+    _ys = _coordenadas[n:2 * n]
+    Finalize(None, _cerrar_trabajador, exitpriority=10)
+
+
+def _cerrar_trabajador():
+    """Libera las vistas (si no, close lanza BufferError) y cierra el bloque"""
+    global _memoria, _coordenadas, _xs, _ys
+    if _memoria is None:
+        return
+    for vista in (_xs, _ys, _coordenadas):
+        vista.release()
+    _memoria.close()
+    _memoria = _coordenadas = _xs = _ys = None
+
+
+def _resolver_subproblema(puntos_x: array, puntos_y: array, umbral: float):
+    """Resuelve un subárbol completo en el trabajador y devuelve (i, j, d)"""
+    i_s = array("q")
+    j_s = array("q")
+    d_s = array("d")
+
+    def agregar(i, j, d):
+        i_s.append(i)
+        j_s.append(j)
+        d_s.append(d)
+
+    dividir_y_vencer(_xs, _ys, umbral, list(puntos_x), list(puntos_y), agregar)
+    return i_s, j_s, d_s
+
+
+def conflictos_paralelo(aeronaves: List[Aeronave], umbral: float,
+                        procesos: Optional[int] = None,
+                        niveles: Optional[int] = None) -> ConjuntoConflictos:
+    """Igual que conflictos_dividir_y_vencer, repartiendo los subárboles entre procesos
+
+    Los primeros `niveles` de la recursión se dividen en el padre; cada
+    subárbol resultante se resuelve en un trabajador y las bandas de esos
+    niveles se combinan en el padre mientras los trabajadores avanzan. El
+    resultado (pares y orden) es idéntico al del motor secuencial.
+    """
+    n = len(aeronaves)
+    procesos = procesos or os.cpu_count() or 1
+    if niveles is None:
+        # Unos dos subárboles por proceso para equilibrar la carga
+        niveles = max(1, math.ceil(math.log2(procesos)) + 1)
+
+    conjunto = ConjuntoConflictos(aeronaves)
+    if n < 2:
+        return conjunto
+
+    memoria = SharedMemory(create=True, size=2 * n * 8)
+    coordenadas = xs = ys = None
+    try:
+        coordenadas = memoria.buf.cast("d")
+        coordenadas[:n] = array("d", (a.x for a in aeronaves))
+        coordenadas[n:] = array("d", (a.y for a in aeronaves))
+        xs = coordenadas[:n]
+        ys = coordenadas[n:]
+
+        with ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_trabajador,
+                                 initargs=(memoria.name, n)) as pool:
+            # Segmentos en el mismo orden en que los emitiría la recursión secuencial
+            segmentos = []
+
+            def planificar(puntos_x, puntos_y, nivel):
+                if len(puntos_x) <= 3:
+                    banda = ConjuntoConflictos(aeronaves)
+                    caso_base(xs, ys, umbral, puntos_x, banda.agregar)
+                    segmentos.append(banda)
+                    return
+                if nivel == niveles:
+                    segmentos.append(pool.submit(_resolver_subproblema, array("q", puntos_x),
+                                                 array("q", puntos_y), umbral))
+                    return
+                izq_x, der_x, izq_y, der_y, x_medio = dividir(xs, puntos_x, puntos_y)
+                planificar(izq_x, izq_y, nivel + 1)
+                planificar(der_x, der_y, nivel + 1)
+                banda = ConjuntoConflictos(aeronaves)
+                combinar_banda(xs, ys, umbral, puntos_y, x_medio, banda.agregar)
+                segmentos.append(banda)
+
+            puntos_x, puntos_y = ordenar_indices(xs, ys)
+            planificar(puntos_x, puntos_y, 0)
+
+            for segmento in segmentos:
+                if isinstance(segmento, ConjuntoConflictos):
+                    i_s, j_s, d_s = segmento.i, segmento.j, segmento.d
+                else:
+                    i_s, j_s, d_s = segmento.result()
+                conjunto.extender(i_s, j_s, d_s)
+    finally:
+        # Las vistas deben liberarse antes de cerrar el bloque
+        for vista in (xs, ys, coordenadas):
+            if vista is not None:
+                vista.release()
+        memoria.close()
+        memoria.unlink()
+
+    return conjunto
@@ -0,0 +1,175 @@
+"""
+Detección predictiva de conflictos con velocidades
+Responde qué pares se acercarán a <= umbral en los próximos T segundos y cuándo
+ocurre su punto de máximo acercamiento (CPA)
+"""
+
+from __future__ import annotations
+import math
+from array import array
+from typing import Iterator, List, Optional, Tuple
+
+from Project import Aeronave
+
+
+class ConflictosPrevistos:
+    """Pares que entrarán en conflicto dentro del horizonte, en arreglos tipados
+
+    Para el par k: i[k], j[k] son posiciones en aeronaves, entrada[k] el
+    instante en que la distancia baja a umbral (0 si ya están en conflicto),
+    t_cpa[k] el instante del máximo acercamiento dentro del horizonte y
+    d_cpa[k] la distancia en ese instante.
+    """
+
+    def __init__(self, aeronaves, umbral: float, horizonte: float):
+        self.aeronaves = aeronaves
+        self.umbral = umbral
+        self.horizonte = horizonte
+        self.i = array("q")
+        self.j = array("q")
+        self.entrada = array("d")
+        self.t_cpa = array("d")
+        self.d_cpa = array("d")
+
+    def agregar(self, i: int, j: int, entrada: float, t_cpa: float, d_cpa: float):
+        self.i.append(i)
+        self.j.append(j)
+        self.entrada.append(entrada)
+        self.t_cpa.append(t_cpa)
+        self.d_cpa.append(d_cpa)
+
+    def __len__(self):
+        return len(self.i)
+
+    def __bool__(self):
+        return len(self.i) > 0
+
+    def __iter__(self) -> Iterator[Tuple[Aeronave, Aeronave, float, float, float]]:
+        """Recorre (a, b, entrada, t_cpa, d_cpa) en el orden de detección"""
+        aeronaves = self.aeronaves
+        for k in range(len(self.i)):
+            yield (aeronaves[self.i[k]], aeronaves[self.j[k]],
+                   self.entrada[k], self.t_cpa[k], self.d_cpa[k])
+
+    def __repr__(self):
+        return f"ConflictosPrevistos(k={len(self)}, horizonte={self.horizonte})"
+
+    def por_urgencia(self) -> List[Tuple[Aeronave, Aeronave, float, float, float]]:
+        """Los conflictos ordenados por instante de entrada (el más urgente primero)"""
+        orden = sorted(range(len(self.i)), key=self.entrada.__getitem__)
+        aeronaves = self.aeronaves
+        return [(aeronaves[self.i[k]], aeronaves[self.j[k]],
+                 self.entrada[k], self.t_cpa[k], self.d_cpa[k]) for k in orden]
+
+
+# FASE FINA: GEOMETRÍA EXACTA DEL PAR
+
+def maximo_acercamiento(dx: float, dy: float, dvx: float, dvy: float,
+                        horizonte: float) -> Tuple[float, float]:
+    """(t_cpa, d_cpa) para la posición relativa (dx, dy) y velocidad relativa (dvx, dvy)
+
+    t_cpa se limita a [0, horizonte].
+    """
+    v2 = dvx * dvx + dvy * dvy
+    t = 0.0 if v2 == 0 else min(horizonte, max(0.0, -(dx * dvx + dy * dvy) / v2))
+    return t, math.hypot(dx + dvx * t, dy + dvy * t)
+
+
+def instante_de_entrada(dx: float, dy: float, dvx: float, dvy: float,
+                        umbral: float, horizonte: float) -> Optional[float]:
+    """Primer t en [0, horizonte] con distancia <= umbral, o None si no ocurre"""
+    c = dx * dx + dy * dy - umbral * umbral
+    if c <= 0:
+        return 0.0
+    a = dvx * dvx + dvy * dvy
+    b = 2 * (dx * dvx + dy * dvy)
+    if a == 0 or b >= 0:
+        return None  # sin movimiento relativo, o alejándose
+    discriminante = b * b - 4 * a * c
+    if discriminante < 0:
+        return None
+    t = (-b - math.sqrt(discriminante)) / (2 * a)
+    return t if t <= horizonte else None
+
+
+def conflicto_previsto(a: Aeronave, b: Aeronave, umbral: float,
+                       horizonte: float) -> Optional[Tuple[float, float, float]]:
+    """(entrada, t_cpa, d_cpa) si a y b se acercan a <= umbral dentro del horizonte"""
+    dx, dy = b.x - a.x, b.y - a.y
+    dvx, dvy = b.vx - a.vx, b.vy - a.vy
+    entrada = instante_de_entrada(dx, dy, dvx, dvy, umbral, horizonte)
+    if entrada is None:
+        return None
+    t_cpa, d_cpa = maximo_acercamiento(dx, dy, dvx, dvy, horizonte)
+    return entrada, t_cpa, d_cpa
+
+
+# FASE GRUESA: CAJAS BARRIDAS EN UNA REJILLA
+
+def conflictos_previstos(aeronaves: List[Aeronave], umbral: float,
+                         horizonte: float) -> ConflictosPrevistos:
+    """Pares que estarán a distancia <= umbral en algún instante de [0, horizonte]
+
+    Cada aeronave barre, en el horizonte, un segmento; su caja envolvente
+    ampliada en umbral/2 se inserta en las celdas de una rejilla uniforme.
+    Solo los pares cuyas cajas se solapan pasan a la fase fina (CPA
+    exacto), así que el costo es O(n · celdas por caja + candidatos) en
+    lugar de O(n²). Con horizonte = 0 equivale a la detección estática.
+    """
+    if umbral <= 0:
+        raise ValueError("El umbral debe ser > 0")
+    if horizonte < 0:
+        raise ValueError("El horizonte debe ser >= 0")
+    resultado = ConflictosPrevistos(aeronaves, umbral, horizonte)
+    n = len(aeronaves)
+    if n < 2:
+        return resultado
+
+    # Cajas barridas ampliadas en medio umbral
+    margen = umbral / 2
+    x0s, y0s, x1s, y1s = array("d"), array("d"), array("d"), array("d")
+    barridos = []
+    for a in aeronaves:
+        fx, fy = a.x + a.vx * horizonte, a.y + a.vy * horizonte
+        x0s.append(min(a.x, fx) - margen)
+        x1s.append(max(a.x, fx) + margen)
+        y0s.append(min(a.y, fy) - margen)
+        y1s.append(max(a.y, fy) + margen)
+        barridos.append(max(abs(fx - a.x), abs(fy - a.y)))
+
+    # Lado de celda: el umbral más el barrido típico, para que la mayoría de
+    # las cajas ocupe pocas celdas
+    barridos.sort()
+    lado = umbral + barridos[n // 2]
+
+    celdas = {}
+    rangos = []
+    for k in range(n):
+        cx0, cx1 = math.floor(x0s[k] / lado), math.floor(x1s[k] / lado)
+        cy0, cy1 = math.floor(y0s[k] / lado), math.floor(y1s[k] / lado)
+        rangos.append((cx0, cy0))
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                celda = celdas.get((cx, cy))
+                if celda is None:
+                    celdas[(cx, cy)] = [k]
+                else:
+                    celda.append(k)
+
+    for (cx, cy), miembros in celdas.items():
+        for posicion, p in enumerate(miembros):
+            px0, py0 = rangos[p]
+            ax0, ax1, ay0, ay1 = x0s[p], x1s[p], y0s[p], y1s[p]
+            for q in miembros[posicion + 1:]:
+                if x0s[q] > ax1 or ax0 > x1s[q] or y0s[q] > ay1 or ay0 > y1s[q]:
+                    continue
+                # Cada par se evalúa solo en la primera celda que comparten
+                qx0, qy0 = rangos[q]
+                if (px0 if px0 > qx0 else qx0) != cx or (py0 if py0 > qy0 else qy0) != cy:
+                    continue
+                i, j = (p, q) if p < q else (q, p)
+                previsto = conflicto_previsto(aeronaves[i], aeronaves[j], umbral, horizonte)
+                if previsto is not None:
+                    resultado.agregar(i, j, *previsto)
+
+    return resultado
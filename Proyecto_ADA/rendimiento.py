@@ -0,0 +1,196 @@
+"""
+Banco de rendimiento y corrección de los motores de detección
+Compara cada motor contra un oráculo y emite una línea JSON por medición
+
+Uso:
+    python rendimiento.py --tamanos 10 1000 100000 --umbrales 1 5 --salida resultados.jsonl
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, Iterable, List, Set, Tuple
+
+from Project import Aeronave, distancia, encontrar_conflictos, encontrar_pares_cercanos
+from instrumentacion import EstadisticasDeteccion
+
+try:
+    from flota import Flota
+except ImportError:  # NumPy no disponible: se omite el motor columnar
+    Flota = None
+
+
+# Hasta este tamaño el oráculo es la fuerza bruta O(n²); por encima se usa la
+# rejilla, que es exhaustiva y se valida contra la fuerza bruta en los tamaños pequeños
+LIMITE_FUERZA_BRUTA = 3000
+
+MOTORES = ("divide_y_vencer", "iterativo", "rejilla", "barrido", "auto", "paralelo", "flota", "sectores")
+# Motores que deben coincidir exactamente con el oráculo; el Divide y Vencer
+# clásico (y su versión paralela) limita la banda a 7 vecinos y repite pares
+MOTORES_EXACTOS = ("iterativo", "rejilla", "barrido", "auto", "flota", "sectores")
+DISTRIBUCIONES = ("uniforme", "agrupada", "misma_x", "colineal", "duplicados")
+
+
+# DISTRIBUCIONES DE PRUEBA
+
+def generar_distribucion(nombre: str, n: int, rng: random.Random) -> List[Aeronave]:
+    """n aeronaves en el cuadrado 0-100 según la distribución indicada"""
+    if nombre == "uniforme":
+        return [Aeronave(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(n)]
+    if nombre == "agrupada":
+        # Algunos focos densos (aeropuertos) con dispersión gaussiana
+        centros = [(rng.uniform(10, 90), rng.uniform(10, 90)) for _ in range(max(1, n // 5000 + 3))]
+        aeronaves = []
+        for _ in range(n):
+            cx, cy = rng.choice(centros)
+            aeronaves.append(Aeronave(min(100.0, max(0.0, rng.gauss(cx, 2.0))),
+                                      min(100.0, max(0.0, rng.gauss(cy, 2.0)))))
+        return aeronaves
+    if nombre == "misma_x":
+        # Pocas columnas con la misma x: ejercita el desempate de la división
+        columnas = [rng.uniform(0, 100) for _ in range(3)]
+        return [Aeronave(rng.choice(columnas), rng.uniform(0, 100)) for _ in range(n)]
+    if nombre == "colineal":
+        return [Aeronave(t, 0.5 * t + 10) for t in (rng.uniform(0, 100) for _ in range(n))]
+    if nombre == "duplicados":
+        base = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(max(1, n // 4))]
+        return [Aeronave(*rng.choice(base)) for _ in range(n)]
+    raise ValueError(f"Distribución desconocida: {nombre}")
+
+
+# ORÁCULO Y MOTORES
+
+def pares_fuerza_bruta(aeronaves: List[Aeronave], umbral: float) -> Set[Tuple[int, int]]:
+    """Todos los pares (i < j) con distancia <= umbral, comparando cada par"""
+    n = len(aeronaves)
+    return {(i, j) for i in range(n) for j in range(i + 1, n)
+            if distancia(aeronaves[i], aeronaves[j]) <= umbral}
+
+
+def ejecutar_motor(motor: str, aeronaves: List[Aeronave], umbral: float) -> List[Tuple[int, int]]:
+    """Ejecuta un motor y devuelve sus pares como índices (i < j), con repeticiones"""
+    if motor == "flota":
+        pares = encontrar_pares_cercanos(Flota.desde_aeronaves(aeronaves), umbral)
+        return [tuple(p) for p in pares.tolist()]
+    conjunto = encontrar_conflictos(aeronaves, umbral, motor)
+    return [(i, j) if i < j else (j, i) for i, j in zip(conjunto.i, conjunto.j)]
+
+
+def medir(motor: str, aeronaves: List[Aeronave], umbral: float, medir_memoria: bool = True):
+    """Tiempo de pared, pico de memoria y pares de un motor.
+
+    tracemalloc encarece cada asignación, así que el tiempo se toma en una
+    ejecución sin trazar y el pico de memoria en una segunda ejecución.
+    """
+    inicio = time.perf_counter()
+    pares = ejecutar_motor(motor, aeronaves, umbral)
+    segundos = time.perf_counter() - inicio
+
+    pico = None
+    if medir_memoria:
+        tracemalloc.start()
+        try:
+            ejecutar_motor(motor, aeronaves, umbral)
+            pico = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return pares, segundos, pico
+
+
+def comparar(pares: List[Tuple[int, int]], oraculo: Set[Tuple[int, int]]) -> Dict[str, int]:
+    """Diferencias entre la salida de un motor y el oráculo"""
+    unicos = set(pares)
+    return {
+        "faltantes": len(oraculo - unicos),
+        "sobrantes": len(unicos - oraculo),
+        "duplicados": len(pares) - len(unicos),
+    }
+
+
+# EJECUCIÓN DEL BANCO
+
+def ejecutar_banco(tamanos: Iterable[int], distribuciones: Iterable[str], umbrales: Iterable[float],
+                   motores: Iterable[str], semilla: int = 0,
+                   emitir: Callable[[dict], None] = None, medir_memoria: bool = True,
+                   instrumentar: bool = False) -> List[dict]:
+    """Recorre todas las combinaciones y devuelve (y emite) un registro por medición
+
+    Con instrumentar, los registros del Divide y Vencer clásico incluyen sus
+    estadísticas internas (tomadas en una ejecución aparte).
+    """
+    motores = [m for m in motores if m != "flota" or Flota is not None]
+    registros = []
+    for n in tamanos:
+        for nombre in distribuciones:
+            aeronaves = generar_distribucion(nombre, n, random.Random(f"{semilla}-{nombre}-{n}"))
+            for umbral in umbrales:
+                if n <= LIMITE_FUERZA_BRUTA:
+                    oraculo, fuente = pares_fuerza_bruta(aeronaves, umbral), "fuerza_bruta"
+                else:
+                    oraculo, fuente = set(ejecutar_motor("rejilla", aeronaves, umbral)), "rejilla"
+
+                for motor in motores:
+                    pares, segundos, pico = medir(motor, aeronaves, umbral, medir_memoria)
+                    registro = {
+                        "motor": motor,
+                        "distribucion": nombre,
+                        "n": n,
+                        "umbral": umbral,
+                        "segundos": round(segundos, 6),
+                        "pico_bytes": pico,
+                        "pares": len(pares),
+                        "pares_oraculo": len(oraculo),
+                        "oraculo": fuente,
+                        **comparar(pares, oraculo),
+                    }
+                    registro["correcto"] = (registro["faltantes"] == registro["sobrantes"]
+                                            == registro["duplicados"] == 0)
+                    if instrumentar and motor == "divide_y_vencer":
+                        estadisticas = EstadisticasDeteccion()
+                        encontrar_conflictos(aeronaves, umbral, motor, estadisticas=estadisticas)
+                        registro["instrumentacion"] = estadisticas.a_dict()
+                    registros.append(registro)
+                    if emitir:
+                        emitir(registro)
+    return registros
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Banco de rendimiento de los motores de detección")
+    parser.add_argument("--tamanos", type=int, nargs="+",
+                        default=[10, 100, 1000, 10000, 100000, 1000000])
+    parser.add_argument("--distribuciones", nargs="+", choices=DISTRIBUCIONES, default=list(DISTRIBUCIONES))
+    parser.add_argument("--umbrales", type=float, nargs="+", default=[0.5, 2.0, 10.0])
+    parser.add_argument("--motores", nargs="+", choices=MOTORES,
+                        default=["divide_y_vencer", "iterativo", "rejilla", "flota"])
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--sin-memoria", action="store_true",
+                        help="No medir el pico de memoria (evita la segunda ejecución)")
+    parser.add_argument("--instrumentar", action="store_true",
+                        help="Agregar las estadísticas internas del Divide y Vencer clásico")
+    parser.add_argument("--salida", help="Archivo JSON Lines (por defecto, la salida estándar)")
+    args = parser.parse_args(argv)
+
+    salida = open(args.salida, "w", encoding="utf-8") if args.salida else sys.stdout
+    try:
+        def emitir(registro):
+            salida.write(json.dumps(registro) + "\n")
+            salida.flush()
+
+        registros = ejecutar_banco(args.tamanos, args.distribuciones, args.umbrales,
+                                   args.motores, args.semilla, emitir, not args.sin_memoria,
+                                   args.instrumentar)
+    finally:
+        if salida is not sys.stdout:
+            salida.close()
+
+    # Código de salida distinto de cero si algún motor exacto difiere del oráculo
+    return 0 if all(r["correcto"] for r in registros if r["motor"] in MOTORES_EXACTOS) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,357 @@
+"""
+Ejecución por sectores: el plano se divide en teselas con un halo de ancho umbral
+y cada tesela se resuelve en un nodo trabajador que se comunica por sockets
+Los nodos pueden ser procesos locales o máquinas remotas (python sectores.py nodo)
+
+Uso de un nodo remoto:
+    python sectores.py nodo --host coordinador --puerto 7000 --clave secreto
+"""
+
+from __future__ import annotations
+import argparse
+import math
+import os
+import socket
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from multiprocessing import AuthenticationError, Process
+from multiprocessing.connection import Client, Connection, answer_challenge, deliver_challenge, wait
+from typing import List, Optional, Tuple
+
+from Project import Aeronave, ConjuntoConflictos, conflictos_por_rejilla
+
+
+TESELAS_POR_TRABAJADOR = 4  # más teselas que nodos, para repartir la carga
+FACTOR_DENSIDAD = 2.0       # una tesela con más puntos que esto × la media se parte
+ESPERA_NODOS = 30.0         # segundos que el coordinador espera a que se conecten los nodos
+ESPERA_CIERRE = 5.0         # segundos para que terminen los nodos locales antes de forzarlos
+
+
+# TESELADO
+
+class Tesela:
+    """Rectángulo [x0, x1) × [y0, y1) con los índices de los puntos de su núcleo"""
+
+    __slots__ = ("x0", "y0", "x1", "y1", "nucleo")
+
+    def __init__(self, x0: float, y0: float, x1: float, y1: float, nucleo: List[int]):
+        self.x0, self.y0, self.x1, self.y1 = x0, y0, x1, y1
+        self.nucleo = nucleo
+
+    def __repr__(self):
+        return f"Tesela([{self.x0:.1f}, {self.x1:.1f}) × [{self.y0:.1f}, {self.y1:.1f}), n={len(self.nucleo)})"
+
+
+def partir(tesela: Tesela, xs, ys) -> Optional[Tuple[Tesela, Tesela]]:
+    """Parte una tesela densa por la mediana del eje en que sus puntos más se extienden
+
+    Devuelve None si no hay corte posible (todos los puntos en la misma coordenada).
+    """
+    valores_x = sorted(xs[p] for p in tesela.nucleo)
+    valores_y = sorted(ys[p] for p in tesela.nucleo)
+    por_x = (valores_x[-1] - valores_x[0]) >= (valores_y[-1] - valores_y[0])
+    coordenada, valores = (xs, valores_x) if por_x else (ys, valores_y)
+    corte = valores[len(valores) // 2]
+    if corte == valores[0]:
+        corte = valores[bisect_right(valores, corte)] if valores[-1] != corte else None
+    if corte is None:
+        return None
+    menores = [p for p in tesela.nucleo if coordenada[p] < corte]
+    mayores = [p for p in tesela.nucleo if coordenada[p] >= corte]
+    if por_x:
+        return (Tesela(tesela.x0, tesela.y0, corte, tesela.y1, menores),
+                Tesela(corte, tesela.y0, tesela.x1, tesela.y1, mayores))
+    return (Tesela(tesela.x0, tesela.y0, tesela.x1, corte, menores),
+            Tesela(tesela.x0, corte, tesela.x1, tesela.y1, mayores))
+
+
+def teselar(xs, ys, cantidad: int) -> List[Tesela]:
+    """Rejilla de unas `cantidad` teselas sobre la caja envolvente, partiendo las densas
+
+    Cada punto pertenece al núcleo de exactamente una tesela. Las teselas
+    con más de FACTOR_DENSIDAD veces la media de puntos se parten por la
+    mediana hasta quedar por debajo, así que los focos de tráfico se
+    reparten entre varios nodos.
+    """
+    n = len(xs)
+    x_min, x_max = min(xs), max(xs)
+    y_min, y_max = min(ys), max(ys)
+    columnas = max(1, round(math.sqrt(cantidad)))
+    filas = max(1, math.ceil(cantidad / columnas))
+    ancho = (x_max - x_min) / columnas or 1.0
+    alto = (y_max - y_min) / filas or 1.0
+
+    nucleos = [[] for _ in range(columnas * filas)]
+    for p in range(n):
+        c = min(columnas - 1, int((xs[p] - x_min) / ancho))
+        f = min(filas - 1, int((ys[p] - y_min) / alto))
+        nucleos[f * columnas + c].append(p)
+
+    # Las teselas del borde se extienden al infinito: ningún punto queda fuera
+    pendientes = []
+    for f in range(filas):
+        for c in range(columnas):
+            x0 = -math.inf if c == 0 else x_min + c * ancho
+            x1 = math.inf if c == columnas - 1 else x_min + (c + 1) * ancho
+            y0 = -math.inf if f == 0 else y_min + f * alto
+            y1 = math.inf if f == filas - 1 else y_min + (f + 1) * alto
+            if nucleos[f * columnas + c]:
+                pendientes.append(Tesela(x0, y0, x1, y1, nucleos[f * columnas + c]))
+
+    limite = max(4, FACTOR_DENSIDAD * n / cantidad)
+    teselas = []
+    while pendientes:
+        tesela = pendientes.pop()
+        if len(tesela.nucleo) <= limite:
+            teselas.append(tesela)
+            continue
+        partes = partir(tesela, xs, ys)
+        if partes is None:
+            teselas.append(tesela)
+        else:
+            pendientes.extend(partes)
+    return teselas
+
+
+def halo(tesela: Tesela, numero: int, ys, umbral: float, orden_x, xs_ordenadas, propietaria) -> List[int]:
+    """Puntos de otras teselas a menos de umbral (en x y en y) del rectángulo de la tesela"""
+    inicio = bisect_left(xs_ordenadas, tesela.x0 - umbral)
+    fin = bisect_right(xs_ordenadas, tesela.x1 + umbral)
+    y0, y1 = tesela.y0 - umbral, tesela.y1 + umbral
+    return [p for p in orden_x[inicio:fin] if y0 <= ys[p] <= y1 and propietaria[p] != numero]
+
+
+# NODO TRABAJADOR
+
+def resolver_tesela(ids, xs, ys, tam_nucleo: int, umbral: float):
+    """Pares de la tesela con ids globales (i < j), solo los que le pertenecen
+
+    Un par pertenece a la tesela que tiene en su núcleo al punto de menor
+    id; así cada par lo informa un único nodo.
+    """
+    conjunto = conflictos_por_rejilla([Aeronave(x, y) for x, y in zip(xs, ys)], umbral)
+    propios = []
+    for a, b, d in zip(conjunto.i, conjunto.j, conjunto.d):
+        i, j = ids[a], ids[b]
+        if i < j:
+            if a < tam_nucleo:
+                propios.append((i, j, d))
+        elif b < tam_nucleo:
+            propios.append((j, i, d))
+    # Ordenados por (i, j): en el coordinador son corridas que sorted solo intercala
+    propios.sort()
+    return (array("q", (p[0] for p in propios)), array("q", (p[1] for p in propios)),
+            array("d", (p[2] for p in propios)))
+
+
+def nodo(direccion: Tuple[str, int], clave: bytes):
+    """Bucle de un nodo: recibe teselas, devuelve sus pares; None termina"""
+    with Client(direccion, authkey=clave) as conexion:
+        while True:
+            tarea = conexion.recv()
+            if tarea is None:
+                return
+            numero, umbral, ids, xs, ys, tam_nucleo = tarea
+            conexion.send((numero,) + resolver_tesela(ids, xs, ys, tam_nucleo, umbral))
+
+
+# COORDINADOR
+
+def limitar_zocalo(zocalo: socket.socket, segundos: float):
+    """Tiempo límite de lectura y escritura del socket (0 = sin límite)
+
+    A diferencia de settimeout, el socket sigue siendo bloqueante, que es
+    lo que espera Connection al leer el descriptor directamente.
+    """
+    if sys.platform == "win32":
+        valor = struct.pack("L", math.ceil(segundos * 1000))
+    else:
+        valor = struct.pack("ll", int(segundos), math.ceil(segundos % 1 * 1e6))
+    zocalo.setsockopt(socket.SOL_SOCKET, socket.SO_RCVTIMEO, valor)
+    zocalo.setsockopt(socket.SOL_SOCKET, socket.SO_SNDTIMEO, valor)
+
+
+def aceptar_nodo(servidor: socket.socket, clave: bytes, plazo: float) -> Connection:
+    """Acepta un nodo autenticado con clave antes de plazo (time.monotonic)
+
+    Hace el mismo intercambio de desafíos que Listener.accept, pero con un
+    tiempo límite que cubre también el intercambio; lanza TimeoutError si
+    ningún nodo llega a tiempo. Las conexiones con otra clave o que no
+    responden antes del plazo se descartan y se sigue esperando.
+    """
+    while True:
+        restante = plazo - time.monotonic()
+        if restante <= 0:
+            raise TimeoutError("Se agotó la espera de nodos")
+        servidor.settimeout(restante)
+        zocalo, _ = servidor.accept()
+        zocalo.setblocking(True)
+        limitar_zocalo(zocalo, max(1e-3, plazo - time.monotonic()))
+        conexion = Connection(zocalo.detach())
+        try:
+            deliver_challenge(conexion, clave)
+            answer_challenge(conexion, clave)
+        except (AuthenticationError, EOFError, TimeoutError, OSError):
+            conexion.close()
+            continue
+        # Autenticado: las teselas pueden tardar lo que haga falta
+        with socket.socket(fileno=os.dup(conexion.fileno())) as copia:
+            limitar_zocalo(copia, 0)
+        return conexion
+
+
+def conflictos_por_sectores(aeronaves: List[Aeronave], umbral: float,
+                            trabajadores: Optional[int] = None,
+                            direccion: Tuple[str, int] = ("127.0.0.1", 0),
+                            clave: Optional[bytes] = None,
+                            lanzar_locales: bool = True,
+                            informe: Optional[dict] = None,
+                            espera: float = ESPERA_NODOS) -> ConjuntoConflictos:
+    """Mismo resultado que conflictos_por_rejilla, repartiendo teselas entre nodos
+
+    El coordinador escucha en direccion; con lanzar_locales crea
+    `trabajadores` procesos locales, y si no espera a que se conecten esos
+    nodos remotos (con la misma clave) durante a lo sumo espera segundos:
+    se sigue con los que se hayan conectado, o TimeoutError si ninguno. Las
+    teselas se entregan de a una, de la más poblada a la menos, a cada nodo
+    que queda libre; si un nodo se desconecta, su tesela vuelve a la cola
+    (ConnectionError si se caen todos). informe, si se pasa un dict, recibe
+    la cantidad de teselas, puntos de halo, teselas resueltas por nodo y
+    nodos caídos.
+    """
+    if umbral <= 0:
+        raise ValueError("El umbral debe ser > 0")
+    trabajadores = trabajadores or os.cpu_count() or 1
+    n = len(aeronaves)
+    conjunto = ConjuntoConflictos(aeronaves)
+    if n < 2:
+        return conjunto
+
+    xs = array("d", (a.x for a in aeronaves))
+    ys = array("d", (a.y for a in aeronaves))
+    teselas = teselar(xs, ys, trabajadores * TESELAS_POR_TRABAJADOR)
+
+    # La más poblada primero: las teselas grandes no quedan para el final
+    teselas.sort(key=lambda t: -len(t.nucleo))
+    propietaria = array("q", bytes(8 * n))
+    for numero, tesela in enumerate(teselas):
+        for p in tesela.nucleo:
+            propietaria[p] = numero
+
+    orden_x = sorted(range(n), key=xs.__getitem__)
+    xs_ordenadas = [xs[p] for p in orden_x]
+    tareas = deque()
+    puntos_halo = 0
+    for numero, tesela in enumerate(teselas):
+        vecinos = halo(tesela, numero, ys, umbral, orden_x, xs_ordenadas, propietaria)
+        puntos_halo += len(vecinos)
+        indices = tesela.nucleo + vecinos
+        tareas.append((numero, umbral, array("q", indices), array("d", (xs[p] for p in indices)),
+                       array("d", (ys[p] for p in indices)), len(tesela.nucleo)))
+
+    clave = clave or os.urandom(16)
+    procesos = []
+    conexiones = []
+    resultados = []
+    caidos = 0
+    with socket.create_server(direccion) as servidor:
+        try:
+            if lanzar_locales:
+                for _ in range(trabajadores):
+                    proceso = Process(target=nodo, args=(servidor.getsockname()[:2], clave), daemon=True)
+                    proceso.start()
+                    procesos.append(proceso)
+            plazo = time.monotonic() + espera
+            while len(conexiones) < trabajadores:
+                try:
+                    conexiones.append(aceptar_nodo(servidor, clave, plazo))
+                except TimeoutError:
+                    if not conexiones:
+                        raise TimeoutError(f"Ningún nodo se conectó en {espera} s") from None
+                    break
+
+            resueltas = {conexion: 0 for conexion in conexiones}
+            libres = deque(conexiones)
+            en_curso = {}  # conexión -> tesela que está resolviendo
+            while tareas or en_curso:
+                while tareas and libres:
+                    conexion = libres.popleft()
+                    try:
+                        conexion.send(tareas[0])
+                    except OSError:
+                        caidos += 1
+                        conexion.close()
+                        continue
+                    en_curso[conexion] = tareas.popleft()
+                if not en_curso:
+                    raise ConnectionError("Se desconectaron todos los nodos")
+                for conexion in wait(list(en_curso)):
+                    try:
+                        respuesta = conexion.recv()
+                    except (EOFError, OSError):
+                        # El nodo se cayó a mitad de la tesela: vuelve a la cola
+                        tareas.appendleft(en_curso.pop(conexion))
+                        caidos += 1
+                        conexion.close()
+                        continue
+                    del en_curso[conexion]
+                    resultados.append(respuesta[1:])
+                    resueltas[conexion] += 1
+                    libres.append(conexion)
+        finally:
+            for conexion in conexiones:
+                try:
+                    conexion.send(None)
+                except OSError:
+                    pass
+                conexion.close()
+            # Un nodo local que nunca se aceptó sigue esperando el intercambio: se fuerza
+            fin = time.monotonic() + ESPERA_CIERRE
+            for proceso in procesos:
+                proceso.join(max(0.0, fin - time.monotonic()))
+                if proceso.is_alive():
+                    proceso.terminate()
+                    proceso.join()
+
+    # Combinar: orden por (i, j) como el motor de un solo nodo, sin repetidos.
+    # Cada tesela llega ordenada, así que sorted (timsort) reconoce esas
+    # corridas y en la práctica solo las intercala; con claves enteras es más
+    # rápido que heapq.merge sobre tuplas
+    i_t, j_t, d_t = array("q"), array("q"), array("d")
+    for i_s, j_s, d_s in resultados:
+        i_t.extend(i_s)
+        j_t.extend(j_s)
+        d_t.extend(d_s)
+    claves = [i * n + j for i, j in zip(i_t, j_t)]
+    anterior = -1
+    for k in sorted(range(len(claves)), key=claves.__getitem__):
+        if claves[k] != anterior:
+            anterior = claves[k]
+            conjunto.agregar(i_t[k], j_t[k], d_t[k])
+
+    if informe is not None:
+        informe.update({"teselas": len(teselas), "puntos_halo": puntos_halo,
+                        "teselas_por_nodo": sorted(resueltas.values(), reverse=True),
+                        "nodos_caidos": caidos})
+    return conjunto
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Nodo trabajador de la detección por sectores")
+    subparsers = parser.add_subparsers(dest="orden", required=True)
+    p_nodo = subparsers.add_parser("nodo", help="Conectarse a un coordinador y resolver teselas")
+    p_nodo.add_argument("--host", default="127.0.0.1")
+    p_nodo.add_argument("--puerto", type=int, required=True)
+    p_nodo.add_argument("--clave", required=True, help="Clave compartida con el coordinador")
+    args = parser.parse_args(argv)
+
+    nodo((args.host, args.puerto), args.clave.encode("utf-8"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+"""
+Seguimiento incremental de conflictos entre barridos de radar
+Solo se recalculan las aeronaves que se movieron en cada tick
+"""
+
+from __future__ import annotations
+import math
+from typing import Dict, Hashable, Iterable, List, Set, Tuple
+
+
+Par = Tuple[Hashable, Hashable]
+
+
+def _par(a, b) -> Par:
+    """Par ordenado para que (a, b) y (b, a) sean la misma clave"""
+    return (a, b) if a <= b else (b, a)
+
+
+class RastreadorConflictos:
+    """Mantiene los conflictos (distancia <= umbral) de una flota entre ticks
+
+    Guarda una rejilla de celdas de lado umbral y, para cada aeronave, el
+    conjunto de aeronaves con las que está en conflicto. Una actualización
+    de m aeronaves cuesta O(m) celdas revisadas, sin importar el tamaño
+    de la flota.
+    """
+
+    def __init__(self, umbral: float, posiciones=None):
+        if umbral <= 0:
+            raise ValueError("El umbral debe ser > 0")
+        self.umbral = umbral
+        self._posiciones: Dict[Hashable, Tuple[float, float]] = {}
+        self._celda_de: Dict[Hashable, Tuple[int, int]] = {}
+        self._celdas: Dict[Tuple[int, int], Set[Hashable]] = {}
+        self._adyacencia: Dict[Hashable, Set[Hashable]] = {}
+        if posiciones:
+            self.actualizar(posiciones)
+
+    def __len__(self):
+        return len(self._posiciones)
+
+    def _clave(self, x: float, y: float) -> Tuple[int, int]:
+        return (math.floor(x / self.umbral), math.floor(y / self.umbral))
+
+    def _mover(self, ident, x: float, y: float):
+        """Actualiza la posición de ident y su celda en la rejilla"""
+        clave = self._clave(x, y)
+        anterior = self._celda_de.get(ident)
+        if anterior != clave:
+            if anterior is not None:
+                celda = self._celdas[anterior]
+                celda.discard(ident)
+                if not celda:
+                    del self._celdas[anterior]
+            self._celdas.setdefault(clave, set()).add(ident)
+            self._celda_de[ident] = clave
+        self._posiciones[ident] = (x, y)
+
+    def _vecinos(self, ident) -> Set[Hashable]:
+        """Aeronaves a distancia <= umbral de ident, revisando las 9 celdas vecinas"""
+        x, y = self._posiciones[ident]
+        cx, cy = self._celda_de[ident]
+        umbral = self.umbral
+        posiciones = self._posiciones
+        vecinos = set()
+        for ox in (-1, 0, 1):
+            for oy in (-1, 0, 1):
+                celda = self._celdas.get((cx + ox, cy + oy))
+                if not celda:
+                    continue
+                for otro in celda:
+                    if otro == ident:
+                        continue
+                    px, py = posiciones[otro]
+                    if math.hypot(px - x, py - y) <= umbral:
+                        vecinos.add(otro)
+        return vecinos
+
+    def actualizar(self, cambios) -> Tuple[List[Par], List[Par]]:
+        """Aplica nuevas posiciones y devuelve (conflictos_nuevos, conflictos_resueltos)
+
+        cambios es un dict {id: (x, y)} o una lista de Aeronave (id = índice).
+        Los ids desconocidos se agregan a la flota.
+        """
+        if isinstance(cambios, dict):
+            elementos = cambios.items()
+        else:
+            elementos = ((i, (a.x, a.y)) for i, a in enumerate(cambios))
+
+        movidos = []
+        for ident, (x, y) in elementos:
+            self._mover(ident, x, y)
+            movidos.append(ident)
+
+        # Con todas las posiciones al día, recalcular los vecinos de los movidos
+        nuevos: Set[Par] = set()
+        resueltos: Set[Par] = set()
+        adyacencia = self._adyacencia
+        for ident in movidos:
+            antes = adyacencia.get(ident, set())
+            ahora = self._vecinos(ident)
+            for otro in antes - ahora:
+                resueltos.add(_par(ident, otro))
+                adyacencia[otro].discard(ident)
+            for otro in ahora - antes:
+                nuevos.add(_par(ident, otro))
+                adyacencia.setdefault(otro, set()).add(ident)
+            adyacencia[ident] = ahora
+
+        return sorted(nuevos), sorted(resueltos)
+
+    def retirar(self, ids: Iterable[Hashable]) -> List[Par]:
+        """Quita aeronaves de la flota y devuelve los conflictos que se resuelven"""
+        resueltos = set()
+        for ident in ids:
+            if ident not in self._posiciones:
+                continue
+            for otro in self._adyacencia.pop(ident, set()):
+                resueltos.add(_par(ident, otro))
+                self._adyacencia[otro].discard(ident)
+            clave = self._celda_de.pop(ident)
+            celda = self._celdas[clave]
+            celda.discard(ident)
+            if not celda:
+                del self._celdas[clave]
+            del self._posiciones[ident]
+        return sorted(resueltos)
+
+    def conflictos(self) -> List[Par]:
+        """Todos los conflictos vigentes"""
+        return sorted({_par(a, b) for a, vecinos in self._adyacencia.items() for b in vecinos})
@@ -0,0 +1,363 @@
+"""
+Servicio continuo de detección sobre un flujo de radar (asyncio)
+Recibe marcos de posiciones por TCP, detecta los conflictos de cada marco y los
+publica a los suscriptores; si la detección se atrasa, los marcos se fusionan
+(solo se procesa el más reciente)
+
+Uso:
+    python servicio.py servir --umbral 5 --puerto 9000 --puerto-suscriptores 9001
+    python servicio.py simular --puerto 9000 --aeronaves 5000 --hz 1
+
+Marcos de entrada (por la misma conexión pueden mezclarse ambos formatos):
+    JSON por línea:  {"marco": 17, "x": [...], "y": [...], "id": [...]}   (id opcional)
+    Binario:         el formato ADAFLT01 de consola.py (cabecera + columnas x, y, id)
+
+Cada suscriptor recibe una línea JSON por marco procesado con los pares
+(id_a, id_b, distancia), el par más cercano y la latencia del marco.
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+from array import array
+from collections import deque
+from typing import Optional, Set
+
+from consola import (CABECERA_INSTANTANEA, MAGIA_INSTANTANEA, Instantanea, a_documento,
+                     detectar, motor_por_defecto)
+
+
+def percentil(valores, p: float) -> Optional[float]:
+    """Percentil p (0-100) por rango más cercano, o None si no hay valores"""
+    if not valores:
+        return None
+    ordenados = sorted(valores)
+    rango = max(1, math.ceil(p / 100 * len(ordenados)))
+    return ordenados[rango - 1]
+
+
+def validar_columnas(ids, xs, ys) -> Instantanea:
+    """Instantánea con las columnas dadas, si id, x e y tienen la misma longitud"""
+    if not len(ids) == len(xs) == len(ys):
+        raise ValueError("id, x e y deben tener la misma longitud")
+    return Instantanea(ids, xs, ys)
+
+
+def marco_desde_json(linea: bytes) -> dict:
+    """Decodifica un marco JSON en {"marco", "instantanea"}"""
+    datos = json.loads(linea)
+    if not isinstance(datos, dict):
+        raise ValueError("El marco debe ser un objeto JSON")
+    try:
+        xs = array("d", datos["x"])
+        ys = array("d", datos["y"])
+        ids = array("q", datos["id"]) if "id" in datos else array("q", range(len(ys)))
+    except (TypeError, OverflowError) as error:
+        # Columnas que no son listas de números (o ids fuera de 64 bits)
+        raise ValueError(f"Columnas inválidas: {error}") from None
+    return {"marco": datos.get("marco"), "instantanea": validar_columnas(ids, xs, ys)}
+
+
+async def leer_marco(lector: asyncio.StreamReader) -> Optional[dict]:
+    """Lee el siguiente marco (JSON o binario) de la conexión; None al cerrarse"""
+    while True:
+        try:
+            primero = await lector.readexactly(1)
+        except asyncio.IncompleteReadError:
+            return None
+        if primero in b" \r\n":
+            continue
+        if primero == MAGIA_INSTANTANEA[:1]:
+            resto = await lector.readexactly(CABECERA_INSTANTANEA.size - 1)
+            magia, n = CABECERA_INSTANTANEA.unpack(primero + resto)
+            if magia != MAGIA_INSTANTANEA or n < 0:
+                raise ValueError("Cabecera binaria inválida")
+            datos = memoryview(await lector.readexactly(24 * n))
+            return {"marco": None, "instantanea": validar_columnas(datos[16 * n:].cast("q"),
+                                                                   datos[:8 * n].cast("d"),
+                                                                   datos[8 * n:16 * n].cast("d"))}
+        return marco_desde_json(primero + await lector.readline())
+
+
+class ServicioRadar:
+    """Detecta conflictos marco a marco y los publica a los suscriptores
+
+    La lectura de marcos y la detección están desacopladas: cada marco
+    recibido reemplaza al pendiente, y la detección (en un hilo aparte, para
+    no bloquear el bucle) siempre toma el más reciente. Los marcos que se
+    reemplazan sin procesar se cuentan como fusionados.
+    """
+
+    COLA_SUSCRIPTOR = 8           # marcos que puede acumular un suscriptor lento
+    LIMITE_LINEA = 64 * 2 ** 20   # bytes de un marco JSON (miles de aeronaves)
+
+    def __init__(self, umbral: float, motor: Optional[str] = None, ventana_latencias: int = 1000):
+        if umbral <= 0:
+            raise ValueError("El umbral debe ser > 0")
+        self.umbral = umbral
+        self.motor = motor or motor_por_defecto()
+        self.latencias = deque(maxlen=ventana_latencias)  # segundos, últimos marcos
+        self.recibidos = 0
+        self.procesados = 0
+        self.fusionados = 0
+        self.errores = 0
+        self._pendiente = None  # (instante de recepción, número de marco, marco)
+        self._hay_marco = asyncio.Event()
+        self._suscriptores: Set[asyncio.Queue] = set()
+        self._servidores = []
+        self._fuentes = set()
+        self._tarea = None
+
+    # ENTRADA
+
+    def recibir_marco(self, marco: dict):
+        """Deja marco como pendiente; si ya había uno sin procesar, lo reemplaza"""
+        self.recibidos += 1
+        if self._pendiente is not None:
+            self.fusionados += 1
+        numero = marco["marco"] if marco.get("marco") is not None else self.recibidos
+        self._pendiente = (time.perf_counter(), numero, marco["instantanea"])
+        self._hay_marco.set()
+
+    async def _atender_fuente(self, lector, escritor):
+        self._fuentes.add(escritor)
+        try:
+            while True:
+                try:
+                    marco = await leer_marco(lector)
+                except ConnectionError:
+                    return
+                except (ValueError, KeyError) as error:
+                    # Marco mal formado: se descarta y se cierra la conexión
+                    self.errores += 1
+                    print(f"Marco inválido: {error}", file=sys.stderr)
+                    return
+                if marco is None:
+                    return
+                self.recibir_marco(marco)
+        finally:
+            self._fuentes.discard(escritor)
+            escritor.close()
+
+    # SALIDA
+
+    def suscribir(self) -> asyncio.Queue:
+        cola = asyncio.Queue(maxsize=self.COLA_SUSCRIPTOR)
+        self._suscriptores.add(cola)
+        return cola
+
+    def desuscribir(self, cola: asyncio.Queue):
+        self._suscriptores.discard(cola)
+
+    def publicar(self, mensaje: str):
+        """Entrega mensaje a cada suscriptor; a los lentos se les descarta el más viejo"""
+        for cola in self._suscriptores:
+            if cola.full():
+                cola.get_nowait()
+            cola.put_nowait(mensaje)
+
+    async def _atender_suscriptor(self, lector, escritor):
+        cola = self.suscribir()
+        try:
+            while True:
+                mensaje = await cola.get()
+                if mensaje is None:
+                    return  # el servicio se detiene
+                escritor.write(mensaje.encode("utf-8"))
+                await escritor.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.desuscribir(cola)
+            escritor.close()
+
+    # DETECCIÓN
+
+    def procesar(self, numero, instantanea: Instantanea) -> dict:
+        """Detección síncrona de un marco (se ejecuta fuera del bucle de eventos)"""
+        resultado = detectar(instantanea, self.umbral, self.motor)
+        documento = a_documento(resultado, len(instantanea), self.umbral)
+        documento["marco"] = numero
+        return documento
+
+    async def detectar_continuamente(self):
+        """Bucle de detección: procesa siempre el marco pendiente más reciente"""
+        while True:
+            await self._hay_marco.wait()
+            self._hay_marco.clear()
+            recibido, numero, instantanea = self._pendiente
+            self._pendiente = None
+
+            try:
+                documento = await asyncio.to_thread(self.procesar, numero, instantanea)
+            except Exception as error:
+                # Un marco que no se puede procesar no detiene el servicio
+                self.errores += 1
+                print(f"Error al procesar el marco {numero}: {error!r}", file=sys.stderr)
+                continue
+            latencia = time.perf_counter() - recibido
+            self.latencias.append(latencia)
+            self.procesados += 1
+            documento["latencia_ms"] = round(1000 * latencia, 3)
+            self.publicar(json.dumps(documento) + "\n")
+
+    def estadisticas(self) -> dict:
+        """Contadores y latencia por marco (p50/p99, en ms) de la ventana reciente"""
+        p50 = percentil(self.latencias, 50)
+        p99 = percentil(self.latencias, 99)
+        return {
+            "recibidos": self.recibidos,
+            "procesados": self.procesados,
+            "fusionados": self.fusionados,
+            "errores": self.errores,
+            "suscriptores": len(self._suscriptores),
+            "p50_ms": None if p50 is None else round(1000 * p50, 3),
+            "p99_ms": None if p99 is None else round(1000 * p99, 3),
+        }
+
+    # CICLO DE VIDA
+
+    async def iniciar(self, host: str = "127.0.0.1", puerto: int = 9000,
+                      puerto_suscriptores: int = 9001):
+        """Abre los dos puertos y lanza el bucle de detección; devuelve los puertos reales"""
+        fuente = await asyncio.start_server(self._atender_fuente, host, puerto,
+                                            limit=self.LIMITE_LINEA)
+        suscriptores = await asyncio.start_server(self._atender_suscriptor, host, puerto_suscriptores)
+        self._servidores = [fuente, suscriptores]
+        self._tarea = asyncio.create_task(self.detectar_continuamente())
+        return (fuente.sockets[0].getsockname()[1], suscriptores.sockets[0].getsockname()[1])
+
+    async def detener(self):
+        """Cierra puertos y conexiones y termina el bucle de detección"""
+        for servidor in self._servidores:
+            servidor.close()
+        for escritor in list(self._fuentes):
+            escritor.close()
+        for cola in list(self._suscriptores):
+            if cola.full():
+                cola.get_nowait()
+            cola.put_nowait(None)
+        for servidor in self._servidores:
+            await servidor.wait_closed()
+        if self._tarea is not None:
+            self._tarea.cancel()
+            try:
+                await self._tarea
+            except asyncio.CancelledError:
+                pass
+
+
+# SIMULADOR DE RADAR
+
+async def simular(host: str, puerto: int, aeronaves: int, hz: float, marcos: Optional[int] = None,
+                  binario: bool = False, semilla: int = 0, distribucion: Optional[str] = None):
+    """Envía marcos de aeronaves en movimiento (0-100, con rebote) a hz marcos por segundo
+
+    Con distribucion (ver trafico.DISTRIBUCIONES, requiere NumPy) los
+    marcos salen del generador vectorizado, útil para pruebas de carga con
+    muchas aeronaves.
+    """
+    if distribucion is not None:
+        from trafico import generar_marcos
+        fuente = ((flota.xs, flota.ys) for flota in generar_marcos(aeronaves, distribucion, semilla, marcos=marcos))
+    else:
+        fuente = marcos_simples(aeronaves, semilla, marcos)
+    ids = array("q", range(aeronaves)).tobytes()
+
+    _, escritor = await asyncio.open_connection(host, puerto)
+    try:
+        for numero, (xs, ys) in enumerate(fuente, start=1):
+            inicio = time.perf_counter()
+            if binario:
+                escritor.write(CABECERA_INSTANTANEA.pack(MAGIA_INSTANTANEA, aeronaves))
+                escritor.write(xs.tobytes() + ys.tobytes() + ids)
+            else:
+                escritor.write(json.dumps({"marco": numero, "x": xs.tolist(), "y": ys.tolist()}).encode("utf-8") + b"\n")
+            await escritor.drain()
+            await asyncio.sleep(max(0.0, 1 / hz - (time.perf_counter() - inicio)))
+    finally:
+        escritor.close()
+        await escritor.wait_closed()
+
+
+def marcos_simples(aeronaves: int, semilla: int, marcos: Optional[int] = None):
+    """Marcos (xs, ys) en Python puro: velocidades en [-0.5, 0.5] y rebote en 0-100"""
+    rng = random.Random(semilla)
+    xs = array("d", (rng.uniform(0, 100) for _ in range(aeronaves)))
+    ys = array("d", (rng.uniform(0, 100) for _ in range(aeronaves)))
+    vxs = [rng.uniform(-0.5, 0.5) for _ in range(aeronaves)]
+    vys = [rng.uniform(-0.5, 0.5) for _ in range(aeronaves)]
+    numero = 0
+    while marcos is None or numero < marcos:
+        yield xs, ys
+        numero += 1
+        for k in range(aeronaves):
+            xs[k] += vxs[k]
+            ys[k] += vys[k]
+            if not 0 <= xs[k] <= 100:
+                vxs[k] = -vxs[k]
+            if not 0 <= ys[k] <= 100:
+                vys[k] = -vys[k]
+
+
+# EJECUCIÓN
+
+async def servir(args):
+    servicio = ServicioRadar(args.umbral, args.motor)
+    puerto, puerto_suscriptores = await servicio.iniciar(args.host, args.puerto, args.puerto_suscriptores)
+    print(f"Escuchando marcos en {args.host}:{puerto}, suscriptores en {args.host}:{puerto_suscriptores}"
+          f" (motor {servicio.motor})", file=sys.stderr)
+    try:
+        while True:
+            await asyncio.sleep(args.informe)
+            print(json.dumps(servicio.estadisticas()), file=sys.stderr)
+    finally:
+        await servicio.detener()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Servicio de detección sobre un flujo de radar")
+    subparsers = parser.add_subparsers(dest="orden", required=True)
+
+    p_servir = subparsers.add_parser("servir", help="Recibir marcos y publicar conflictos")
+    p_servir.add_argument("--umbral", type=float, required=True)
+    p_servir.add_argument("--motor", default=None,
+                          help="flota, rejilla, iterativo... (por defecto flota si hay NumPy)")
+    p_servir.add_argument("--host", default="127.0.0.1")
+    p_servir.add_argument("--puerto", type=int, default=9000)
+    p_servir.add_argument("--puerto-suscriptores", type=int, default=9001)
+    p_servir.add_argument("--informe", type=float, default=10.0,
+                          help="Segundos entre informes de latencia (p50/p99)")
+
+    p_simular = subparsers.add_parser("simular", help="Simulador de radar local")
+    p_simular.add_argument("--host", default="127.0.0.1")
+    p_simular.add_argument("--puerto", type=int, default=9000)
+    p_simular.add_argument("--aeronaves", type=int, default=1000)
+    p_simular.add_argument("--hz", type=float, default=1.0)
+    p_simular.add_argument("--marcos", type=int, default=None)
+    p_simular.add_argument("--binario", action="store_true")
+    p_simular.add_argument("--semilla", type=int, default=0)
+    p_simular.add_argument("--distribucion", default=None,
+                           help="uniforme, aeropuertos, corredores... (generador vectorizado, requiere NumPy)")
+
+    args = parser.parse_args(argv)
+    try:
+        if args.orden == "servir":
+            if args.umbral <= 0:
+                parser.error("el umbral debe ser > 0")
+            asyncio.run(servir(args))
+        else:
+            asyncio.run(simular(args.host, args.puerto, args.aeronaves, args.hz,
+                                args.marcos, args.binario, args.semilla, args.distribucion))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
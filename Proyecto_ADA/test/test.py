@@ -3,7 +3,7 @@ import os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from Project import SistemaControlAereo, Aeronave, generar_aeronaves, distancia, encontrar_pares_cercanos, encontrar_par_mas_cercano
+from Project import SistemaControlAereo, Aeronave, generar_aeronaves, distancia, encontrar_pares_cercanos, encontrar_par_mas_cercano, encontrar_conflictos, par_mas_cercano, pares_mas_cercanos, iterar_conflictos, alertas_por_niveles, DistanciasOrdenadas, planificar
 
 # Test para la generación de aeronaves
 def test_generar_aeronaves():
@@ -66,3 +66,208 @@ def test_analizar():
     
     # Verificar que los resultados del análisis fueron actualizados
     assert app.texto_resultados.get(1.0, 'end-1c') != "", "El análisis no generó resultados"
+
+
+# Test para el motor de rejilla espacial
+def test_rejilla_coincide_con_fuerza_bruta():
+    import random
+    random.seed(7)
+    aeronaves = generar_aeronaves(400)
+    umbral = 6.0
+    esperados = {(i, j) for i in range(len(aeronaves)) for j in range(i + 1, len(aeronaves))
+                 if distancia(aeronaves[i], aeronaves[j]) <= umbral}
+    pares = encontrar_pares_cercanos(aeronaves, umbral, motor="rejilla")
+    indice = {id(a): i for i, a in enumerate(aeronaves)}
+    obtenidos = [(indice[id(a)], indice[id(b)]) for a, b in pares]
+    assert len(obtenidos) == len(set(obtenidos)), "La rejilla devolvió pares duplicados"
+    assert set(obtenidos) == esperados, "La rejilla no devolvió exactamente los pares esperados"
+
+# Test para la rejilla en zonas densas (más de 8 aeronaves en la banda)
+def test_rejilla_zona_densa():
+    aeronaves = [Aeronave(50 + 0.01 * i, 50 + 0.01 * i) for i in range(20)]
+    pares = encontrar_pares_cercanos(aeronaves, 1.0, motor="rejilla")
+    assert len(pares) == 20 * 19 // 2, f"Se esperaban 190 pares, pero se encontraron {len(pares)}"
+
+# Test para el conjunto de conflictos con distancias precalculadas
+def test_conjunto_conflictos():
+    aeronaves = [Aeronave(0, 0), Aeronave(3, 4), Aeronave(6, 8), Aeronave(6.5, 8)]
+    conflictos = encontrar_conflictos(aeronaves, 5.0, motor="rejilla")
+    assert len(conflictos) == 3
+    assert not hasattr(aeronaves[0], "id"), "No se debe modificar las aeronaves del llamador"
+    a, b, d = conflictos.minimo()
+    assert (a, b) == (aeronaves[2], aeronaves[3]) and d == 0.5
+    assert encontrar_par_mas_cercano(conflictos) == (aeronaves[2], aeronaves[3])
+    assert [t[2] for t in conflictos.mas_cercanos(2)] == [0.5, 5.0]
+    distancias = [d for _, _, d in conflictos.ordenados()]
+    assert distancias == sorted(distancias)
+    assert len(conflictos.filtrar(1.0)) == 1
+
+# Test: el Divide y Vencer y la lista de pares coinciden con el conjunto
+def test_conjunto_conflictos_dividir_y_vencer():
+    aeronaves = generar_aeronaves(60)
+    conflictos = encontrar_conflictos(aeronaves, 15.0)
+    assert conflictos.pares() == encontrar_pares_cercanos(aeronaves, 15.0)
+    assert all(d == distancia(a, b) for a, b, d in conflictos)
+
+# Test para el Divide y Vencer iterativo (exhaustivo, sin duplicados)
+def test_iterativo_coincide_con_fuerza_bruta():
+    import random
+    random.seed(13)
+    aeronaves = generar_aeronaves(300) + [Aeronave(50.0, 0.1 * i) for i in range(40)]
+    umbral = 4.0
+    esperados = {(i, j) for i in range(len(aeronaves)) for j in range(i + 1, len(aeronaves))
+                 if distancia(aeronaves[i], aeronaves[j]) <= umbral}
+    conflictos = encontrar_conflictos(aeronaves, umbral, motor="iterativo")
+    obtenidos = [(min(i, j), max(i, j)) for i, j in zip(conflictos.i, conflictos.j)]
+    assert len(obtenidos) == len(set(obtenidos)), "El motor iterativo devolvió pares duplicados"
+    assert set(obtenidos) == esperados, "El motor iterativo no devolvió los pares esperados"
+
+# Test: entradas grandes y ordenadas no agotan el límite de recursión
+def test_iterativo_sin_recursion():
+    aeronaves = [Aeronave(i * 0.001, 0.0) for i in range(20000)]
+    conflictos = encontrar_conflictos(aeronaves, 0.0015, motor="iterativo")
+    assert len(conflictos) == 19999
+
+# Test para el par más cercano sin umbral
+def test_par_mas_cercano_sin_umbral():
+    aeronaves = [Aeronave(0, 0), Aeronave(30, 40), Aeronave(60, 80), Aeronave(61, 80)]
+    assert encontrar_pares_cercanos(aeronaves, 0.5) == []
+    a, b, d = par_mas_cercano(aeronaves)
+    assert {a, b} == {aeronaves[2], aeronaves[3]} and d == 1.0
+    assert par_mas_cercano([Aeronave(1, 1)]) is None
+
+# Test para los k pares más cercanos con montículo acotado
+def test_pares_mas_cercanos():
+    import random
+    random.seed(17)
+    aeronaves = generar_aeronaves(200)
+    todas = sorted(distancia(a, b) for n, a in enumerate(aeronaves) for b in aeronaves[n + 1:])
+    mas_cercanos = pares_mas_cercanos(aeronaves, 20)
+    assert [d for _, _, d in mas_cercanos] == todas[:20]
+    assert all(distancia(a, b) == d for a, b, d in mas_cercanos)
+
+# Test para la emisión de conflictos en flujo
+def test_iterar_conflictos():
+    import random
+    random.seed(19)
+    aeronaves = generar_aeronaves(300)
+    esperados = {frozenset(p) for p in encontrar_pares_cercanos(aeronaves, 5.0, motor="rejilla")}
+    emitidos = [frozenset((a, b)) for a, b, _ in iterar_conflictos(aeronaves, 5.0)]
+    assert len(emitidos) == len(esperados) and set(emitidos) == esperados
+
+    bloques = list(iterar_conflictos(aeronaves, 5.0, tam_bloque=10))
+    assert all(len(b) <= 10 for b in bloques)
+    assert sum(len(b) for b in bloques) == len(esperados)
+
+# Test para la cancelación anticipada del flujo
+def test_iterar_conflictos_cancelar():
+    import threading
+    aeronaves = [Aeronave(0.01 * i, 0.0) for i in range(500)]
+    cancelar = threading.Event()
+    recibidos = 0
+    for bloque in iterar_conflictos(aeronaves, 1.0, tam_bloque=5, cancelar=cancelar):
+        recibidos += len(bloque)
+        cancelar.set()
+    assert recibidos == 5
+
+# Test para la paginación de los pares por distancia
+def test_conjunto_pagina():
+    import random
+    random.seed(23)
+    aeronaves = generar_aeronaves(300)
+    conjunto = encontrar_conflictos(aeronaves, 6.0, motor="rejilla")
+    todos = list(conjunto.ordenados())
+    assert conjunto.pagina(0, 10) == todos[:10]
+    assert conjunto.pagina(10, 10) == todos[10:20]
+    assert conjunto.pagina(len(todos), 10) == []
+
+# Test para la separación 3D: radio horizontal y banda vertical
+def test_rejilla_3d_coincide_con_fuerza_bruta():
+    import random
+    random.seed(41)
+    aeronaves = generar_aeronaves(800, altitud_maxima=40000)
+    conflictos = encontrar_conflictos(aeronaves, 8.0, separacion_vertical=1000)
+    esperados = {(i, j) for i in range(len(aeronaves)) for j in range(i + 1, len(aeronaves))
+                 if abs(aeronaves[i].z - aeronaves[j].z) <= 1000 and distancia(aeronaves[i], aeronaves[j]) <= 8.0}
+    assert len(conflictos) == len(esperados) and set(zip(conflictos.i, conflictos.j)) == esperados
+    # "auto" deja constancia del motor con altitud; los motores solo 2D no se aceptan
+    assert conflictos.plan.motor == "rejilla_3d"
+    for motor in ("divide_y_vencer", "barrido"):
+        try:
+            encontrar_conflictos(aeronaves, 8.0, motor, separacion_vertical=1000)
+            assert False, "Se esperaba ValueError"
+        except ValueError:
+            pass
+
+# Test para aeronaves superpuestas en planta pero separadas verticalmente
+def test_rejilla_3d_separacion_vertical():
+    aeronaves = [Aeronave(10, 10, z=30000), Aeronave(10.5, 10, z=31000),
+                 Aeronave(10, 10.5, z=32000), Aeronave(11, 10, z=30500)]
+    pares = encontrar_pares_cercanos(aeronaves, 2.0, separacion_vertical=1000)
+    assert set(pares) == {(aeronaves[0], aeronaves[1]), (aeronaves[0], aeronaves[3]),
+                          (aeronaves[1], aeronaves[2]), (aeronaves[1], aeronaves[3])}
+
+# Test para los niveles de alerta en un solo barrido
+def test_alertas_por_niveles():
+    import random
+    random.seed(43)
+    aeronaves = generar_aeronaves(500)
+    niveles = alertas_por_niveles(aeronaves, {"aviso": 8.0, "precaucion": 4.0, "alerta": 2.0})
+    radios = {"alerta": (0, 2.0), "precaucion": (2.0, 4.0), "aviso": (4.0, 8.0)}
+    for nombre, (minimo, maximo) in radios.items():
+        esperados = {(i, j) for i in range(len(aeronaves)) for j in range(i + 1, len(aeronaves))
+                     if minimo < distancia(aeronaves[i], aeronaves[j]) <= maximo}
+        assert set(zip(niveles[nombre].i, niveles[nombre].j)) == esperados
+
+# Test para las consultas por búsqueda binaria sobre distancias ordenadas
+def test_distancias_ordenadas():
+    import random
+    random.seed(47)
+    aeronaves = generar_aeronaves(400)
+    ordenadas = DistanciasOrdenadas(aeronaves, 10.0)
+    for umbral in (0.5, 3.0, 10.0):
+        esperado = encontrar_conflictos(aeronaves, umbral, motor="rejilla")
+        assert ordenadas.contar(umbral) == len(esperado)
+        hasta = ordenadas.hasta(umbral)
+        assert set(zip(hasta.i, hasta.j)) == set(zip(esperado.i, esperado.j))
+        assert list(hasta.d) == sorted(hasta.d)
+    assert [len(c) for c in ordenadas.niveles([3.0, 10.0]).values()] == [ordenadas.contar(3.0), len(ordenadas) - ordenadas.contar(3.0)]
+    try:
+        ordenadas.contar(11.0)
+        assert False, "Se esperaba ValueError"
+    except ValueError:
+        pass
+
+# Test para los motores de barrido y fuerza bruta contra la rejilla
+def test_barrido_y_fuerza_bruta():
+    import random
+    random.seed(83)
+    casos = [generar_aeronaves(700),
+             [Aeronave(50.0, float(i % 23)) for i in range(200)],
+             [Aeronave(1.0, 1.0) for _ in range(30)] + [Aeronave(1.5, 1.0)]]
+    for aeronaves in casos:
+        for umbral in (0.5, 2.0, 7.0):
+            rejilla = encontrar_conflictos(aeronaves, umbral, motor="rejilla")
+            for motor in ("barrido", "fuerza_bruta"):
+                otro = encontrar_conflictos(aeronaves, umbral, motor=motor)
+                assert list(zip(otro.i, otro.j, otro.d)) == list(zip(rejilla.i, rejilla.j, rejilla.d)), motor
+
+# Test para el planificador: elige un motor exacto e informa su elección
+def test_planificador():
+    import random
+    random.seed(89)
+    dispersas = generar_aeronaves(3000)
+    plan = planificar(dispersas, 0.5)
+    assert plan.motor in ("barrido", "rejilla") and plan.muestra < 3000
+    assert plan.motor == min(plan.costos, key=plan.costos.get)
+    # Todas a menos del umbral: conviene la fuerza bruta
+    assert planificar(generar_aeronaves(300), 200.0).motor == "fuerza_bruta"
+    assert planificar(generar_aeronaves(10), 1.0).motor == "fuerza_bruta"
+
+    conjunto = encontrar_conflictos(dispersas, 0.5)
+    assert conjunto.plan is not None and conjunto.plan.motor != "divide_y_vencer"
+    esperado = encontrar_conflictos(dispersas, 0.5, motor="rejilla")
+    assert list(zip(conjunto.i, conjunto.j)) == list(zip(esperado.i, esperado.j))
+    # El plan es determinista: la muestra no depende del estado de random
+    random.seed(1)
+    assert planificar(dispersas, 0.5).motor == plan.motor
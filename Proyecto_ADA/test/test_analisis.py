@@ -0,0 +1,40 @@
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from Project import Aeronave, encontrar_conflictos, generar_aeronaves
+from analisis import AnalisisEnSegundoPlano
+
+
+def recoger_todo(analisis):
+    analisis.esperar()
+    analisis.recoger()
+    return analisis.conjunto
+
+# Test para el análisis en segundo plano: mismos pares que el motor exhaustivo
+def test_analisis_completo():
+    random.seed(29)
+    aeronaves = generar_aeronaves(2000)
+    analisis = AnalisisEnSegundoPlano(aeronaves, 3.0).iniciar()
+    conjunto = recoger_todo(analisis)
+    esperados = encontrar_conflictos(aeronaves, 3.0, motor="rejilla")
+    assert sorted(map(sorted, zip(conjunto.i, conjunto.j))) == sorted(map(sorted, zip(esperados.i, esperados.j)))
+    assert analisis.finalizado and analisis.progreso == 1.0 and not analisis.cancelado
+
+# Test para la cancelación del análisis en segundo plano
+def test_analisis_cancelado():
+    aeronaves = [Aeronave(0.001 * i, 0.0) for i in range(5000)]
+    analisis = AnalisisEnSegundoPlano(aeronaves, 100.0)
+    analisis.cancelar()
+    conjunto = recoger_todo(analisis.iniciar())
+    assert analisis.cancelado and analisis.finalizado
+    assert len(conjunto) == 0 and analisis.progreso < 1.0
+
+# Test para la separación mínima cuando no hay pares
+def test_analisis_sin_pares():
+    aeronaves = [Aeronave(0, 0), Aeronave(10, 0), Aeronave(0, 30)]
+    analisis = AnalisisEnSegundoPlano(aeronaves, 1.0).iniciar()
+    assert len(recoger_todo(analisis)) == 0
+    assert analisis.separacion_minima == 10.0
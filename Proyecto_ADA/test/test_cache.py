@@ -0,0 +1,62 @@
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from Project import Aeronave, encontrar_conflictos, generar_aeronaves
+from cache import CacheConflictos, huella
+
+
+def pares(conjunto):
+    return set(zip(conjunto.i, conjunto.j))
+
+# Test para la reutilización de un umbral mayor
+def test_cache_umbral_menor():
+    random.seed(53)
+    aeronaves = generar_aeronaves(800)
+    cache = CacheConflictos()
+    for umbral in (6.0, 2.0, 4.0, 6.0):
+        assert pares(cache.conflictos(aeronaves, umbral)) == pares(encontrar_conflictos(aeronaves, umbral, "rejilla"))
+    estadisticas = cache.estadisticas()
+    assert estadisticas["fallos"] == 1 and estadisticas["aciertos"] == 3
+
+    # Un umbral mayor recalcula y reemplaza la entrada
+    assert pares(cache.conflictos(aeronaves, 8.0)) == pares(encontrar_conflictos(aeronaves, 8.0, "rejilla"))
+    assert len(cache) == 1 and cache.estadisticas()["fallos"] == 2
+
+# Test para la huella: copias iguales comparten entrada, cambios no
+def test_cache_huella():
+    random.seed(59)
+    aeronaves = generar_aeronaves(200)
+    copia = [Aeronave(a.x, a.y) for a in aeronaves]
+    assert huella(aeronaves) == huella(copia)
+    cache = CacheConflictos()
+    cache.conflictos(aeronaves, 5.0)
+    assert cache.buscar(copia, 5.0).aeronaves is copia
+    copia[0].x += 1e-9
+    assert cache.buscar(copia, 5.0) is None
+
+# Test para la expulsión LRU por límite de memoria
+def test_cache_limite_memoria():
+    random.seed(61)
+    instantaneas = [generar_aeronaves(300) for _ in range(3)]
+    tamanos = [24 * len(encontrar_conflictos(a, 10.0, "rejilla")) for a in instantaneas]
+    cache = CacheConflictos(limite_bytes=tamanos[0] + tamanos[1])
+    cache.conflictos(instantaneas[0], 10.0)
+    cache.conflictos(instantaneas[1], 10.0)
+    cache.conflictos(instantaneas[0], 5.0)   # la primera pasa a ser la más reciente
+    cache.conflictos(instantaneas[2], 10.0)  # expulsa la segunda
+    assert cache.bytes_usados <= cache.limite_bytes
+    assert cache.buscar(instantaneas[1], 10.0) is None
+    assert cache.buscar(instantaneas[0], 10.0) is not None
+    assert cache.estadisticas()["expulsiones"] >= 1
+
+# Test para motores no exactos
+def test_cache_motor_no_exacto():
+    cache = CacheConflictos()
+    try:
+        cache.conflictos([Aeronave(0, 0), Aeronave(1, 1)], 2.0, motor="divide_y_vencer")
+        assert False, "Se esperaba ValueError"
+    except ValueError:
+        pass
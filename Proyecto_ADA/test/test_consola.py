@@ -0,0 +1,57 @@
+import sys
+import os
+import json
+import struct
+import subprocess
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from consola import escribir_instantanea_binaria, leer_binario, main
+
+DIRECTORIO = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+PUNTOS = [(0.0, 0.0), (3.0, 4.0), (50.0, 50.0), (50.5, 50.0)]
+
+
+def escribir_csv(ruta):
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        archivo.write("id,x,y\n")
+        for i, (x, y) in enumerate(PUNTOS):
+            archivo.write(f"{10 + i},{x},{y}\n")
+
+# Test: importar el núcleo y la consola no carga tkinter
+def test_sin_tkinter():
+    codigo = "import sys, consola, Project; print('tkinter' in sys.modules)"
+    salida = subprocess.run([sys.executable, "-c", codigo], cwd=DIRECTORIO,
+                            capture_output=True, text=True, check=True).stdout
+    assert salida.strip() == "False"
+
+# Test: lectura del binario mapeado en memoria
+def test_leer_binario(tmp_path):
+    ruta = str(tmp_path / "captura.bin")
+    escribir_instantanea_binaria(ruta, [p[0] for p in PUNTOS], [p[1] for p in PUNTOS], [7, 8, 9, 10])
+    instantanea = leer_binario(ruta)
+    assert list(instantanea.ids) == [7, 8, 9, 10] and instantanea.ys[1] == 4.0
+    instantanea.cerrar()
+
+# Test: CSV de entrada y salida JSON con el par más cercano
+def test_csv_a_json(tmp_path, capsys):
+    ruta = str(tmp_path / "captura.csv")
+    escribir_csv(ruta)
+    main([ruta, "--umbral", "5", "--formato", "json", "--motor", "rejilla"])
+    documento = json.loads(capsys.readouterr().out)
+    assert documento["total_pares"] == 2
+    assert documento["par_mas_cercano"] == [12, 13, 0.5]
+
+# Test: directorio completo con salida binaria
+def test_directorio_a_binario(tmp_path):
+    escribir_csv(str(tmp_path / "a.csv"))
+    escribir_instantanea_binaria(str(tmp_path / "b.bin"), [p[0] for p in PUNTOS], [p[1] for p in PUNTOS])
+    destino = tmp_path / "salida"
+    main([str(tmp_path), "--umbral", "5", "--formato", "binario", "--salida", str(destino)])
+    for nombre, ids in (("a.pares.bin", {(10, 11), (12, 13)}), ("b.pares.bin", {(0, 1), (2, 3)})):
+        datos = (destino / nombre).read_bytes()
+        magia, k, minimo = struct.unpack_from("<8sqq", datos)
+        cuerpo = struct.unpack_from(f"<{k}q{k}q{k}d", datos, 24)
+        assert magia == b"ADAPAR01" and k == 2
+        assert set(zip(cuerpo[:k], cuerpo[k:2 * k])) == ids
+        assert cuerpo[2 * k + minimo] == 0.5
@@ -0,0 +1,65 @@
+import sys
+import os
+import random
+from array import array
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from Project import Aeronave, encontrar_conflictos, generar_aeronaves
+from consola import CABECERA_PARES, MAGIA_PARES, escribir_instantanea_binaria
+from externo import conflictos_externos, leer_memoria
+
+
+def leer_pares_binarios(ruta):
+    with open(ruta, "rb") as archivo:
+        datos = archivo.read()
+    magia, k, minimo = CABECERA_PARES.unpack_from(datos)
+    assert magia == MAGIA_PARES
+    cuerpo = datos[CABECERA_PARES.size:]
+    ids_a = array("q", cuerpo[:8 * k])
+    ids_b = array("q", cuerpo[8 * k:16 * k])
+    ds = array("d", cuerpo[16 * k:])
+    return list(zip(ids_a, ids_b, ds)), minimo
+
+# Test para el modo externo con varias corridas: mismos pares que en memoria
+def test_externo_igual_en_memoria(tmp_path):
+    random.seed(97)
+    aeronaves = generar_aeronaves(5000) + [Aeronave(42.0, float(k % 7)) for k in range(200)]
+    entrada = str(tmp_path / "flota.bin")
+    escribir_instantanea_binaria(entrada, [a.x for a in aeronaves], [a.y for a in aeronaves])
+    salida = str(tmp_path / "pares.bin")
+
+    resumen = conflictos_externos(entrada, 1.5, salida, memoria=64 << 10, temporal=str(tmp_path))
+    esperado = encontrar_conflictos(aeronaves, 1.5)
+    pares, minimo = leer_pares_binarios(salida)
+    assert resumen["corridas"] > 1 and resumen["n"] == len(aeronaves)
+    # Con 64 KiB caben pocas corridas abiertas: hace falta una pasada intermedia
+    assert resumen["pasadas"] > 1
+    assert sorted(pares) == sorted(zip(esperado.i, esperado.j, esperado.d))
+    assert resumen["pares"] == len(pares) and pares[minimo][2] == min(esperado.d)
+    assert resumen["par_mas_cercano"][2] == min(esperado.d)
+    # Las corridas se borran al terminar
+    assert sorted(os.listdir(tmp_path)) == ["flota.bin", "pares.bin"]
+
+# Test para la entrada y la salida en CSV
+def test_externo_csv(tmp_path):
+    entrada = tmp_path / "flota.csv"
+    entrada.write_text("id,x,y\n10,0,0\n11,3,4\n12,6,8\n13,50,50\n", encoding="utf-8")
+    salida = tmp_path / "pares.csv"
+    resumen = conflictos_externos(str(entrada), 5.0, str(salida), formato="csv")
+    lineas = salida.read_text(encoding="utf-8").splitlines()
+    assert lineas[0] == "id_a,id_b,distancia"
+    assert sorted(lineas[1:]) == ["10,11,5.0", "11,12,5.0"]
+    assert resumen["pares"] == 2
+
+# Test para el presupuesto: la ventana no cabe, se informa y no queda salida parcial
+def test_externo_presupuesto(tmp_path):
+    entrada = str(tmp_path / "densa.bin")
+    escribir_instantanea_binaria(entrada, [0.001 * k for k in range(3000)], [0.0] * 3000)
+    for formato, nombre in (("binario", "pares.bin"), ("csv", "pares.csv")):
+        with pytest.raises(MemoryError):
+            conflictos_externos(entrada, 100.0, str(tmp_path / nombre), formato=formato, memoria=64 << 10)
+        assert not (tmp_path / nombre).exists()
+    assert leer_memoria("512M") == 512 << 20 and leer_memoria("2g") == 2 << 30 and leer_memoria("1000") == 1000
@@ -0,0 +1,55 @@
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+np = pytest.importorskip("numpy")
+
+from Project import Aeronave, generar_aeronaves, distancia, encontrar_pares_cercanos, encontrar_par_mas_cercano
+from flota import Flota, distancias
+
+
+def pares_fuerza_bruta(aeronaves, umbral):
+    return {(i, j) for i in range(len(aeronaves)) for j in range(i + 1, len(aeronaves))
+            if distancia(aeronaves[i], aeronaves[j]) <= umbral}
+
+# Test para la conversión entre listas de Aeronave y Flota
+def test_conversion_flota():
+    aeronaves = [Aeronave(1.5, 2.5), Aeronave(3.0, 4.0)]
+    flota = Flota.desde_aeronaves(aeronaves)
+    assert flota.xs.dtype == np.float64 and flota.ids.tolist() == [0, 1]
+    vuelta = flota.a_aeronaves()
+    assert [(a.x, a.y) for a in vuelta] == [(1.5, 2.5), (3.0, 4.0)]
+
+# Test para la generación columnar
+def test_generar_flota():
+    flota = generar_aeronaves(1000, columnar=True)
+    assert isinstance(flota, Flota) and len(flota) == 1000
+    assert flota.xs.min() >= 0 and flota.xs.max() <= 100
+
+# Test para el Divide y Vencer vectorizado contra fuerza bruta
+@pytest.mark.parametrize("umbral", [0.5, 3.0, 25.0])
+def test_pares_flota_coincide_con_fuerza_bruta(umbral):
+    rng = np.random.default_rng(3)
+    flota = Flota(rng.uniform(0, 100, 500), rng.uniform(0, 100, 500))
+    pares = encontrar_pares_cercanos(flota, umbral)
+    assert pares.shape[1] == 2
+    assert {tuple(p) for p in pares.tolist()} == pares_fuerza_bruta(flota.a_aeronaves(), umbral)
+    assert len(pares) == len({tuple(p) for p in pares.tolist()}), "Pares duplicados"
+
+# Test para puntos con la misma x y duplicados
+def test_pares_flota_degenerados():
+    xs = np.full(200, 10.0)
+    ys = np.repeat(np.arange(100, dtype=np.float64), 2)
+    flota = Flota(xs, ys)
+    pares = encontrar_pares_cercanos(flota, 1.0)
+    assert {tuple(p) for p in pares.tolist()} == pares_fuerza_bruta(flota.a_aeronaves(), 1.0)
+
+# Test para el par más cercano en modo columnar
+def test_par_mas_cercano_flota():
+    flota = Flota([0.0, 3.0, 6.0, 6.5], [0.0, 4.0, 8.0, 8.0])
+    pares = encontrar_pares_cercanos(flota, 5.0)
+    assert encontrar_par_mas_cercano(pares, flota=flota) == (2, 3)
+    assert distancias(flota, pares).min() == pytest.approx(0.5)
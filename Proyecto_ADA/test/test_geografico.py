@@ -0,0 +1,64 @@
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from Project import Aeronave
+from geografico import (conflictos_geograficos, distancia_geodesica, generar_aeronaves_geograficas,
+                        haversine, np, proyectar)
+
+
+def fuerza_bruta(aeronaves, umbral_km):
+    return {(i, j) for i in range(len(aeronaves)) for j in range(i + 1, len(aeronaves))
+            if distancia_geodesica(aeronaves[i], aeronaves[j]) <= umbral_km}
+
+# Test para la distancia de círculo máximo
+def test_haversine():
+    # Un grado de meridiano ≈ 111.2 km; Madrid-Barcelona ≈ 505 km
+    assert abs(haversine(0, 0, 1, 0) - 111.195) < 0.01
+    assert abs(haversine(40.4168, -3.7038, 41.3874, 2.1686) - 505) < 2
+
+# Test para la proyección: nunca alarga distancias
+def test_proyeccion_conservadora():
+    random.seed(73)
+    aeronaves = generar_aeronaves_geograficas(300, 20, 70, -40, 40)
+    xs, ys = proyectar([a.y for a in aeronaves], [a.x for a in aeronaves], 50.0)
+    for i in range(0, 300, 7):
+        for j in range(i + 1, 300, 11):
+            plana = ((xs[i] - xs[j]) ** 2 + (ys[i] - ys[j]) ** 2) ** 0.5
+            assert plana <= distancia_geodesica(aeronaves[i], aeronaves[j]) + 1e-9
+
+# Test para el modo geográfico con la rejilla (sin NumPy) y con el motor por defecto
+def test_conflictos_geograficos_coinciden():
+    random.seed(79)
+    aeronaves = generar_aeronaves_geograficas(1500)
+    esperados = fuerza_bruta(aeronaves, 40.0)
+    motores = ["rejilla"] + (["flota"] if np is not None else [])
+    for motor in motores:
+        conflictos = conflictos_geograficos(aeronaves, 40.0, motor)
+        assert set(zip(conflictos.i, conflictos.j)) == esperados
+        assert all(abs(d - distancia_geodesica(aeronaves[i], aeronaves[j])) < 1e-6
+                   for i, j, d in zip(conflictos.i, conflictos.j, conflictos.d))
+
+# Test para una región que cruza el antimeridiano en latitudes altas
+def test_conflictos_geograficos_antimeridiano():
+    random.seed(83)
+    aeronaves = generar_aeronaves_geograficas(800, 60, 80, 170, 190)
+    aeronaves.append(Aeronave(179.99, 70.0))
+    aeronaves.append(Aeronave(-179.99, 70.0))
+    conflictos = conflictos_geograficos(aeronaves, 60.0, "rejilla")
+    assert set(zip(conflictos.i, conflictos.j)) == fuerza_bruta(aeronaves, 60.0)
+    assert (len(aeronaves) - 2, len(aeronaves) - 1) in set(zip(conflictos.i, conflictos.j))
+
+# Test para los casquetes polares: la proyección local no sirve y no se pierden pares
+def test_conflictos_geograficos_polos():
+    random.seed(89)
+    cerca = [Aeronave(0.0, 89.9), Aeronave(90.0, 89.9)]  # ≈ 15.7 km sobre el polo
+    aeronaves = (cerca + generar_aeronaves_geograficas(500, 86, 90, -180, 180)
+                 + generar_aeronaves_geograficas(200, -90, -87, -180, 180))
+    motores = ["rejilla"] + (["flota"] if np is not None else [])
+    for motor in motores:
+        assert len(conflictos_geograficos(cerca, 50.0, motor)) == 1
+        conflictos = conflictos_geograficos(aeronaves, 50.0, motor)
+        assert set(zip(conflictos.i, conflictos.j)) == fuerza_bruta(aeronaves, 50.0)
@@ -0,0 +1,64 @@
+import sys
+import os
+import math
+import random
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from Project import Aeronave, generar_aeronaves
+from grupos import UnionBusqueda, encontrar_grupos
+
+
+def componentes_fuerza_bruta(aeronaves, umbral):
+    n = len(aeronaves)
+    grupos = UnionBusqueda(n)
+    mas_cercano = {}
+    for i in range(n):
+        for j in range(i + 1, n):
+            d = math.hypot(aeronaves[i].x - aeronaves[j].x, aeronaves[i].y - aeronaves[j].y)
+            if d <= umbral:
+                grupos.unir(i, j)
+    por_raiz = {}
+    for p in range(n):
+        por_raiz.setdefault(grupos.buscar(p), []).append(p)
+    componentes = [m for m in por_raiz.values() if len(m) > 1]
+    for miembros in componentes:
+        mas_cercano[miembros[0]] = min(
+            math.hypot(aeronaves[a].x - aeronaves[b].x, aeronaves[a].y - aeronaves[b].y)
+            for k, a in enumerate(miembros) for b in miembros[k + 1:])
+    return sorted(tuple(m) for m in componentes), mas_cercano
+
+# Test para los grupos de ambos modos contra la fuerza bruta
+def test_grupos_fuerza_bruta():
+    random.seed(73)
+    aeronaves = generar_aeronaves(600)
+    componentes, mas_cercano = componentes_fuerza_bruta(aeronaves, 12.0)
+    for modo in ("rejilla", "pares"):
+        grupos = encontrar_grupos(aeronaves, 12.0, modo)
+        assert sorted(tuple(g.miembros) for g in grupos) == componentes
+        assert [len(g) for g in grupos] == sorted((len(g) for g in grupos), reverse=True)
+        for g in grupos:
+            assert math.isclose(g.par_mas_cercano[2], mas_cercano[g.miembros[0]])
+            x_min, y_min, x_max, y_max = g.caja
+            assert all(x_min <= aeronaves[p].x <= x_max and y_min <= aeronaves[p].y <= y_max
+                       for p in g.miembros)
+
+# Test para un foco denso: un solo grupo y la cuenta de pares
+def test_grupos_foco_denso():
+    random.seed(79)
+    foco = [Aeronave(random.uniform(0, 2), random.uniform(0, 2)) for _ in range(300)]
+    aislada = [Aeronave(500, 500)]
+    grupos = encontrar_grupos(foco + aislada, 5.0)
+    assert len(grupos) == 1 and len(grupos[0]) == 300
+    assert grupos[0].pares is None
+    grupos = encontrar_grupos(foco + aislada, 5.0, modo="pares")
+    assert grupos[0].pares == 300 * 299 // 2
+
+# Test para cadenas: a distancia exacta del umbral, y sin conflictos
+def test_grupos_cadena():
+    cadena = [Aeronave(3.0 * k, 0.0) for k in range(10)]
+    for modo in ("rejilla", "pares"):
+        grupos = encontrar_grupos(cadena, 3.0, modo)
+        assert len(grupos) == 1 and len(grupos[0]) == 10
+        assert grupos[0].caja == (0.0, 0.0, 27.0, 0.0)
+        assert encontrar_grupos(cadena, 2.9, modo) == []
@@ -0,0 +1,40 @@
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from Project import Aeronave, generar_aeronaves, distancia
+from indice import IndiceKD
+
+# Test para consultas por radio contra fuerza bruta
+def test_consultar_radio():
+    random.seed(23)
+    aeronaves = generar_aeronaves(1000)
+    indice = IndiceKD(aeronaves)
+    for objetivo in aeronaves[:25]:
+        esperados = sorted(distancia(objetivo, a) for a in aeronaves
+                           if a is not objetivo and distancia(objetivo, a) <= 7.5)
+        resultado = indice.consultar_radio(objetivo, 7.5)
+        assert [d for _, d in resultado] == esperados
+        assert all(a is not objetivo for a, _ in resultado)
+
+# Test para vecinos más cercanos desde coordenadas sueltas
+def test_vecinos_mas_cercanos():
+    random.seed(29)
+    aeronaves = generar_aeronaves(800)
+    indice = IndiceKD(aeronaves)
+    for _ in range(25):
+        punto = (random.uniform(-10, 110), random.uniform(-10, 110))
+        consulta = Aeronave(*punto)
+        esperados = sorted(distancia(consulta, a) for a in aeronaves)[:5]
+        assert [d for _, d in indice.vecinos_mas_cercanos(punto, 5)] == esperados
+
+# Test para consultas en lote y reconstrucción
+def test_lote_y_reconstruir():
+    indice = IndiceKD([Aeronave(0, 0), Aeronave(1, 0)])
+    assert [len(r) for r in indice.consultar_radio_lote([(0, 0), (50, 50)], 2.0)] == [2, 0]
+    indice.reconstruir([Aeronave(50, 50)])
+    assert len(indice) == 1
+    (a, d), = indice.vecinos_lote([(50, 51)], 3)[0]
+    assert (a.x, a.y, d) == (50, 50, 1.0)
@@ -0,0 +1,61 @@
+import sys
+import os
+import io
+import random
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from Project import Aeronave, encontrar_conflictos, generar_aeronaves
+from instrumentacion import EstadisticasDeteccion
+
+# Test para la instrumentación: mismos pares y en el mismo orden que el motor normal
+def test_instrumentado_mismo_resultado():
+    random.seed(67)
+    aeronaves = generar_aeronaves(2000)
+    normal = encontrar_conflictos(aeronaves, 3.0, "divide_y_vencer")
+    estadisticas = EstadisticasDeteccion()
+    instrumentado = encontrar_conflictos(aeronaves, 3.0, "divide_y_vencer", estadisticas=estadisticas)
+    assert list(normal.i) == list(instrumentado.i) and list(normal.j) == list(instrumentado.j)
+    assert estadisticas.pares == len(normal) and estadisticas.n == 2000
+
+# Test para los contadores en un caso pequeño conocido
+def test_instrumentado_contadores():
+    aeronaves = [Aeronave(x, 0) for x in range(8)]
+    estadisticas = EstadisticasDeteccion()
+    encontrar_conflictos(aeronaves, 1.5, "divide_y_vencer", estadisticas=estadisticas)
+    # 8 puntos: 4 casos base de 2 (una comparación cada uno)
+    assert estadisticas.casos_base == 4
+    assert estadisticas.profundidad_maxima == 3
+    assert sorted(estadisticas.bandas_por_nivel) == [0, 1]
+    assert estadisticas.evaluaciones_distancia >= 4
+    assert set(estadisticas.tiempos) == {"ordenar", "dividir", "casos_base", "combinar", "total"}
+
+# Test para el corte de los 7 vecinos en un grupo denso
+def test_instrumentado_cortes_siete():
+    aeronaves = [Aeronave(50 + 0.001 * (i % 2), 0.001 * i) for i in range(40)]
+    estadisticas = EstadisticasDeteccion()
+    encontrar_conflictos(aeronaves, 1.0, "divide_y_vencer", estadisticas=estadisticas)
+    assert estadisticas.cortes_siete > 0
+
+# Test para los volcados JSON y de pilas plegadas
+def test_instrumentado_volcados():
+    random.seed(71)
+    estadisticas = EstadisticasDeteccion()
+    encontrar_conflictos(generar_aeronaves(500), 5.0, "divide_y_vencer", estadisticas=estadisticas)
+    pilas = io.StringIO()
+    estadisticas.volcar_pilas(pilas)
+    lineas = pilas.getvalue().splitlines()
+    assert lineas and all(l.startswith("conflictos_dividir_y_vencer;") for l in lineas)
+    assert all(int(l.rsplit(" ", 1)[1]) >= 1 for l in lineas)
+    documento = io.StringIO()
+    estadisticas.volcar_json(documento)
+    assert '"cortes_siete"' in documento.getvalue()
+
+# Test para motores sin instrumentación (también "auto", que no elegiría el Divide y Vencer)
+def test_instrumentado_otro_motor():
+    for motor in ("rejilla", "auto"):
+        try:
+            encontrar_conflictos([Aeronave(0, 0)], 1.0, motor, estadisticas=EstadisticasDeteccion())
+            assert False, "Se esperaba ValueError"
+        except ValueError:
+            pass
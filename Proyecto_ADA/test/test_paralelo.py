@@ -0,0 +1,49 @@
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from Project import Aeronave, generar_aeronaves, encontrar_conflictos, encontrar_pares_cercanos
+import paralelo
+from paralelo import conflictos_paralelo
+
+
+def terna(conjunto):
+    return list(zip(conjunto.i, conjunto.j, conjunto.d))
+
+# Test: el modo paralelo reproduce exactamente al motor secuencial
+def test_paralelo_igual_a_secuencial():
+    random.seed(5)
+    aeronaves = generar_aeronaves(2000)
+    secuencial = encontrar_conflictos(aeronaves, 4.0, "divide_y_vencer")
+    paralelo = conflictos_paralelo(aeronaves, 4.0, procesos=2, niveles=3)
+    assert terna(paralelo) == terna(secuencial)
+
+# Test: misma x en muchas aeronaves (desempate por índice)
+def test_paralelo_misma_x():
+    aeronaves = [Aeronave(50.0, float(i % 37)) for i in range(300)]
+    secuencial = encontrar_conflictos(aeronaves, 2.0, "divide_y_vencer")
+    paralelo = conflictos_paralelo(aeronaves, 2.0, procesos=2, niveles=2)
+    assert terna(paralelo) == terna(secuencial)
+
+# Test: selección del modo a través de encontrar_pares_cercanos
+def test_paralelo_por_motor():
+    aeronaves = generar_aeronaves(200)
+    assert encontrar_pares_cercanos(aeronaves, 10.0, motor="paralelo") == encontrar_pares_cercanos(aeronaves, 10.0, motor="divide_y_vencer")
+
+# Test para el cierre del bloque compartido en el trabajador: libera las vistas y lo cierra
+def test_paralelo_cierre_trabajador():
+    from array import array
+    from multiprocessing.shared_memory import SharedMemory
+    bloque = SharedMemory(create=True, size=4 * 8)
+    try:
+        bloque.buf[:] = bytes(array("d", [1.0, 2.0, 3.0, 4.0]))
+        paralelo._iniciar_trabajador(bloque.name, 2)
+        assert list(paralelo._ys) == [3.0, 4.0]
+        paralelo._cerrar_trabajador()
+        assert paralelo._memoria is None and paralelo._xs is None
+        paralelo._cerrar_trabajador()  # idempotente
+    finally:
+        bloque.close()
+        bloque.unlink()
@@ -0,0 +1,45 @@
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from Project import Aeronave, encontrar_conflictos, generar_aeronaves
+from prediccion import conflictos_previstos, conflicto_previsto, maximo_acercamiento
+
+# Test para el punto de máximo acercamiento de dos aeronaves de frente
+def test_maximo_acercamiento():
+    a = Aeronave(0, 0, 1, 0)
+    b = Aeronave(10, 1, -1, 0)
+    entrada, t_cpa, d_cpa = conflicto_previsto(a, b, 2.0, 60)
+    assert t_cpa == 5.0 and d_cpa == 1.0
+    assert abs(entrada - (5 - 3 ** 0.5 / 2)) < 1e-9
+    # Fuera del horizonte no hay conflicto; el CPA se limita al horizonte
+    assert conflicto_previsto(a, b, 2.0, 4.0) is None
+    assert maximo_acercamiento(10, 1, -2, 0, 1.0) == (1.0, 8.06225774829855)
+
+# Test para la fase gruesa: mismos pares que la fuerza bruta
+def test_previstos_coincide_con_fuerza_bruta():
+    random.seed(31)
+    aeronaves = generar_aeronaves(600, velocidad_maxima=0.4)
+    for horizonte in (0.0, 15.0, 90.0):
+        previstos = conflictos_previstos(aeronaves, 3.0, horizonte)
+        esperados = {(i, j) for i in range(len(aeronaves)) for j in range(i + 1, len(aeronaves))
+                     if conflicto_previsto(aeronaves[i], aeronaves[j], 3.0, horizonte)}
+        assert len(previstos) == len(esperados) and set(zip(previstos.i, previstos.j)) == esperados
+
+# Test para horizonte cero: equivale a la detección estática
+def test_previstos_horizonte_cero():
+    random.seed(37)
+    aeronaves = generar_aeronaves(500, velocidad_maxima=1.0)
+    estaticos = encontrar_conflictos(aeronaves, 4.0, motor="rejilla")
+    previstos = conflictos_previstos(aeronaves, 4.0, 0.0)
+    assert set(zip(previstos.i, previstos.j)) == set(zip(estaticos.i, estaticos.j))
+    assert all(entrada == 0.0 for entrada in previstos.entrada)
+
+# Test para el orden por urgencia
+def test_previstos_por_urgencia():
+    aeronaves = [Aeronave(0, 0, 1, 0), Aeronave(20, 0, -1, 0),
+                 Aeronave(0, 50, 0, 0), Aeronave(5, 50, -1, 0)]
+    urgentes = conflictos_previstos(aeronaves, 1.0, 30).por_urgencia()
+    assert [(a, b) for a, b, *_ in urgentes] == [(aeronaves[2], aeronaves[3]), (aeronaves[0], aeronaves[1])]
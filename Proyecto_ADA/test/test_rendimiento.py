@@ -0,0 +1,29 @@
+import sys
+import os
+import json
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from rendimiento import ejecutar_banco, main, DISTRIBUCIONES
+
+# Test: los motores exactos coinciden con el oráculo en todas las distribuciones
+def test_banco_motores_exactos():
+    registros = ejecutar_banco([10, 300], DISTRIBUCIONES, [1.0, 8.0], ["iterativo", "rejilla"])
+    assert len(registros) == 2 * len(DISTRIBUCIONES) * 2 * 2
+    assert all(r["correcto"] for r in registros), [r for r in registros if not r["correcto"]]
+    assert all(r["oraculo"] == "fuerza_bruta" and r["pico_bytes"] > 0 for r in registros)
+
+# Test: el banco detecta pares repetidos o perdidos del Divide y Vencer clásico
+def test_banco_detecta_discrepancias():
+    registros = ejecutar_banco([300], ["misma_x"], [5.0], ["divide_y_vencer"], medir_memoria=False)
+    assert not registros[0]["correcto"]
+    assert registros[0]["duplicados"] + registros[0]["faltantes"] > 0
+
+# Test: salida JSON Lines desde la línea de comandos
+def test_banco_salida_json(tmp_path):
+    salida = tmp_path / "banco.jsonl"
+    codigo = main(["--tamanos", "50", "--distribuciones", "uniforme", "--umbrales", "5",
+                   "--motores", "rejilla", "--salida", str(salida)])
+    registros = [json.loads(linea) for linea in salida.read_text().splitlines()]
+    assert codigo == 0 and len(registros) == 1
+    assert {"segundos", "pico_bytes", "pares", "faltantes"} <= set(registros[0])
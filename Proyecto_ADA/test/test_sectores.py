@@ -0,0 +1,131 @@
+import sys
+import os
+import random
+import socket
+import threading
+import time
+from multiprocessing.connection import Client, Listener
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from Project import Aeronave, conflictos_por_rejilla, encontrar_conflictos, generar_aeronaves
+import sectores
+from sectores import conflictos_por_sectores, nodo, teselar
+
+
+def triples(conjunto):
+    return list(zip(conjunto.i, conjunto.j, conjunto.d))
+
+def puerto_libre():
+    with Listener(("127.0.0.1", 0)) as libre:
+        return libre.address
+
+def conectar(funcion, direccion, clave):
+    for _ in range(100):
+        try:
+            return funcion(direccion, clave)
+        except ConnectionRefusedError:
+            time.sleep(0.05)
+
+# Test para el resultado idéntico al de un solo nodo
+def test_sectores_identico():
+    random.seed(61)
+    aeronaves = generar_aeronaves(3000)
+    informe = {}
+    resultado = conflictos_por_sectores(aeronaves, 6.0, trabajadores=3, informe=informe)
+    assert triples(resultado) == triples(conflictos_por_rejilla(aeronaves, 6.0))
+    assert informe["teselas"] >= 3 and informe["puntos_halo"] > 0
+    assert sum(informe["teselas_por_nodo"]) == informe["teselas"]
+    assert triples(encontrar_conflictos(aeronaves, 6.0, "sectores")) == triples(resultado)
+
+# Test para un foco denso: se parte en varias teselas y el resultado no cambia
+def test_sectores_foco_denso():
+    random.seed(67)
+    aeronaves = generar_aeronaves(500) + [Aeronave(random.gauss(300, 3), random.gauss(300, 3)) for _ in range(1500)]
+    xs = [a.x for a in aeronaves]
+    ys = [a.y for a in aeronaves]
+    teselas = teselar(xs, ys, 8)
+    assert sorted(p for t in teselas for p in t.nucleo) == list(range(len(aeronaves)))
+    assert max(len(t.nucleo) for t in teselas) <= 2 * len(aeronaves) / 8
+    resultado = conflictos_por_sectores(aeronaves, 2.0, trabajadores=2)
+    assert triples(resultado) == triples(conflictos_por_rejilla(aeronaves, 2.0))
+
+# Test para puntos repetidos y casos pequeños
+def test_sectores_degenerados():
+    repetidos = [Aeronave(5.0, 5.0) for _ in range(40)]
+    assert triples(conflictos_por_sectores(repetidos, 1.0, trabajadores=2)) == \
+        triples(conflictos_por_rejilla(repetidos, 1.0))
+    assert len(conflictos_por_sectores([Aeronave(0, 0)], 1.0)) == 0
+
+# Test para un nodo externo conectado por socket
+def test_sectores_nodo_externo():
+    random.seed(71)
+    aeronaves = generar_aeronaves(1000)
+    # Reservar un puerto libre y dejar que el nodo lo busque
+    direccion, clave = puerto_libre(), b"prueba"
+    hilo = threading.Thread(target=conectar, args=(nodo, direccion, clave), daemon=True)
+    hilo.start()
+    resultado = conflictos_por_sectores(aeronaves, 5.0, trabajadores=1, direccion=direccion,
+                                        clave=clave, lanzar_locales=False)
+    hilo.join(5)
+    assert triples(resultado) == triples(conflictos_por_rejilla(aeronaves, 5.0))
+
+# Test para un nodo que se cae a mitad de una tesela: la tesela se reasigna
+def test_sectores_nodo_caido():
+    random.seed(73)
+    aeronaves = generar_aeronaves(1000)
+    direccion, clave = puerto_libre(), b"prueba"
+
+    def nodo_que_cae(direccion, clave):
+        with Client(direccion, authkey=clave) as conexion:
+            conexion.recv()  # recibe una tesela y se desconecta sin responder
+
+    hilos = [threading.Thread(target=conectar, args=(f, direccion, clave), daemon=True)
+             for f in (nodo_que_cae, nodo)]
+    for hilo in hilos:
+        hilo.start()
+    informe = {}
+    resultado = conflictos_por_sectores(aeronaves, 5.0, trabajadores=2, direccion=direccion,
+                                        clave=clave, lanzar_locales=False, informe=informe)
+    assert triples(resultado) == triples(conflictos_por_rejilla(aeronaves, 5.0))
+    assert informe["nodos_caidos"] == 1 and sum(informe["teselas_por_nodo"]) == informe["teselas"]
+
+# Test para la espera de nodos: sin ninguno conectado se informa en lugar de colgarse
+def test_sectores_sin_nodos():
+    with pytest.raises(TimeoutError):
+        conflictos_por_sectores(generar_aeronaves(50), 5.0, trabajadores=1, direccion=puerto_libre(),
+                                lanzar_locales=False, espera=0.2)
+
+# Test para un cliente mudo: se conecta y no responde al desafío, y la espera igual se cumple
+def test_sectores_cliente_mudo():
+    direccion = puerto_libre()
+    abiertos = []
+
+    def conectar_mudo():
+        for _ in range(100):
+            try:
+                abiertos.append(socket.create_connection(direccion))
+                return
+            except ConnectionRefusedError:
+                time.sleep(0.05)
+
+    threading.Thread(target=conectar_mudo, daemon=True).start()
+    inicio = time.monotonic()
+    try:
+        with pytest.raises(TimeoutError):
+            conflictos_por_sectores(generar_aeronaves(50), 5.0, trabajadores=1, direccion=direccion,
+                                    lanzar_locales=False, espera=0.5)
+    finally:
+        for zocalo in abiertos:
+            zocalo.close()
+    assert abiertos and time.monotonic() - inicio < 5
+
+# Test para nodos locales que no se llegaron a aceptar: el cierre no queda esperándolos
+def test_sectores_locales_sin_aceptar(monkeypatch):
+    monkeypatch.setattr(sectores, "ESPERA_CIERRE", 0.5)
+    inicio = time.monotonic()
+    with pytest.raises(TimeoutError):
+        conflictos_por_sectores(generar_aeronaves(50), 5.0, trabajadores=2, espera=1e-9)
+    assert time.monotonic() - inicio < 5
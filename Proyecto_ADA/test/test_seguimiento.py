@@ -0,0 +1,43 @@
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from seguimiento import RastreadorConflictos
+
+
+def conflictos_fuerza_bruta(posiciones, umbral):
+    ids = sorted(posiciones)
+    return {(a, b) for n, a in enumerate(ids) for b in ids[n + 1:]
+            if ((posiciones[a][0] - posiciones[b][0]) ** 2 + (posiciones[a][1] - posiciones[b][1]) ** 2) ** 0.5 <= umbral}
+
+# Test para el seguimiento incremental a lo largo de varios ticks
+def test_rastreador_ticks():
+    random.seed(11)
+    umbral = 5.0
+    posiciones = {i: (random.uniform(0, 100), random.uniform(0, 100)) for i in range(300)}
+    rastreador = RastreadorConflictos(umbral, posiciones)
+    vigentes = conflictos_fuerza_bruta(posiciones, umbral)
+    assert set(rastreador.conflictos()) == vigentes
+
+    for _ in range(20):
+        cambios = {}
+        for i in random.sample(range(300), 30):
+            x, y = posiciones[i]
+            cambios[i] = (x + random.uniform(-3, 3), y + random.uniform(-3, 3))
+        posiciones.update(cambios)
+        nuevos, resueltos = rastreador.actualizar(cambios)
+
+        esperados = conflictos_fuerza_bruta(posiciones, umbral)
+        assert set(nuevos) == esperados - vigentes, "Conflictos nuevos incorrectos"
+        assert set(resueltos) == vigentes - esperados, "Conflictos resueltos incorrectos"
+        vigentes = esperados
+    assert set(rastreador.conflictos()) == vigentes
+
+# Test para retirar aeronaves del seguimiento
+def test_rastreador_retirar():
+    rastreador = RastreadorConflictos(2.0, {1: (0.0, 0.0), 2: (1.0, 0.0), 3: (50.0, 50.0)})
+    assert rastreador.conflictos() == [(1, 2)]
+    assert rastreador.retirar([2]) == [(1, 2)]
+    assert rastreador.conflictos() == [] and len(rastreador) == 2
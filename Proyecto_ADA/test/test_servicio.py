@@ -0,0 +1,118 @@
+import sys
+import os
+import asyncio
+import json
+from array import array
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from consola import CABECERA_INSTANTANEA, MAGIA_INSTANTANEA, Instantanea
+import pytest
+
+from servicio import ServicioRadar, marco_desde_json, percentil
+
+
+def marco(numero, xs, ys):
+    return {"marco": numero, "instantanea": Instantanea(array("q", range(len(xs))),
+                                                        array("d", xs), array("d", ys))}
+
+# Test para el percentil por rango más cercano
+def test_percentil():
+    valores = list(range(1, 101))
+    assert percentil(valores, 50) == 50
+    assert percentil(valores, 99) == 99
+    assert percentil([], 50) is None
+
+# Test para la fusión de marcos cuando la detección se atrasa
+def test_marcos_fusionados():
+    async def escenario():
+        servicio = ServicioRadar(1.0, "rejilla")
+        cola = servicio.suscribir()
+        # Tres marcos llegan antes de que el bucle de detección corra
+        servicio.recibir_marco(marco(1, [0, 0.5], [0, 0]))
+        servicio.recibir_marco(marco(2, [0, 5], [0, 0]))
+        servicio.recibir_marco(marco(3, [0, 0.25, 10], [0, 0, 0]))
+        tarea = asyncio.create_task(servicio.detectar_continuamente())
+        documento = json.loads(await asyncio.wait_for(cola.get(), 5))
+        tarea.cancel()
+        return servicio, documento
+
+    servicio, documento = asyncio.run(escenario())
+    assert documento["marco"] == 3 and documento["pares"] == [[0, 1, 0.25]]
+    assert servicio.fusionados == 2 and servicio.procesados == 1
+    assert servicio.estadisticas()["p50_ms"] is not None
+
+# Test para los marcos inconsistentes: se rechazan y un error al procesar no detiene la detección
+def test_marco_con_error():
+    for linea in (b'{"x": [0, 1], "y": [0, 0], "id": [7]}', b'{"x": 5, "y": [0]}', b'[1, 2]',
+                  b'{"x": [0, "a"], "y": [0, 0]}', b'{"x": [0], "y": [0], "id": [18446744073709551616]}'):
+        with pytest.raises(ValueError):
+            marco_desde_json(linea)
+
+    async def escenario():
+        servicio = ServicioRadar(1.0, "rejilla")
+        cola = servicio.suscribir()
+        tarea = asyncio.create_task(servicio.detectar_continuamente())
+        # Columnas desparejas que llegan sin pasar por la validación
+        servicio.recibir_marco({"marco": 1, "instantanea": Instantanea(array("q", [0]), array("d", [0, 0.5]),
+                                                                       array("d", [0, 0]))})
+        while not servicio.errores:
+            await asyncio.sleep(0.01)
+        servicio.recibir_marco(marco(2, [0, 0.5], [0, 0]))
+        documento = json.loads(await asyncio.wait_for(cola.get(), 5))
+        tarea.cancel()
+        return servicio, documento
+
+    servicio, documento = asyncio.run(escenario())
+    assert documento["marco"] == 2 and servicio.errores == 1 and servicio.procesados == 1
+
+# Test para el servicio completo por TCP: marcos JSON y binarios
+def test_servicio_tcp():
+    async def escenario():
+        servicio = ServicioRadar(1.0, "rejilla")
+        puerto, puerto_suscriptores = await servicio.iniciar("127.0.0.1", 0, 0)
+        lector, suscriptor = await asyncio.open_connection("127.0.0.1", puerto_suscriptores)
+        while not servicio.estadisticas()["suscriptores"]:
+            await asyncio.sleep(0.01)
+
+        _, fuente = await asyncio.open_connection("127.0.0.1", puerto)
+        fuente.write(json.dumps({"marco": 7, "x": [0, 0.5, 50], "y": [0, 0, 0],
+                                 "id": [10, 11, 12]}).encode() + b"\n")
+        await fuente.drain()
+        primero = json.loads(await asyncio.wait_for(lector.readline(), 5))
+
+        fuente.write(CABECERA_INSTANTANEA.pack(MAGIA_INSTANTANEA, 2))
+        fuente.write(bytes(array("d", [1, 1.5])) + bytes(array("d", [2, 2])) + bytes(array("q", [5, 6])))
+        await fuente.drain()
+        segundo = json.loads(await asyncio.wait_for(lector.readline(), 5))
+
+        fuente.close()
+        suscriptor.close()
+        await servicio.detener()
+        return primero, segundo
+
+    primero, segundo = asyncio.run(escenario())
+    assert primero["marco"] == 7 and primero["pares"] == [[10, 11, 0.5]]
+    assert segundo["pares"] == [[5, 6, 0.5]] and segundo["n"] == 2
+    assert "latencia_ms" in primero
+
+# Test para el simulador con el generador vectorizado
+def test_simulador_distribucion():
+    pytest.importorskip("numpy")
+    from servicio import simular
+
+    async def escenario():
+        servicio = ServicioRadar(1.0, "rejilla")
+        puerto, puerto_suscriptores = await servicio.iniciar("127.0.0.1", 0, 0)
+        lector, suscriptor = await asyncio.open_connection("127.0.0.1", puerto_suscriptores)
+        while not servicio.estadisticas()["suscriptores"]:
+            await asyncio.sleep(0.01)
+        await simular("127.0.0.1", puerto, 300, hz=100, marcos=2, binario=True, semilla=1,
+                      distribucion="corredores")
+        documento = json.loads(await asyncio.wait_for(lector.readline(), 5))
+        suscriptor.close()
+        await servicio.detener()
+        return documento
+
+    documento = asyncio.run(escenario())
+    assert documento["n"] == 300 and documento["pares"]
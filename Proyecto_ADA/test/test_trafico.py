@@ -0,0 +1,66 @@
+import sys
+import os
+import random
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+np = pytest.importorskip("numpy")
+
+from Project import generar_aeronaves
+from consola import leer_binario
+from trafico import DISTRIBUCIONES, escribir_binario, generar_marcos, generar_posiciones, generar_trafico
+
+
+# Test para la reproducibilidad con semilla y los límites de cada distribución
+def test_trafico_semilla_y_limites():
+    limites = (-50.0, 10.0, 150.0, 40.0)
+    for distribucion in DISTRIBUCIONES:
+        a = generar_trafico(5000, distribucion, semilla=3, limites=limites)
+        b = generar_trafico(5000, distribucion, semilla=3, limites=limites)
+        assert len(a) == 5000
+        assert np.array_equal(a.xs, b.xs) and np.array_equal(a.ys, b.ys)
+        assert a.xs.min() >= -50 and a.xs.max() <= 150 and a.ys.min() >= 10 and a.ys.max() <= 40
+    assert not np.array_equal(generar_trafico(100, semilla=1).xs, generar_trafico(100, semilla=2).xs)
+    with pytest.raises(ValueError):
+        generar_trafico(10, "espiral")
+
+# Test para las distribuciones degeneradas
+def test_trafico_degenerados():
+    xs, ys, _ = generar_posiciones(1000, "misma_x", semilla=5)
+    assert len(np.unique(xs)) <= 3
+    xs, ys, _ = generar_posiciones(1000, "duplicados", semilla=5)
+    assert len(set(zip(xs.tolist(), ys.tolist()))) <= 250
+
+# Test para el binario ADAFLT01 escrito desde las columnas
+def test_trafico_binario(tmp_path):
+    flota = generar_trafico(2000, "aeropuertos", semilla=11)
+    ruta = str(tmp_path / "flota.bin")
+    escribir_binario(ruta, flota)
+    instantanea = leer_binario(ruta)
+    try:
+        assert list(instantanea.xs) == flota.xs.tolist()
+        assert list(instantanea.ys) == flota.ys.tolist()
+        assert list(instantanea.ids) == list(range(2000))
+    finally:
+        instantanea.cerrar()
+
+# Test para los marcos con movimiento: avanzan a lo largo de la aerovía y no salen de los límites
+def test_trafico_marcos():
+    marcos = list(generar_marcos(500, "corredores", semilla=13, velocidad_maxima=2.0, marcos=40))
+    assert len(marcos) == 40
+    primero, segundo = marcos[0], marcos[1]
+    avance = np.hypot(segundo.xs - primero.xs, segundo.ys - primero.ys)
+    assert avance.max() <= 2.0 + 1e-9 and avance.mean() > 0.5
+    for flota in marcos:
+        assert flota.xs.min() >= 0 and flota.xs.max() <= 100 and flota.ys.min() >= 0 and flota.ys.max() <= 100
+    repetidos = list(generar_marcos(500, "corredores", semilla=13, velocidad_maxima=2.0, marcos=40))
+    assert np.array_equal(repetidos[-1].xs, marcos[-1].xs)
+
+# Test para generar_aeronaves con semilla
+def test_generar_aeronaves_semilla():
+    a = generar_aeronaves(50, semilla=17)
+    random.seed(0)
+    b = generar_aeronaves(50, semilla=17)
+    assert [(p.x, p.y) for p in a] == [(p.x, p.y) for p in b]
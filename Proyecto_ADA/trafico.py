@@ -0,0 +1,177 @@
+"""
+Generador de tráfico sintético vectorizado y reproducible (requiere NumPy)
+Produce posiciones directamente en columnas (Flota) o en el binario ADAFLT01,
+con distribuciones de aeropuertos, aerovías, uniforme y casos degenerados, y
+secuencias de marcos con movimiento para reproducir o hacer pruebas de carga
+
+Uso:
+    python trafico.py instantanea flota.bin --aeronaves 1000000 --distribucion aeropuertos --semilla 7
+    python trafico.py marcos capturas/ --aeronaves 100000 --marcos 60 --velocidad 0.5
+"""
+
+from __future__ import annotations
+import argparse
+import os
+import sys
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+
+from consola import CABECERA_INSTANTANEA, MAGIA_INSTANTANEA
+from flota import Flota
+
+
+DISTRIBUCIONES = ("uniforme", "aeropuertos", "corredores", "misma_x", "colineal", "duplicados")
+LIMITES = (0.0, 0.0, 100.0, 100.0)  # (x_min, y_min, x_max, y_max)
+
+
+# DISTRIBUCIONES
+
+def generar_posiciones(n: int, distribucion: str = "uniforme", semilla: Optional[int] = None,
+                       limites: Tuple[float, float, float, float] = LIMITES,
+                       rng: Optional[np.random.Generator] = None):
+    """(xs, ys, rumbos) de n aeronaves dentro de limites
+
+    rumbos es el ángulo en radianes del sentido de avance natural de cada
+    aeronave (a lo largo de su aerovía en "corredores"; al azar en el
+    resto). La misma semilla produce siempre las mismas posiciones.
+    """
+    if n < 0:
+        raise ValueError("n debe ser >= 0")
+    x0, y0, x1, y1 = limites
+    if not (x1 > x0 and y1 > y0):
+        raise ValueError("Límites vacíos: se espera x_min < x_max e y_min < y_max")
+    rng = rng if rng is not None else np.random.default_rng(semilla)
+    ancho, alto = x1 - x0, y1 - y0
+    rumbos = None
+
+    if distribucion == "uniforme":
+        xs = rng.uniform(x0, x1, n)
+        ys = rng.uniform(y0, y1, n)
+    elif distribucion == "aeropuertos":
+        # Focos gaussianos; el tamaño de los aeropuertos sigue una ley de Zipf
+        focos = n // 5000 + 3
+        cx = rng.uniform(x0 + 0.1 * ancho, x1 - 0.1 * ancho, focos)
+        cy = rng.uniform(y0 + 0.1 * alto, y1 - 0.1 * alto, focos)
+        pesos = 1.0 / np.arange(1, focos + 1)
+        foco = rng.choice(focos, n, p=pesos / pesos.sum())
+        xs = cx[foco] + rng.normal(0.0, 0.02 * ancho, n)
+        ys = cy[foco] + rng.normal(0.0, 0.02 * alto, n)
+    elif distribucion == "corredores":
+        # Aerovías rectas entre dos puntos del área, con poca dispersión lateral
+        vias = n // 20000 + 4
+        ax, bx = rng.uniform(x0, x1, vias), rng.uniform(x0, x1, vias)
+        ay, by = rng.uniform(y0, y1, vias), rng.uniform(y0, y1, vias)
+        via = rng.integers(0, vias, n)
+        t = rng.random(n)
+        angulos = np.arctan2(by - ay, bx - ax)
+        lateral = rng.normal(0.0, 0.005 * min(ancho, alto), n)
+        xs = ax[via] + t * (bx - ax)[via] - lateral * np.sin(angulos[via])
+        ys = ay[via] + t * (by - ay)[via] + lateral * np.cos(angulos[via])
+        # Mitad en cada sentido de la aerovía
+        rumbos = angulos[via] + np.pi * rng.integers(0, 2, n)
+    elif distribucion == "misma_x":
+        columnas = rng.uniform(x0, x1, 3)
+        xs = columnas[rng.integers(0, 3, n)]
+        ys = rng.uniform(y0, y1, n)
+    elif distribucion == "colineal":
+        t = rng.random(n)
+        xs = x0 + t * ancho
+        ys = y0 + (0.1 + 0.5 * t) * alto
+    elif distribucion == "duplicados":
+        base = max(1, n // 4)
+        bx, by = rng.uniform(x0, x1, base), rng.uniform(y0, y1, base)
+        elegidos = rng.integers(0, base, n)
+        xs, ys = bx[elegidos], by[elegidos]
+    else:
+        raise ValueError(f"Distribución desconocida: {distribucion}")
+
+    if rumbos is None:
+        rumbos = rng.uniform(-np.pi, np.pi, n)
+    return np.clip(xs, x0, x1), np.clip(ys, y0, y1), rumbos
+
+
+def generar_trafico(n: int, distribucion: str = "uniforme", semilla: Optional[int] = None,
+                    limites: Tuple[float, float, float, float] = LIMITES) -> Flota:
+    """n aeronaves en columnas según la distribución indicada"""
+    xs, ys, _ = generar_posiciones(n, distribucion, semilla, limites)
+    return Flota(xs, ys)
+
+
+def escribir_binario(ruta: str, flota: Flota):
+    """Escribe la flota en el formato ADAFLT01 sin pasar por objetos Python"""
+    with open(ruta, "wb") as archivo:
+        archivo.write(CABECERA_INSTANTANEA.pack(MAGIA_INSTANTANEA, len(flota)))
+        for columna in (flota.xs, flota.ys, flota.ids):
+            columna.astype(columna.dtype.newbyteorder("<"), copy=False).tofile(archivo)
+
+
+# MARCOS CON MOVIMIENTO
+
+def generar_marcos(n: int, distribucion: str = "uniforme", semilla: Optional[int] = None,
+                   limites: Tuple[float, float, float, float] = LIMITES,
+                   velocidad_maxima: float = 0.5, dt: float = 1.0,
+                   marcos: Optional[int] = None) -> Iterator[Flota]:
+    """Genera marcos sucesivos (Flota) con las aeronaves en movimiento rectilíneo
+
+    Cada aeronave avanza según su rumbo a una velocidad en
+    [0.5, 1] × velocidad_maxima y rebota en los límites. Con marcos=None la
+    secuencia no termina. Los ids se mantienen entre marcos.
+    """
+    rng = np.random.default_rng(semilla)
+    xs, ys, rumbos = generar_posiciones(n, distribucion, limites=limites, rng=rng)
+    rapidez = rng.uniform(0.5, 1.0, n) * velocidad_maxima
+    vxs, vys = rapidez * np.cos(rumbos), rapidez * np.sin(rumbos)
+    x0, y0, x1, y1 = limites
+    ids = np.arange(n, dtype=np.int64)
+
+    numero = 0
+    while marcos is None or numero < marcos:
+        yield Flota(xs.copy(), ys.copy(), ids)
+        numero += 1
+        xs += vxs * dt
+        ys += vys * dt
+        for pos, vel, bajo, alto in ((xs, vxs, x0, x1), (ys, vys, y0, y1)):
+            # Rebote: reflejar la posición y el sentido de la velocidad
+            fuera = (pos < bajo) | (pos > alto)
+            np.copyto(pos, 2 * bajo - pos, where=pos < bajo)
+            np.copyto(pos, 2 * alto - pos, where=pos > alto)
+            np.clip(pos, bajo, alto, out=pos)
+            vel[fuera] = -vel[fuera]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generador de tráfico sintético")
+    subparsers = parser.add_subparsers(dest="orden", required=True)
+    comunes = argparse.ArgumentParser(add_help=False)
+    comunes.add_argument("--aeronaves", type=int, default=100000)
+    comunes.add_argument("--distribucion", choices=DISTRIBUCIONES, default="uniforme")
+    comunes.add_argument("--semilla", type=int, default=0)
+    comunes.add_argument("--limites", type=float, nargs=4, default=list(LIMITES),
+                         metavar=("X_MIN", "Y_MIN", "X_MAX", "Y_MAX"))
+
+    p_inst = subparsers.add_parser("instantanea", parents=[comunes], help="Una instantánea ADAFLT01")
+    p_inst.add_argument("salida")
+
+    p_marcos = subparsers.add_parser("marcos", parents=[comunes], help="Secuencia de instantáneas en un directorio")
+    p_marcos.add_argument("salida")
+    p_marcos.add_argument("--marcos", type=int, default=10)
+    p_marcos.add_argument("--velocidad", type=float, default=0.5)
+    p_marcos.add_argument("--dt", type=float, default=1.0)
+
+    args = parser.parse_args(argv)
+    limites = tuple(args.limites)
+    if args.orden == "instantanea":
+        escribir_binario(args.salida, generar_trafico(args.aeronaves, args.distribucion, args.semilla, limites))
+        return 0
+
+    os.makedirs(args.salida, exist_ok=True)
+    secuencia = generar_marcos(args.aeronaves, args.distribucion, args.semilla, limites,
+                               args.velocidad, args.dt, args.marcos)
+    for numero, flota in enumerate(secuencia):
+        escribir_binario(os.path.join(args.salida, f"marco_{numero:06d}.bin"), flota)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())